@@ -10,6 +10,8 @@ import secrets
 import hashlib
 import base64
 from passlib.context import CryptContext
+from backend.db import get_journal, get_user_repository
+from backend.db.wal import JournaledDict
 
 # to get a string like this run:
 # openssl rand -hex 32
@@ -35,17 +37,18 @@ OAUTH_CLIENTS = {
 
 # Store for authorization codes and PKCE challenges
 # In a real app, this would be in a database with TTL
-auth_code_store = (
-    {}
+auth_code_store = JournaledDict(
+    get_journal("auth_codes")
 )  # format: {"code": {"client_id": "...", "user": "...", "code_challenge": "...", "redirect_uri": "...", "scope": "...", "expires_at": datetime}}
 
 # Store for refresh tokens
 # In a real app, this would be in a database
-refresh_token_store = (
-    {}
+refresh_token_store = JournaledDict(
+    get_journal("refresh_tokens")
 )  # format: {"token": {"user_id": "...", "client_id": "...", "scope": "..."}}
 
 
+# Fixtures used to seed the storage backend (see `backend.db`)
 db_in_memory = {
     "users": [
         {
@@ -101,10 +104,10 @@ class OAuth2Error(BaseModel):
 
 
 def get_user(username: str):
-    for user_dict in db_in_memory["users"]:
-        if user_dict["username"] == username:
-            return UserInDB(**user_dict)
-    return None
+    user_dict = get_user_repository().get_by_username(username)
+    if user_dict is None:
+        return None
+    return UserInDB(**user_dict)
 
 
 async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
@@ -0,0 +1,146 @@
+import atexit
+import os
+import threading
+from functools import partial, wraps
+from typing import Callable, Optional, TypeVar
+from backend.db.base import (
+    BlogPostIdCompletion,
+    BlogPostRepository,
+    BlogPostSearch,
+    UserRepository,
+)
+from backend.db.blobs import MmapArena
+from backend.db.columns import ContentArena
+from backend.db.memory import InMemoryBlogPostRepository, InMemoryUserRepository
+from backend.db.sqlite import (
+    ConnectionPool,
+    SQLiteBlogPostIdIndex,
+    SQLiteBlogPostRepository,
+    SQLiteSearchIndex,
+    SQLiteUserRepository,
+    migrate,
+)
+from backend.db.prefix import BlogPostIdIndex
+from backend.db.search import SearchIndex
+from backend.db.wal import Journal
+
+# Storage backend settings.
+# `memory` keeps everything in process and is lost on restart.
+# `sqlite` persists to DB_PATH and can be shared by several worker processes.
+DB_BACKEND = os.environ.get("DB_BACKEND", "memory")
+DB_PATH = os.environ.get("DB_PATH", "backend.sqlite3")
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+
+# Durability of the `memory` backend and the OAuth token stores.
+# When DB_WAL_DIR is set, writes are logged there and replayed on startup.
+# The log is fsynced every DB_WAL_FSYNC_INTERVAL seconds (0 fsyncs every write)
+# and compacted into a snapshot every DB_SNAPSHOT_EVERY records.
+DB_WAL_DIR = os.environ.get("DB_WAL_DIR")
+DB_WAL_FSYNC_INTERVAL = float(os.environ.get("DB_WAL_FSYNC_INTERVAL", "0.05"))
+DB_SNAPSHOT_EVERY = int(os.environ.get("DB_SNAPSHOT_EVERY", "100000"))
+
+# When set, the `memory` backend keeps post bodies in memory-mapped files in
+# this directory instead of on the Python heap.
+DB_CONTENT_DIR = os.environ.get("DB_CONTENT_DIR")
+
+
+T = TypeVar("T")
+
+# Reentrant, since building one store may need another, e.g. the search index
+# needs the repository
+_singletons_lock = threading.RLock()
+
+
+def singleton(factory: Callable[[], T]) -> Callable[[], T]:
+    """Build the value on first use and return the same one afterwards.
+
+    Unlike `lru_cache`, racing first calls build it once: tools run on
+    several threads, and two repositories would e.g. replay and append to
+    the same journal.
+    """
+    instance = []
+
+    @wraps(factory)
+    def get() -> T:
+        if not instance:
+            with _singletons_lock:
+                if not instance:
+                    instance.append(factory())
+        return instance[0]
+
+    return get
+
+
+def get_fixtures() -> dict:
+    # Imported lazily because `backend.auth.utils` depends on this package
+    from backend.auth.utils import db_in_memory
+
+    return db_in_memory
+
+
+def get_journal(name: str) -> Optional[Journal]:
+    if not DB_WAL_DIR:
+        return None
+
+    journal = Journal(DB_WAL_DIR, name, DB_WAL_FSYNC_INTERVAL, DB_SNAPSHOT_EVERY)
+    atexit.register(journal.close)
+    return journal
+
+
+@singleton
+def get_connection_pool() -> ConnectionPool:
+    pool = ConnectionPool(DB_PATH, size=DB_POOL_SIZE)
+    migrate(pool, fixtures=get_fixtures())
+    return pool
+
+
+@singleton
+def get_blog_post_repository() -> BlogPostRepository:
+    if DB_BACKEND == "sqlite":
+        return SQLiteBlogPostRepository(get_connection_pool())
+    elif DB_BACKEND == "memory":
+        arena_factory = ContentArena
+        if DB_CONTENT_DIR:
+            arena_factory = partial(MmapArena, DB_CONTENT_DIR)
+
+        return InMemoryBlogPostRepository(
+            get_fixtures()["blog_posts"],
+            journal=get_journal("blog_posts"),
+            arena_factory=arena_factory,
+        )
+    else:
+        raise ValueError(f"Unknown DB_BACKEND: {DB_BACKEND}")
+
+
+@singleton
+def get_user_repository() -> UserRepository:
+    if DB_BACKEND == "sqlite":
+        return SQLiteUserRepository(get_connection_pool())
+    elif DB_BACKEND == "memory":
+        return InMemoryUserRepository(get_fixtures()["users"])
+    else:
+        raise ValueError(f"Unknown DB_BACKEND: {DB_BACKEND}")
+
+
+# The `sqlite` indexes live in the database, so that several worker processes
+# see each other's writes
+
+
+@singleton
+def get_search_index() -> BlogPostSearch:
+    if DB_BACKEND == "sqlite":
+        return SQLiteSearchIndex(get_connection_pool())
+    elif DB_BACKEND == "memory":
+        return SearchIndex(get_blog_post_repository())
+    else:
+        raise ValueError(f"Unknown DB_BACKEND: {DB_BACKEND}")
+
+
+@singleton
+def get_blog_post_id_index() -> BlogPostIdCompletion:
+    if DB_BACKEND == "sqlite":
+        return SQLiteBlogPostIdIndex(get_connection_pool())
+    elif DB_BACKEND == "memory":
+        return BlogPostIdIndex(get_blog_post_repository())
+    else:
+        raise ValueError(f"Unknown DB_BACKEND: {DB_BACKEND}")
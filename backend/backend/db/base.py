@@ -0,0 +1,136 @@
+import base64
+import json
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import List, Literal, Optional, Tuple, TypeAlias
+from pydantic import BaseModel
+
+OrderBy: TypeAlias = Literal["id", "created_at", "updated_at"]
+ORDER_BY = ("id", "created_at", "updated_at")
+
+# Position of a post in one of the sorted indexes: `(id,)` when ordering by id,
+# otherwise `(timestamp, id)` so that posts sharing a timestamp keep a total order.
+SortKey: TypeAlias = Tuple[int, ...]
+
+
+def now_timestamp() -> int:
+    """Current time in microseconds since the epoch, the unit timestamps are stored in"""
+    return time.time_ns() // 1000
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def from_timestamp(timestamp: int) -> datetime:
+    return EPOCH + timedelta(microseconds=timestamp)
+
+
+def to_timestamp(value: datetime) -> int:
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+class BlogPost(BaseModel):
+    id: int
+    user_id: int  # FK to users
+    content: str
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_row(cls, row) -> "BlogPost":
+        return cls(
+            id=row["id"],
+            user_id=row["user_id"],
+            content=row["content"],
+            created_at=from_timestamp(row["created_at"]),
+            updated_at=from_timestamp(row["updated_at"]),
+        )
+
+
+def sort_key(blog_post: BlogPost, order_by: OrderBy) -> SortKey:
+    if order_by == "id":
+        return (blog_post.id,)
+    return (to_timestamp(getattr(blog_post, order_by)), blog_post.id)
+
+
+def encode_cursor(order_by: OrderBy, descending: bool, key: SortKey) -> str:
+    payload = json.dumps([order_by, descending, list(key)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[OrderBy, bool, SortKey]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        order_by, descending, key = json.loads(base64.urlsafe_b64decode(padded))
+        valid = (
+            order_by in ORDER_BY
+            and isinstance(descending, bool)
+            and len(key) == (1 if order_by == "id" else 2)
+            and all(isinstance(value, int) and abs(value) < 2**63 for value in key)
+        )
+    except (ValueError, TypeError):
+        valid = False
+
+    if not valid:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+    return order_by, descending, tuple(key)
+
+
+class BlogPostRepository(ABC):
+    @abstractmethod
+    def get(self, user_id: int, blog_post_id: int) -> Optional[BlogPost]: ...
+
+    @abstractmethod
+    def create(self, user_id: int, content: str) -> BlogPost: ...
+
+    @abstractmethod
+    def update(
+        self, user_id: int, blog_post_id: int, content: str
+    ) -> Optional[BlogPost]: ...
+
+    @abstractmethod
+    def list_by_user(self, user_id: int) -> List[BlogPost]: ...
+
+    @abstractmethod
+    def list_page(
+        self,
+        user_id: int,
+        order_by: OrderBy = "id",
+        descending: bool = False,
+        after: Optional[SortKey] = None,
+        limit: int = 20,
+    ) -> List[BlogPost]:
+        """Return up to `limit` posts that sort strictly after the `after` key.
+
+        Implementations seek into a sorted index, so the cost of a page doesn't
+        depend on how many pages came before it."""
+
+
+class UserRepository(ABC):
+    @abstractmethod
+    def get_by_username(self, username: str) -> Optional[dict]: ...
+
+
+class BlogPostSearch(ABC):
+    @abstractmethod
+    def index_post(self, blog_post: BlogPost):
+        """Called after a post was created or updated through this process"""
+
+    @abstractmethod
+    def search(
+        self, user_id: int, query: str, limit: int = 10
+    ) -> List[Tuple[int, float]]:
+        """Return the ids and scores of the user's best matching posts, best first"""
+
+
+class BlogPostIdCompletion(ABC):
+    @abstractmethod
+    def index_post(self, blog_post: BlogPost):
+        """Called after a post was created through this process"""
+
+    @abstractmethod
+    def complete(self, user_id: int, prefix: str, limit: int) -> Tuple[List[str], int]:
+        """Return the first `limit` of the user's post ids starting with `prefix`
+        in string order, and how many there are"""
@@ -0,0 +1,57 @@
+import mmap
+import os
+import tempfile
+
+INITIAL_CAPACITY = 1 << 20
+
+
+class MmapArena:
+    """A `ContentArena` whose bytes live in a memory-mapped file instead of the heap.
+
+    Only offsets stay in Python memory. The bodies sit in file-backed pages,
+    which the kernel can write back and evict under memory pressure instead
+    of keeping them resident like heap memory. The file is unlinked as soon
+    as it is created, so nothing is left behind when the process exits; the
+    journal, not this file, is what makes the data durable.
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix="content-", suffix=".blob", dir=directory)
+        os.unlink(path)
+        self._fd = fd
+        self._capacity = INITIAL_CAPACITY
+        os.ftruncate(fd, self._capacity)
+        self._map = mmap.mmap(fd, self._capacity)
+        self._length = 0
+        self.dead_bytes = 0
+
+    def __len__(self):
+        return self._length
+
+    def _grow(self, size: int):
+        self._capacity = max(size, self._capacity * 2)
+        os.ftruncate(self._fd, self._capacity)
+        # A new mapping instead of `mmap.resize`, which fails while a reader
+        # still holds a view; the old mapping is unmapped once it's unused
+        self._map = mmap.mmap(self._fd, self._capacity)
+
+    def append(self, data: bytes) -> int:
+        offset = self._length
+        end = offset + len(data)
+        if end > self._capacity:
+            self._grow(end)
+        self._map[offset:end] = data
+        self._length = end
+        return offset
+
+    def read(self, offset: int, length: int) -> str:
+        # Decodes straight out of the mapping without an intermediate bytes copy
+        return str(memoryview(self._map)[offset : offset + length], "utf-8")
+
+    def read_bytes(self, offset: int, length: int) -> bytes:
+        return self._map[offset : offset + length]
+
+    def close(self):
+        self._map.close()
+        os.close(self._fd)
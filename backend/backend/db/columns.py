@@ -0,0 +1,242 @@
+import threading
+from array import array
+from typing import Callable
+
+# Compact the content arena once garbage exceeds both of these
+COMPACT_MIN_DEAD_BYTES = 1 << 20
+COMPACT_DEAD_RATIO = 0.5
+
+# Columns grow this many slots at a time, so the grow lock is rarely taken
+GROW_SLOTS = 4096
+
+
+class ContentArena:
+    """Append-only UTF-8 buffer holding every post body back to back.
+
+    Bodies are addressed by `(offset, length)`. Replacing a body appends the
+    new bytes and leaves the old ones as garbage until the owning table
+    compacts the arena.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.dead_bytes = 0
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def append(self, data: bytes) -> int:
+        offset = len(self._buffer)
+        self._buffer += data
+        return offset
+
+    def read(self, offset: int, length: int) -> str:
+        return self._buffer[offset : offset + length].decode()
+
+    def read_bytes(self, offset: int, length: int) -> bytes:
+        return bytes(self._buffer[offset : offset + length])
+
+    def close(self):
+        pass
+
+
+class BlogPostTable:
+    """Column-oriented storage for blog posts, addressed by post id.
+
+    Each column is a typed `array` and the slot for a post is `id - 1`, so a
+    post costs a few machine words plus its UTF-8 body instead of a dict with
+    boxed values. Slots of ids that were never assigned have `user_id == 0`.
+
+    Bodies are spread over `stripes` arenas by `user_id % stripes`. A caller
+    that holds the matching `StripedLock` stripe may write any slot owned by
+    that user; writers on other stripes touch other slots and other arenas.
+    Arenas are made by `arena_factory`, e.g. `MmapArena` to keep bodies off
+    the heap.
+    """
+
+    def __init__(
+        self, stripes: int = 1, arena_factory: Callable[[], ContentArena] = ContentArena
+    ):
+        self.arena_factory = arena_factory
+        self.user_ids = array("q")
+        self.created_at = array("q")
+        self.updated_at = array("q")
+        self.content_offsets = array("Q")
+        self.content_lengths = array("I")
+        self.arenas = [arena_factory() for _ in range(stripes)]
+        self._grow_lock = threading.Lock()
+        # Arenas replaced by `compact` while a snapshot still copies them
+        self._snapshots = 0
+        self._retired = []
+        self._retire_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.user_ids)
+
+    def __contains__(self, blog_post_id: int) -> bool:
+        return 0 < blog_post_id <= len(self.user_ids) and bool(
+            self.user_ids[blog_post_id - 1]
+        )
+
+    def arena_for(self, user_id: int) -> ContentArena:
+        return self.arenas[user_id % len(self.arenas)]
+
+    def _grow(self, size: int):
+        if size <= len(self.user_ids):
+            return
+
+        with self._grow_lock:
+            missing = size - len(self.user_ids)
+            if missing <= 0:
+                return
+            missing += GROW_SLOTS - size % GROW_SLOTS
+            # `user_ids` last: its length tells writers outside the lock that
+            # every column is long enough
+            for column in (
+                self.created_at,
+                self.updated_at,
+                self.content_offsets,
+                self.content_lengths,
+                self.user_ids,
+            ):
+                column.frombytes(bytes(missing * column.itemsize))
+
+    def insert(
+        self,
+        blog_post_id: int,
+        user_id: int,
+        content: str,
+        created_at: int,
+        updated_at: int,
+    ):
+        self._grow(blog_post_id)
+        slot = blog_post_id - 1
+        data = content.encode()
+        self.created_at[slot] = created_at
+        self.updated_at[slot] = updated_at
+        self.content_offsets[slot] = self.arena_for(user_id).append(data)
+        self.content_lengths[slot] = len(data)
+        # Written last: the slot only becomes visible once it is complete
+        self.user_ids[slot] = user_id
+
+    def user_id_of(self, blog_post_id: int) -> int:
+        if blog_post_id not in self:
+            return 0
+        return self.user_ids[blog_post_id - 1]
+
+    def content_of(self, blog_post_id: int) -> str:
+        slot = blog_post_id - 1
+        return self.arena_for(self.user_ids[slot]).read(
+            self.content_offsets[slot], self.content_lengths[slot]
+        )
+
+    def set_content(self, blog_post_id: int, content: str, updated_at: int):
+        slot = blog_post_id - 1
+        user_id = self.user_ids[slot]
+        arena = self.arena_for(user_id)
+        data = content.encode()
+        arena.dead_bytes += self.content_lengths[slot]
+        self.content_offsets[slot] = arena.append(data)
+        self.content_lengths[slot] = len(data)
+        self.updated_at[slot] = updated_at
+
+        if (
+            arena.dead_bytes > COMPACT_MIN_DEAD_BYTES
+            and arena.dead_bytes > len(arena) * COMPACT_DEAD_RATIO
+        ):
+            self.compact(user_id % len(self.arenas))
+
+    def compact(self, stripe: int):
+        """Rewrite one arena without the bodies that were replaced by updates"""
+        stripes = len(self.arenas)
+        old = self.arenas[stripe]
+        new = self.arena_factory()
+        for slot, user_id in enumerate(self.user_ids):
+            if user_id and user_id % stripes == stripe:
+                offset = self.content_offsets[slot]
+                length = self.content_lengths[slot]
+                self.content_offsets[slot] = new.append(old.read_bytes(offset, length))
+        self.arenas[stripe] = new
+        with self._retire_lock:
+            if self._snapshots:
+                self._retired.append(old)
+            else:
+                old.close()
+
+    def begin_snapshot(self) -> dict:
+        """Copy the columns and the length of each arena; callers hold every stripe lock.
+
+        The bodies are copied by `finish_snapshot` once the locks are
+        released. Arenas are append-only, so the bytes below those lengths
+        don't change, and an arena compacted meanwhile stays open until then.
+        """
+        with self._retire_lock:
+            self._snapshots += 1
+        return {
+            "user_ids": self.user_ids[:],
+            "created_at": self.created_at[:],
+            "updated_at": self.updated_at[:],
+            "content_offsets": self.content_offsets[:],
+            "content_lengths": self.content_lengths[:],
+            "arenas": [(arena, len(arena), arena.dead_bytes) for arena in self.arenas],
+        }
+
+    def finish_snapshot(self, state: dict) -> dict:
+        """Copy the bodies into a snapshot from `begin_snapshot`, without any lock"""
+        try:
+            state["arenas"] = [
+                (arena.read_bytes(0, length), dead_bytes)
+                for arena, length, dead_bytes in state["arenas"]
+            ]
+        finally:
+            with self._retire_lock:
+                self._snapshots -= 1
+                if not self._snapshots:
+                    for arena in self._retired:
+                        arena.close()
+                    self._retired.clear()
+        return state
+
+    @classmethod
+    def restore(
+        cls,
+        state: dict,
+        stripes: int,
+        arena_factory: Callable[[], ContentArena] = ContentArena,
+    ) -> "BlogPostTable":
+        table = cls(len(state["arenas"]), arena_factory)
+        table.user_ids = state["user_ids"]
+        table.created_at = state["created_at"]
+        table.updated_at = state["updated_at"]
+        table.content_offsets = state["content_offsets"]
+        table.content_lengths = state["content_lengths"]
+        for arena, (buffer, dead_bytes) in zip(table.arenas, state["arenas"]):
+            arena.append(buffer)
+            arena.dead_bytes = dead_bytes
+
+        if stripes != len(table.arenas):
+            table._restripe(stripes)
+        return table
+
+    def _restripe(self, stripes: int):
+        """Move every body into `stripes` arenas, e.g. after the stripe count changed"""
+        arenas = [self.arena_factory() for _ in range(stripes)]
+        for slot, user_id in enumerate(self.user_ids):
+            if user_id:
+                data = self.arena_for(user_id).read_bytes(
+                    self.content_offsets[slot], self.content_lengths[slot]
+                )
+                self.content_offsets[slot] = arenas[user_id % stripes].append(data)
+        for arena in self.arenas:
+            arena.close()
+        self.arenas = arenas
+
+    def row(self, blog_post_id: int) -> dict:
+        slot = blog_post_id - 1
+        return {
+            "id": blog_post_id,
+            "user_id": self.user_ids[slot],
+            "content": self.content_of(blog_post_id),
+            "created_at": self.created_at[slot],
+            "updated_at": self.updated_at[slot],
+        }
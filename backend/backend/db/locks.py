@@ -0,0 +1,59 @@
+import threading
+from contextlib import contextmanager
+from typing import Hashable, Iterator, List
+
+
+class IdAllocator:
+    """Hands out strictly increasing ids and is safe to call from any thread."""
+
+    def __init__(self, last_id: int = 0):
+        self._last_id = last_id
+        self._lock = threading.Lock()
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def next(self) -> int:
+        with self._lock:
+            self._last_id += 1
+            return self._last_id
+
+    def observe(self, used_id: int):
+        """Make sure an id assigned elsewhere (fixtures, replays) is never handed out"""
+        with self._lock:
+            self._last_id = max(self._last_id, used_id)
+
+
+class StripedLock:
+    """A fixed set of locks shared out by key.
+
+    Writers for different keys usually take different locks, so they don't
+    serialize behind one global lock, while the memory cost stays constant
+    no matter how many keys there are. For non-negative integer keys the
+    stripe is `key % stripes`, which other structures can rely on to shard
+    their data the same way.
+    """
+
+    def __init__(self, stripes: int = 64):
+        self._locks: List[threading.RLock] = [threading.RLock() for _ in range(stripes)]
+
+    def __len__(self):
+        return len(self._locks)
+
+    def stripe(self, key: Hashable) -> int:
+        return hash(key) % len(self._locks)
+
+    def for_key(self, key: Hashable) -> threading.RLock:
+        return self._locks[self.stripe(key)]
+
+    @contextmanager
+    def all(self) -> Iterator[None]:
+        """Hold every stripe, e.g. to capture a consistent snapshot"""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
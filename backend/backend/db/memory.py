@@ -0,0 +1,234 @@
+import threading
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable, Dict, Iterable, List, Optional
+from backend.db.base import (
+    ORDER_BY,
+    BlogPost,
+    BlogPostRepository,
+    OrderBy,
+    SortKey,
+    UserRepository,
+    now_timestamp,
+)
+from backend.db.columns import BlogPostTable, ContentArena
+from backend.db.locks import IdAllocator, StripedLock
+from backend.db.wal import Journal
+
+
+class InMemoryBlogPostRepository(BlogPostRepository):
+    """Blog posts held in process memory.
+
+    Posts live in a column-oriented `BlogPostTable` addressed by id, so a read
+    or update is an O(1) slot lookup plus an ownership check on `user_id`.
+    Each user also has one id array per `ORDER_BY` column kept in sort order,
+    so listing touches only that user's posts and a page is found by bisection.
+
+    Ids come from an atomic allocator. Everything else about a user's posts is
+    guarded by that user's stripe of a `StripedLock`, so calls for users on
+    different stripes run without waiting for each other.
+
+    With a `journal`, every write is logged while its stripe is held and the
+    repository is recovered from the journal's snapshot and log on startup.
+    `rows` only seed a journal that has never been checkpointed.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[dict] = (),
+        stripes: int = 64,
+        journal: Optional[Journal] = None,
+        arena_factory: Callable[[], ContentArena] = ContentArena,
+    ):
+        self._locks = StripedLock(stripes)
+        self._table = BlogPostTable(stripes, arena_factory)
+        self._sorted_ids_by_user: Dict[int, Dict[OrderBy, array]] = {}
+        self._ids = IdAllocator()
+        self._journal = journal
+        self._checkpointing = threading.Lock()
+
+        state = None
+        if journal is not None:
+            state, records = journal.recover()
+
+        if state is not None:
+            self._restore(state, stripes)
+        else:
+            for row in rows:
+                created_at = row.get("created_at", now_timestamp())
+                self._insert(
+                    row["id"],
+                    row["user_id"],
+                    row["content"],
+                    created_at,
+                    row.get("updated_at", created_at),
+                )
+
+        if journal is not None:
+            for record in records:
+                self._apply(record)
+            journal.open()
+            if state is None:
+                self.checkpoint()
+
+    def _apply(self, record: tuple):
+        operation, blog_post_id, user_id, content, timestamp = record
+        if operation == "create":
+            self._insert(blog_post_id, user_id, content, timestamp, timestamp)
+        elif operation == "update":
+            self._update(blog_post_id, user_id, content, timestamp)
+        else:
+            raise ValueError(f"Unknown journal record: {operation}")
+
+    def _log(self, record: tuple):
+        if self._journal is None:
+            return
+
+        self._journal.append(record)
+        if self._journal.needs_snapshot and self._checkpointing.acquire(blocking=False):
+            threading.Thread(target=self._checkpoint_in_background).start()
+
+    def _checkpoint_in_background(self):
+        try:
+            self.checkpoint()
+        finally:
+            self._checkpointing.release()
+
+    def checkpoint(self):
+        """Snapshot the repository and drop the log records the snapshot covers"""
+        with self._locks.all():
+            lsn = self._journal.rotate()
+            state = {
+                "last_id": self._ids.last_id,
+                "sorted_ids_by_user": {
+                    user_id: {order_by: ids[:] for order_by, ids in sorted_ids.items()}
+                    for user_id, sorted_ids in self._sorted_ids_by_user.items()
+                },
+                "table": self._table.begin_snapshot(),
+            }
+        # The bodies, which are most of the state, are copied while writers run
+        state["table"] = self._table.finish_snapshot(state["table"])
+        self._journal.write_snapshot(lsn, state)
+
+    def _restore(self, state: dict, stripes: int):
+        self._ids.observe(state["last_id"])
+        self._table = BlogPostTable.restore(
+            state["table"], stripes, self._table.arena_factory
+        )
+        self._sorted_ids_by_user = state["sorted_ids_by_user"]
+
+    def _sort_key(self, order_by: OrderBy) -> Callable[[int], SortKey]:
+        if order_by == "id":
+            return lambda blog_post_id: (blog_post_id,)
+        column = getattr(self._table, order_by)
+        return lambda blog_post_id: (column[blog_post_id - 1], blog_post_id)
+
+    def _insert(
+        self,
+        blog_post_id: int,
+        user_id: int,
+        content: str,
+        created_at: int,
+        updated_at: int,
+    ):
+        self._ids.observe(blog_post_id)
+        self._table.insert(blog_post_id, user_id, content, created_at, updated_at)
+
+        sorted_ids = self._sorted_ids_by_user.get(user_id)
+        if sorted_ids is None:
+            sorted_ids = {order_by: array("q") for order_by in ORDER_BY}
+            self._sorted_ids_by_user[user_id] = sorted_ids
+        for order_by in ORDER_BY:
+            ids = sorted_ids[order_by]
+            key = self._sort_key(order_by)
+            # New posts nearly always sort last, skip the bisection for them
+            if not ids or key(ids[-1]) < key(blog_post_id):
+                ids.append(blog_post_id)
+            else:
+                insort(ids, blog_post_id, key=key)
+
+    def _owns(self, user_id: int, blog_post_id: int) -> bool:
+        return self._table.user_id_of(blog_post_id) == user_id
+
+    def get(self, user_id: int, blog_post_id: int) -> Optional[BlogPost]:
+        with self._locks.for_key(user_id):
+            if not self._owns(user_id, blog_post_id):
+                return None
+            row = self._table.row(blog_post_id)
+        return BlogPost.from_row(row)
+
+    def create(self, user_id: int, content: str) -> BlogPost:
+        blog_post_id = self._ids.next()
+        timestamp = now_timestamp()
+        with self._locks.for_key(user_id):
+            self._insert(blog_post_id, user_id, content, timestamp, timestamp)
+            self._log(("create", blog_post_id, user_id, content, timestamp))
+            row = self._table.row(blog_post_id)
+        return BlogPost.from_row(row)
+
+    def _update(self, blog_post_id: int, user_id: int, content: str, updated_at: int):
+        ids = self._sorted_ids_by_user[user_id]["updated_at"]
+        key = self._sort_key("updated_at")
+        del ids[bisect_left(ids, key(blog_post_id), key=key)]
+
+        self._table.set_content(blog_post_id, content, updated_at)
+        insort(ids, blog_post_id, key=key)
+
+    def update(
+        self, user_id: int, blog_post_id: int, content: str
+    ) -> Optional[BlogPost]:
+        with self._locks.for_key(user_id):
+            if not self._owns(user_id, blog_post_id):
+                return None
+
+            timestamp = now_timestamp()
+            self._update(blog_post_id, user_id, content, timestamp)
+            self._log(("update", blog_post_id, user_id, content, timestamp))
+            row = self._table.row(blog_post_id)
+        return BlogPost.from_row(row)
+
+    def list_by_user(self, user_id: int) -> List[BlogPost]:
+        with self._locks.for_key(user_id):
+            sorted_ids = self._sorted_ids_by_user.get(user_id)
+            if sorted_ids is None:
+                return []
+            rows = [self._table.row(blog_post_id) for blog_post_id in sorted_ids["id"]]
+        return [BlogPost.from_row(row) for row in rows]
+
+    def list_page(
+        self,
+        user_id: int,
+        order_by: OrderBy = "id",
+        descending: bool = False,
+        after: Optional[SortKey] = None,
+        limit: int = 20,
+    ) -> List[BlogPost]:
+        with self._locks.for_key(user_id):
+            sorted_ids = self._sorted_ids_by_user.get(user_id)
+            if sorted_ids is None:
+                return []
+
+            ids = sorted_ids[order_by]
+            key = self._sort_key(order_by)
+            if descending:
+                end = len(ids) if after is None else bisect_left(ids, after, key=key)
+                page = ids[max(0, end - limit) : end][::-1]
+            else:
+                start = 0 if after is None else bisect_right(ids, after, key=key)
+                page = ids[start : start + limit]
+            rows = [self._table.row(blog_post_id) for blog_post_id in page]
+
+        return [BlogPost.from_row(row) for row in rows]
+
+
+class InMemoryUserRepository(UserRepository):
+    def __init__(self, rows: Iterable[dict] = ()):
+        self._rows_by_username: Dict[str, dict] = {
+            row["username"]: dict(row) for row in rows
+        }
+
+    def get_by_username(self, username: str) -> Optional[dict]:
+        row = self._rows_by_username.get(username)
+        if row is None:
+            return None
+        return dict(row)
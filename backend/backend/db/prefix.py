@@ -0,0 +1,64 @@
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Tuple
+from backend.db.base import BlogPost, BlogPostIdCompletion, BlogPostRepository
+from backend.db.locks import StripedLock
+
+# Sorts after every character, so `prefix + PREFIX_END` bounds all strings starting with `prefix`
+PREFIX_END = "\U0010ffff"
+
+
+class SortedPrefixIndex:
+    """Sorted strings, so the ones sharing a prefix are one contiguous slice.
+
+    Completing a prefix is two bisections plus copying at most `limit`
+    values, whatever the number of strings.
+    """
+
+    def __init__(self, values: Iterable[str] = ()):
+        self._values = sorted(values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def add(self, value: str):
+        i = bisect_left(self._values, value)
+        if i == len(self._values) or self._values[i] != value:
+            self._values.insert(i, value)
+
+    def complete(self, prefix: str, limit: int) -> Tuple[List[str], int]:
+        """Return the first `limit` values starting with `prefix` and how many there are"""
+        start = bisect_left(self._values, prefix)
+        end = bisect_left(self._values, prefix + PREFIX_END, start)
+        return self._values[start : min(end, start + limit)], end - start
+
+
+class BlogPostIdIndex(BlogPostIdCompletion):
+    """Per-user `SortedPrefixIndex` of blog post ids, for completing ids as they're typed.
+
+    Like `SearchIndex`, a user's index is built from the repository on first
+    use and then kept up to date by `index_post`, under that user's stripe,
+    and backs the `memory` repository only. Ids never change, so unlike post
+    contents they can be indexed in any order.
+    """
+
+    def __init__(self, repository: BlogPostRepository, stripes: int = 64):
+        self.repository = repository
+        self._indexes: Dict[int, SortedPrefixIndex] = {}
+        self._locks = StripedLock(stripes)
+
+    def index_post(self, blog_post: BlogPost):
+        with self._locks.for_key(blog_post.user_id):
+            index = self._indexes.get(blog_post.user_id)
+            if index is not None:
+                index.add(str(blog_post.id))
+
+    def complete(self, user_id: int, prefix: str, limit: int) -> Tuple[List[str], int]:
+        with self._locks.for_key(user_id):
+            index = self._indexes.get(user_id)
+            if index is None:
+                index = SortedPrefixIndex(
+                    str(blog_post.id)
+                    for blog_post in self.repository.list_by_user(user_id)
+                )
+                self._indexes[user_id] = index
+            return index.complete(prefix, limit)
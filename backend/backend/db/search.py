@@ -0,0 +1,119 @@
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
+from backend.db.base import BlogPost, BlogPostRepository, BlogPostSearch
+from backend.db.locks import StripedLock
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# BM25 parameters, see https://en.wikipedia.org/wiki/Okapi_BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class InvertedIndex:
+    """Term -> posting list index over one user's blog posts, ranked by BM25."""
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, int]] = {}  # term -> {doc_id: tf}
+        self._doc_terms: Dict[int, Counter] = {}
+        self._doc_lengths: Dict[int, int] = {}
+        self._total_length = 0
+
+    def __len__(self):
+        return len(self._doc_terms)
+
+    def add(self, doc_id: int, text: str):
+        if doc_id in self._doc_terms:
+            self.remove(doc_id)
+
+        terms = Counter(tokenize(text))
+        self._doc_terms[doc_id] = terms
+        self._doc_lengths[doc_id] = terms.total()
+        self._total_length += self._doc_lengths[doc_id]
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+
+    def remove(self, doc_id: int):
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        for term in terms:
+            posting = self._postings[term]
+            del posting[doc_id]
+            if not posting:
+                del self._postings[term]
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, float]]:
+        doc_count = len(self._doc_terms)
+        if doc_count == 0:
+            return []
+
+        avg_length = self._total_length / doc_count
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+
+            idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc_id, tf in posting.items():
+                length = self._doc_lengths[doc_id]
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (
+                    tf + norm
+                )
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+
+class SearchIndex(BlogPostSearch):
+    """Per-user inverted indexes over the blog post repository.
+
+    A user's index is built from the repository on their first search and is
+    then kept up to date by `index_post` whenever a post is created or updated.
+    Each user's index is guarded by that user's stripe of a `StripedLock`.
+
+    Being per process, it only sees writes made through this process, so it
+    backs the `memory` repository only.
+    """
+
+    def __init__(self, repository: BlogPostRepository, stripes: int = 64):
+        self.repository = repository
+        self._indexes: Dict[int, InvertedIndex] = {}
+        self._locks = StripedLock(stripes)
+
+    def _index_for(self, user_id: int) -> InvertedIndex:
+        index = self._indexes.get(user_id)
+        if index is None:
+            index = InvertedIndex()
+            for blog_post in self.repository.list_by_user(user_id):
+                index.add(blog_post.id, blog_post.content)
+            self._indexes[user_id] = index
+        return index
+
+    def index_post(self, blog_post: BlogPost):
+        # Users who have never searched are indexed lazily on their first query
+        with self._locks.for_key(blog_post.user_id):
+            index = self._indexes.get(blog_post.user_id)
+            if index is None:
+                return
+            # Re-read under this lock: concurrent updates of a post may get here
+            # in another order than they were written, and the latest must win
+            current = self.repository.get(blog_post.user_id, blog_post.id)
+            if current is not None:
+                index.add(current.id, current.content)
+
+    def search(
+        self, user_id: int, query: str, limit: int = 10
+    ) -> List[Tuple[int, float]]:
+        with self._locks.for_key(user_id):
+            return self._index_for(user_id).search(query, limit)
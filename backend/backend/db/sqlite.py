@@ -0,0 +1,407 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+from backend.db.base import (
+    ORDER_BY,
+    BlogPost,
+    BlogPostIdCompletion,
+    BlogPostRepository,
+    BlogPostSearch,
+    OrderBy,
+    SortKey,
+    UserRepository,
+    now_timestamp,
+)
+from backend.db.search import tokenize
+
+# Each entry upgrades the database by one `PRAGMA user_version`.
+# Never edit an entry that has shipped; append a new one instead.
+MIGRATIONS = [
+    """
+    CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        username TEXT NOT NULL UNIQUE,
+        full_name TEXT,
+        email TEXT,
+        hashed_password TEXT NOT NULL
+    );
+    CREATE TABLE blog_posts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL REFERENCES users (id),
+        content TEXT NOT NULL
+    );
+    CREATE INDEX blog_posts_user_id_id ON blog_posts (user_id, id);
+    """,
+    """
+    ALTER TABLE blog_posts ADD COLUMN created_at INTEGER NOT NULL DEFAULT 0;
+    ALTER TABLE blog_posts ADD COLUMN updated_at INTEGER NOT NULL DEFAULT 0;
+    UPDATE blog_posts SET
+        created_at = CAST((julianday('now') - 2440587.5) * 86400000000 AS INTEGER),
+        updated_at = CAST((julianday('now') - 2440587.5) * 86400000000 AS INTEGER);
+    CREATE INDEX blog_posts_user_id_created_at ON blog_posts (user_id, created_at, id);
+    CREATE INDEX blog_posts_user_id_updated_at ON blog_posts (user_id, updated_at, id);
+    """,
+    """
+    CREATE VIRTUAL TABLE blog_posts_search USING fts5 (
+        content,
+        content = 'blog_posts',
+        content_rowid = 'id',
+        tokenize = 'unicode61 remove_diacritics 0'
+    );
+    CREATE TRIGGER blog_posts_search_insert AFTER INSERT ON blog_posts BEGIN
+        INSERT INTO blog_posts_search (rowid, content) VALUES (new.id, new.content);
+    END;
+    CREATE TRIGGER blog_posts_search_update AFTER UPDATE OF content ON blog_posts BEGIN
+        INSERT INTO blog_posts_search (blog_posts_search, rowid, content)
+            VALUES ('delete', old.id, old.content);
+        INSERT INTO blog_posts_search (rowid, content) VALUES (new.id, new.content);
+    END;
+    CREATE TRIGGER blog_posts_search_delete AFTER DELETE ON blog_posts BEGIN
+        INSERT INTO blog_posts_search (blog_posts_search, rowid, content)
+            VALUES ('delete', old.id, old.content);
+    END;
+    INSERT INTO blog_posts_search (blog_posts_search) VALUES ('rebuild');
+    """,
+    """
+    CREATE TABLE mcp_sessions (
+        id TEXT PRIMARY KEY,
+        data TEXT NOT NULL,
+        last_used_at REAL NOT NULL
+    );
+    CREATE INDEX mcp_sessions_last_used_at ON mcp_sessions (last_used_at);
+    """,
+]
+
+BLOG_POST_COLUMNS = "id, user_id, content, created_at, updated_at"
+
+SORT_COLUMNS = {
+    "id": "id",
+    "created_at": "created_at, id",
+    "updated_at": "updated_at, id",
+}
+
+
+def list_page_sql(order_by: OrderBy, descending: bool, has_after: bool) -> str:
+    columns = SORT_COLUMNS[order_by]
+    sql = f"SELECT {BLOG_POST_COLUMNS} FROM blog_posts WHERE user_id = ?"
+    if has_after:
+        placeholders = ", ".join("?" for _ in columns.split(", "))
+        sql += f" AND ({columns}) {'<' if descending else '>'} ({placeholders})"
+    direction = " DESC" if descending else ""
+    order = ", ".join(column + direction for column in columns.split(", "))
+    return sql + f" ORDER BY {order} LIMIT ?"
+
+
+SEARCH_SQL = (
+    "SELECT blog_posts_search.rowid AS id, -rank AS score FROM blog_posts_search "
+    "JOIN blog_posts ON blog_posts.id = blog_posts_search.rowid "
+    "WHERE blog_posts_search MATCH ? AND blog_posts.user_id = ? "
+    "ORDER BY rank LIMIT ?"
+)
+
+# Both run on the (user_id, id) index, over one range of ids of the same length
+COMPLETE_IDS_SQL = (
+    "SELECT id FROM blog_posts WHERE user_id = ? AND id BETWEEN ? AND ? "
+    "ORDER BY id LIMIT ?"
+)
+COUNT_IDS_SQL = (
+    "SELECT COUNT(*) AS total FROM "
+    "(SELECT 1 FROM blog_posts WHERE user_id = ? AND id BETWEEN ? AND ? LIMIT ?)"
+)
+
+# Completions count matching ids up to this many, so that a short prefix doesn't
+# count all of a large user's posts on every keystroke
+COMPLETE_IDS_MAX_TOTAL = 10_000
+
+# The largest SQLite integer, so no id has more digits than this
+MAX_ID = 2**63 - 1
+
+
+def id_ranges(prefix: str) -> Iterator[Tuple[int, int]]:
+    """Yield the inclusive ranges of ids whose decimal form starts with `prefix`,
+    `[p·10^k, (p+1)·10^k)` for each length the ids can have, shortest first"""
+    if prefix and not (prefix.isascii() and prefix.isdigit()) or prefix.startswith("0"):
+        return
+    # Without a prefix, the ids of each length: 1-9, 10-99, ...
+    start, end = (int(prefix), int(prefix) + 1) if prefix else (1, 10)
+    while start <= MAX_ID:
+        yield start, min(end - 1, MAX_ID)
+        start, end = (start * 10, end * 10) if prefix else (end, end * 10)
+
+
+def statements(migration: str) -> Iterator[str]:
+    """Split a migration into statements, keeping the `;`s inside trigger bodies"""
+    statement = ""
+    for part in migration.split(";"):
+        statement += part + ";"
+        if sqlite3.complete_statement(statement):
+            yield statement
+            statement = ""
+    if statement.rstrip(";").strip():
+        raise ValueError(f"Incomplete SQL statement: {statement}")
+
+
+# Built once so every page query is one of a few constant, cached statements
+LIST_PAGE_SQL = {
+    (order_by, descending, has_after): list_page_sql(order_by, descending, has_after)
+    for order_by in ORDER_BY
+    for descending in (False, True)
+    for has_after in (False, True)
+}
+
+
+class ConnectionPool:
+    """A fixed-size pool of SQLite connections shared by worker threads.
+
+    Connections are opened lazily in WAL mode, so readers never block the
+    writer and several uvicorn workers can open the same database file.
+    sqlite3 keeps a per-connection cache of prepared statements, which is why
+    the repositories only ever issue constant SQL strings.
+    """
+
+    def __init__(self, path: str, size: int = 5, timeout: float = 5.0):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_open = self._opened < self.size
+            if can_open:
+                self._opened += 1
+
+        if can_open:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._opened -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No SQLite connection became available within {self.timeout}s"
+            )
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    def close(self):
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
+
+def migrate(pool: ConnectionPool, fixtures: Optional[dict] = None):
+    """Bring the database schema up to date and seed an empty database.
+
+    The version check runs inside an immediate transaction so that workers
+    starting at the same time don't apply a migration twice."""
+    with pool.connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for index, migration in enumerate(MIGRATIONS[version:], start=version):
+                for statement in statements(migration):
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {index + 1}")
+
+            if version == 0 and fixtures:
+                seed(conn, fixtures)
+
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def seed(conn: sqlite3.Connection, fixtures: dict):
+    timestamp = now_timestamp()
+    blog_posts = [
+        {"created_at": timestamp, "updated_at": timestamp, **blog_post}
+        for blog_post in fixtures.get("blog_posts", [])
+    ]
+
+    conn.executemany(
+        "INSERT INTO users (id, username, full_name, email, hashed_password) "
+        "VALUES (:id, :username, :full_name, :email, :hashed_password)",
+        fixtures.get("users", []),
+    )
+    conn.executemany(
+        "INSERT INTO blog_posts (id, user_id, content, created_at, updated_at) "
+        "VALUES (:id, :user_id, :content, :created_at, :updated_at)",
+        blog_posts,
+    )
+
+
+class SQLiteBlogPostRepository(BlogPostRepository):
+    def __init__(self, pool: ConnectionPool):
+        self.pool = pool
+
+    def get(self, user_id: int, blog_post_id: int) -> Optional[BlogPost]:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                f"SELECT {BLOG_POST_COLUMNS} FROM blog_posts WHERE id = ? AND user_id = ?",
+                (blog_post_id, user_id),
+            ).fetchone()
+        if row is None:
+            return None
+        return BlogPost.from_row(row)
+
+    def create(self, user_id: int, content: str) -> BlogPost:
+        timestamp = now_timestamp()
+        with self.pool.connection() as conn, conn:
+            cursor = conn.execute(
+                "INSERT INTO blog_posts (user_id, content, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                (user_id, content, timestamp, timestamp),
+            )
+        return BlogPost.from_row(
+            {
+                "id": cursor.lastrowid,
+                "user_id": user_id,
+                "content": content,
+                "created_at": timestamp,
+                "updated_at": timestamp,
+            }
+        )
+
+    def update(
+        self, user_id: int, blog_post_id: int, content: str
+    ) -> Optional[BlogPost]:
+        with self.pool.connection() as conn, conn:
+            row = conn.execute(
+                f"UPDATE blog_posts SET content = ?, updated_at = ? WHERE id = ? AND user_id = ? RETURNING {BLOG_POST_COLUMNS}",
+                (content, now_timestamp(), blog_post_id, user_id),
+            ).fetchone()
+        if row is None:
+            return None
+        return BlogPost.from_row(row)
+
+    def list_by_user(self, user_id: int) -> List[BlogPost]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {BLOG_POST_COLUMNS} FROM blog_posts WHERE user_id = ? ORDER BY id",
+                (user_id,),
+            ).fetchall()
+        return [BlogPost.from_row(row) for row in rows]
+
+    def list_page(
+        self,
+        user_id: int,
+        order_by: OrderBy = "id",
+        descending: bool = False,
+        after: Optional[SortKey] = None,
+        limit: int = 20,
+    ) -> List[BlogPost]:
+        sql = LIST_PAGE_SQL[(order_by, descending, after is not None)]
+        with self.pool.connection() as conn:
+            rows = conn.execute(sql, (user_id, *(after or ()), limit)).fetchall()
+        return [BlogPost.from_row(row) for row in rows]
+
+
+class SQLiteSearchIndex(BlogPostSearch):
+    """Full-text search with the FTS5 table that triggers keep in step with `blog_posts`.
+
+    The index is part of the database, so every worker sees the writes of
+    the others. Scores are FTS5's BM25 over the posts of all users.
+    """
+
+    def __init__(self, pool: ConnectionPool):
+        self.pool = pool
+
+    def index_post(self, blog_post: BlogPost):
+        # Indexed by the triggers, in the transaction that wrote the post
+        pass
+
+    def search(
+        self, user_id: int, query: str, limit: int = 10
+    ) -> List[Tuple[int, float]]:
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        # Quoted, so terms are never read as FTS5 query syntax
+        match = " OR ".join(f'"{term}"' for term in sorted(terms))
+        with self.pool.connection() as conn:
+            rows = conn.execute(SEARCH_SQL, (match, user_id, limit)).fetchall()
+        return [(row["id"], row["score"]) for row in rows]
+
+
+class SQLiteBlogPostIdIndex(BlogPostIdCompletion):
+    """Completes post ids with a query over the user's posts, sorted as strings"""
+
+    def __init__(self, pool: ConnectionPool):
+        self.pool = pool
+
+    def index_post(self, blog_post: BlogPost):
+        pass
+
+    def complete(self, user_id: int, prefix: str, limit: int) -> Tuple[List[str], int]:
+        """Ids of one length sort the same as numbers and as strings, so the first
+        `limit` of each range, merged, hold the first `limit` overall"""
+        values: List[str] = []
+        total = 0
+        with self.pool.connection() as conn:
+            for start, end in id_ranges(prefix):
+                rows = conn.execute(
+                    COMPLETE_IDS_SQL, (user_id, start, end, limit)
+                ).fetchall()
+                values.extend(str(row["id"]) for row in rows)
+                if total < COMPLETE_IDS_MAX_TOTAL:
+                    total += conn.execute(
+                        COUNT_IDS_SQL,
+                        (user_id, start, end, COMPLETE_IDS_MAX_TOTAL - total),
+                    ).fetchone()["total"]
+        return sorted(values)[:limit], total
+
+
+class SQLiteUserRepository(UserRepository):
+    def __init__(self, pool: ConnectionPool):
+        self.pool = pool
+
+    def get_by_username(self, username: str) -> Optional[dict]:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT id, username, full_name, email, hashed_password FROM users WHERE username = ?",
+                (username,),
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(row)
@@ -0,0 +1,242 @@
+import glob
+import os
+import pickle
+import struct
+import threading
+import zlib
+from collections.abc import MutableMapping
+from typing import Any, Iterator, Optional, Tuple
+
+# Every record is `length`, `crc32` and a pickled `(lsn, record)` payload
+RECORD_HEADER = struct.Struct("<II")
+SEGMENT_SUFFIX = ".wal"
+SNAPSHOT_SUFFIX = ".snapshot"
+
+
+class Journal:
+    """Write-ahead log plus snapshots for one in-memory structure.
+
+    Mutations are appended to the current log segment and made durable by a
+    background thread that fsyncs at most every `fsync_interval` seconds, so
+    many writes share one fsync (group commit). A checkpoint `rotate`s to a new
+    segment, then `write_snapshot` persists the state as of the previous
+    segment and deletes the segments it covers. Recovery loads the snapshot
+    and replays the records logged after it.
+
+    Files live in `directory` as `<name>.<first lsn>.wal` and `<name>.snapshot`.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        name: str,
+        fsync_interval: float = 0.05,
+        snapshot_every: int = 100_000,
+    ):
+        self.directory = directory
+        self.name = name
+        self.fsync_interval = fsync_interval
+        self.snapshot_every = snapshot_every
+        self.snapshot_path = os.path.join(directory, name + SNAPSHOT_SUFFIX)
+
+        self._lock = threading.Lock()
+        self._lsn = 0
+        self._records_since_snapshot = 0
+        self._file = None
+        self._dirty = False
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+        os.makedirs(directory, exist_ok=True)
+
+    def _segment_path(self, first_lsn: int) -> str:
+        return os.path.join(
+            self.directory, f"{self.name}.{first_lsn:020d}{SEGMENT_SUFFIX}"
+        )
+
+    def _segments(self):
+        pattern = os.path.join(self.directory, f"{self.name}.*{SEGMENT_SUFFIX}")
+        segments = []
+        for path in glob.glob(pattern):
+            first_lsn = path[: -len(SEGMENT_SUFFIX)].rsplit(".", 1)[1]
+            if first_lsn.isdigit():
+                segments.append((int(first_lsn), path))
+        return sorted(segments)
+
+    def recover(self) -> Tuple[Optional[Any], Iterator[Any]]:
+        """Return the latest snapshot state (or None) and the records logged after it.
+
+        Must be called, and the records consumed, before the first `append`."""
+        snapshot_lsn, state = 0, None
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "rb") as f:
+                snapshot_lsn, state = pickle.load(f)
+        self._lsn = snapshot_lsn
+
+        return state, self._replay(snapshot_lsn)
+
+    def _replay(self, after_lsn: int) -> Iterator[Any]:
+        for _, path in self._segments():
+            with open(path, "r+b") as f:
+                while True:
+                    position = f.tell()
+                    header = f.read(RECORD_HEADER.size)
+                    if not header:
+                        break
+
+                    payload = b""
+                    if len(header) == RECORD_HEADER.size:
+                        length, crc = RECORD_HEADER.unpack(header)
+                        payload = f.read(length)
+
+                    if len(header) < RECORD_HEADER.size or (
+                        len(payload) < length or zlib.crc32(payload) != crc
+                    ):
+                        # A torn write from a crash: drop it and everything after it
+                        f.truncate(position)
+                        break
+
+                    lsn, record = pickle.loads(payload)
+                    self._lsn = max(self._lsn, lsn)
+                    if lsn > after_lsn:
+                        self._records_since_snapshot += 1
+                        yield record
+
+    def open(self):
+        self._file = open(self._segment_path(self._lsn + 1), "ab")
+        if self.fsync_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name=f"{self.name}-wal", daemon=True
+            )
+            self._flusher.start()
+
+    def append(self, record: Any) -> int:
+        with self._lock:
+            self._lsn += 1
+            payload = pickle.dumps(
+                (self._lsn, record), protocol=pickle.HIGHEST_PROTOCOL
+            )
+            self._file.write(RECORD_HEADER.pack(len(payload), zlib.crc32(payload)))
+            self._file.write(payload)
+            self._records_since_snapshot += 1
+
+            if self.fsync_interval > 0:
+                self._dirty = True
+            else:
+                self._sync()
+
+            return self._lsn
+
+    @property
+    def needs_snapshot(self) -> bool:
+        return self._records_since_snapshot >= self.snapshot_every
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.fsync_interval):
+            with self._lock:
+                if not self._dirty:
+                    continue
+                self._file.flush()
+                self._dirty = False
+                fileno = os.dup(self._file.fileno())
+            try:
+                # Outside the lock, so writers keep appending while the disk catches up
+                os.fsync(fileno)
+            finally:
+                os.close(fileno)
+
+    def rotate(self) -> int:
+        """Start a new segment and return the last lsn of the previous one.
+
+        Callers hold whatever locks make their state consistent with that lsn."""
+        with self._lock:
+            self._sync()
+            self._file.close()
+            self._file = open(self._segment_path(self._lsn + 1), "ab")
+            self._dirty = False
+            self._records_since_snapshot = 0
+            return self._lsn
+
+    def write_snapshot(self, lsn: int, state: Any):
+        """Persist `state` as of `lsn` and delete the log segments it covers"""
+        temporary_path = self.snapshot_path + ".tmp"
+        with open(temporary_path, "wb") as f:
+            pickle.dump((lsn, state), f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+
+        directory = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+        for first_lsn, path in self._segments():
+            if first_lsn <= lsn:
+                os.remove(path)
+
+    def close(self):
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+
+
+class JournaledDict(MutableMapping):
+    """A dict whose assignments and deletions are logged to a `Journal`.
+
+    Without a journal it behaves like a plain dict. Values are replaced as a
+    whole, so mutating a stored value in place is not logged.
+    """
+
+    def __init__(self, journal: Optional[Journal] = None):
+        self._data = {}
+        self._journal = journal
+        self._lock = threading.Lock()
+
+        if journal is not None:
+            state, records = journal.recover()
+            self._data = state or {}
+            for operation, key, value in records:
+                if operation == "set":
+                    self._data[key] = value
+                else:
+                    self._data.pop(key, None)
+            journal.open()
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._log(("set", key, value))
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+            self._log(("del", key, None))
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def _log(self, record: tuple):
+        if self._journal is None:
+            return
+
+        self._journal.append(record)
+        if self._journal.needs_snapshot:
+            # Token stores are small, so snapshot inline while holding the lock
+            self._journal.write_snapshot(self._journal.rotate(), dict(self._data))
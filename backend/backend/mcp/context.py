@@ -0,0 +1,128 @@
+import asyncio
+import threading
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+from backend.auth.utils import User
+from backend.mcp.schema import (
+    JSONRPCNotification,
+    ProgressNotification,
+    ProgressNotificationParams,
+    ProgressToken,
+    RequestId,
+)
+
+Send = Callable[[JSONRPCNotification], None]
+
+
+class Caller(NamedTuple):
+    """Who sent a message, and how to reach them while it is being processed"""
+
+    user: User
+    # The session, or the user without one, see `backend.mcp.streams.stream_key`
+    key: str
+    # Sends a notification on the response stream of the POST being processed.
+    # Safe to call from any thread. None when the response isn't a stream.
+    send: Optional[Send] = None
+
+
+class ToolCancelled(Exception):
+    """Raised by `ToolContext.check_cancelled` once the client cancelled the call"""
+
+
+class ToolContext:
+    """Passed to tools that take a `context` argument.
+
+    Long-running tools report progress with `report_progress`, which only
+    sends anything when the client asked for it with a progress token, and
+    call `check_cancelled` every so often so that a call the client gave up
+    on stops and frees its worker thread.
+    """
+
+    def __init__(
+        self,
+        caller: Caller,
+        request_id: RequestId,
+        progress_token: Optional[ProgressToken] = None,
+    ):
+        self.caller = caller
+        self.request_id = request_id
+        self.progress_token = progress_token
+        self.cancelled = threading.Event()
+
+    @property
+    def user(self) -> User:
+        return self.caller.user
+
+    def report_progress(
+        self,
+        progress: float,
+        total: Optional[float] = None,
+        message: Optional[str] = None,
+    ):
+        if self.progress_token is None or self.caller.send is None:
+            return
+
+        notification = ProgressNotification(
+            params=ProgressNotificationParams(
+                progressToken=self.progress_token,
+                progress=progress,
+                total=total,
+                message=message,
+            )
+        )
+        self.caller.send(
+            JSONRPCNotification(
+                method=notification.method,
+                params=notification.params.model_dump(exclude_none=True),
+            )
+        )
+
+    def check_cancelled(self):
+        if self.cancelled.is_set():
+            raise ToolCancelled(f"Request {self.request_id} was cancelled")
+
+
+class InFlightRequests:
+    """Requests being processed, so `notifications/cancelled` can find them.
+
+    Keyed by the caller key and request id: request ids are only unique
+    within one session.
+    """
+
+    def __init__(self):
+        self._requests: Dict[
+            Tuple[str, RequestId], Tuple[ToolContext, asyncio.Future]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def add(self, context: ToolContext, task: asyncio.Future):
+        with self._lock:
+            self._requests[(context.caller.key, context.request_id)] = (context, task)
+
+    def remove(self, context: ToolContext):
+        with self._lock:
+            key = (context.caller.key, context.request_id)
+            if self._requests.get(key, (None,))[0] is context:
+                del self._requests[key]
+
+    def cancel(self, caller_key: str, request_id: RequestId) -> bool:
+        with self._lock:
+            entry = self._requests.pop((caller_key, request_id), None)
+        if entry is None:
+            # Already finished, the cancellation arrived too late
+            return False
+
+        context, task = entry
+        context.cancelled.set()
+        task.get_loop().call_soon_threadsafe(task.cancel)
+        return True
+
+
+in_flight = InFlightRequests()
+
+
+def progress_token(params: Optional[dict]) -> Optional[ProgressToken]:
+    """The progress token a request asked for in `params._meta`, if any"""
+    meta = (params or {}).get("_meta")
+    if not isinstance(meta, dict):
+        return None
+    return meta.get("progressToken")
@@ -0,0 +1,41 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict
+
+# Synchronous tools run on thread pools so a slow tool never blocks the event
+# loop. Every pool has MCP_TOOL_THREADS threads unless a pool-specific
+# MCP_TOOL_THREADS_<NAME> is set, e.g. MCP_TOOL_THREADS_SEARCH=2.
+MCP_TOOL_THREADS = int(os.environ.get("MCP_TOOL_THREADS", "8"))
+
+DEFAULT = "default"
+# Runs on the event loop itself, for work too cheap to be worth a thread hop
+INLINE = "inline"
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+
+
+def get_executor(name: str = DEFAULT) -> ThreadPoolExecutor:
+    executor = _executors.get(name)
+    if executor is None:
+        with _lock:
+            executor = _executors.get(name)
+            if executor is None:
+                threads = int(
+                    os.environ.get(f"MCP_TOOL_THREADS_{name.upper()}", MCP_TOOL_THREADS)
+                )
+                executor = ThreadPoolExecutor(threads, thread_name_prefix=f"mcp-{name}")
+                _executors[name] = executor
+    return executor
+
+
+async def run_sync(executor: str, func: Callable[..., Any], *args: Any) -> Any:
+    """Run `func(*args)` on the named executor without blocking the event loop"""
+    if executor == INLINE:
+        return func(*args)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(executor), partial(func, *args))
@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional, Set, Tuple
+from backend.mcp.schema import JSONRPCRequest, JSONRPCResponse, RequestId
+
+# Seconds a completed tools/call response is replayed to retries of the same request
+MCP_IDEMPOTENCY_TTL = float(os.environ.get("MCP_IDEMPOTENCY_TTL", "300"))
+# Responses remembered at once, the oldest ones are dropped first
+MCP_IDEMPOTENCY_MAX_ENTRIES = int(
+    os.environ.get("MCP_IDEMPOTENCY_MAX_ENTRIES", "10000")
+)
+
+
+def fingerprint(rpc: JSONRPCRequest) -> str:
+    payload = json.dumps(
+        [rpc.method, rpc.params], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class _Entry(NamedTuple):
+    fingerprint: str
+    response: "asyncio.Future[Optional[JSONRPCResponse]]"
+    expires_at: float
+
+
+class IdempotencyCache:
+    """Responses by `(caller key, request id)`, so a retried request runs once.
+
+    A retry that arrives while the original is still running waits for the
+    original's response instead of running again, and one that arrives within
+    `ttl` seconds after it completed gets the stored response. A request that
+    reuses an id with different params is a new request, not a retry. Failed
+    requests, and ones cancelled with `notifications/cancelled`, are forgotten
+    so they can be retried. A request whose caller went away keeps running,
+    so that its retry gets its response instead of running it twice.
+    `backend.mcp.process.replays_retries` decides which calls come here.
+
+    Completed entries are kept in completion order, which is also expiry
+    order, so eviction only ever looks at the oldest ones. Only used from the
+    event loop thread, so it needs no lock.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._running: Dict[Tuple[str, RequestId], _Entry] = {}
+        self._completed: OrderedDict[Tuple[str, RequestId], _Entry] = OrderedDict()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self):
+        return len(self._running) + len(self._completed)
+
+    def _find(self, key: Tuple[str, RequestId]) -> Optional[_Entry]:
+        entry = self._running.get(key)
+        if entry is None:
+            entry = self._completed.get(key)
+        return entry
+
+    async def run(
+        self,
+        caller_key: str,
+        rpc: JSONRPCRequest,
+        process: Callable[[], Awaitable[Optional[JSONRPCResponse]]],
+    ) -> Optional[JSONRPCResponse]:
+        self._evict(time.monotonic())
+
+        key = (caller_key, rpc.id)
+        request_fingerprint = fingerprint(rpc)
+        entry = self._find(key)
+        while entry is not None and entry.fingerprint == request_fingerprint:
+            try:
+                # Shielded, so a retry that gives up does not cancel the original
+                return await asyncio.shield(entry.response)
+            except asyncio.CancelledError:
+                if not entry.response.cancelled():
+                    raise
+            # The original was cancelled without a response, run the retry itself
+            entry = self._find(key)
+
+        response = asyncio.get_running_loop().create_future()
+        entry = _Entry(request_fingerprint, response, float("inf"))
+        self._completed.pop(key, None)
+        self._running[key] = entry
+
+        # A task of its own, so a caller that goes away, e.g. a client that
+        # disconnects in order to retry, doesn't stop it: a handler may be
+        # writing in a worker thread already, and the retry waits for it
+        task = asyncio.ensure_future(self._process(key, entry, process))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return await asyncio.shield(response)
+
+    async def _process(
+        self,
+        key: Tuple[str, RequestId],
+        entry: _Entry,
+        process: Callable[[], Awaitable[Optional[JSONRPCResponse]]],
+    ):
+        try:
+            result = await process()
+        except BaseException as e:
+            self._finish(key, entry)
+            if isinstance(e, asyncio.CancelledError):
+                entry.response.cancel()
+                raise
+            entry.response.set_exception(e)
+            # Marks the exception as retrieved in case nobody waits for it
+            entry.response.exception()
+            return
+
+        if self._finish(key, entry) and result is not None:
+            self._completed[key] = entry._replace(
+                expires_at=time.monotonic() + self.ttl
+            )
+        entry.response.set_result(result)
+
+    def _finish(self, key: Tuple[str, RequestId], entry: _Entry) -> bool:
+        """Stop tracking `entry` as running, unless a newer request replaced it"""
+        if self._running.get(key) is not entry:
+            return False
+        del self._running[key]
+        return True
+
+    def _evict(self, now: float):
+        while self._completed:
+            key, entry = next(iter(self._completed.items()))
+            if entry.expires_at > now and len(self) <= self.max_entries:
+                break
+            del self._completed[key]
+
+
+idempotency = IdempotencyCache(MCP_IDEMPOTENCY_TTL, MCP_IDEMPOTENCY_MAX_ENTRIES)
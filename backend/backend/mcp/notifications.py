@@ -0,0 +1,36 @@
+import threading
+from typing import Callable, Set
+from backend.mcp.schema import JSONRPCNotification
+
+Listener = Callable[[JSONRPCNotification], None]
+
+
+class NotificationHub:
+    """Fans server-initiated notifications out to every listener.
+
+    Listeners are called synchronously from whichever thread publishes, so
+    they should only hand the message off (e.g. to a queue) and return.
+    """
+
+    def __init__(self):
+        self._listeners: Set[Listener] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener: Listener) -> Callable[[], None]:
+        """Start calling `listener` and return a function that stops it"""
+        with self._lock:
+            self._listeners.add(listener)
+        return lambda: self.unsubscribe(listener)
+
+    def unsubscribe(self, listener: Listener):
+        with self._lock:
+            self._listeners.discard(listener)
+
+    def publish(self, notification: JSONRPCNotification):
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(notification)
+
+
+hub = NotificationHub()
@@ -0,0 +1,252 @@
+import os
+import re
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    List,
+    Optional,
+    TypeAlias,
+)
+from pydantic import Field, TypeAdapter, ValidationError
+from pydantic_core import from_json
+from backend.mcp.schema import (
+    ClientNotification,
+    ClientRequest,
+    JSONRPCNotification,
+    JSONRPCRequest,
+    JSONRPCResponse,
+    RequestId,
+)
+
+JSONRPC: TypeAlias = JSONRPCRequest | JSONRPCNotification | JSONRPCResponse
+
+# Picked by the `method` tag, so a message is validated against its own schema only
+CLIENT_REQUEST = TypeAdapter(Annotated[ClientRequest, Field(discriminator="method")])
+CLIENT_NOTIFICATION = TypeAdapter(
+    Annotated[ClientNotification, Field(discriminator="method")]
+)
+REQUEST_ID = TypeAdapter(RequestId)
+# Responses from the client, and messages that are no JSON-RPC at all
+MESSAGE = TypeAdapter(JSONRPC)
+
+# Bytes of a POST body, larger bodies are rejected with 413
+MCP_MAX_BODY_BYTES = int(os.environ.get("MCP_MAX_BODY_BYTES", str(10 << 20)))
+# Entries of a batch, longer batches are rejected with 413
+MCP_MAX_BATCH_SIZE = int(os.environ.get("MCP_MAX_BATCH_SIZE", "1000"))
+
+# The batch splitter skips everything but brackets, and commas at the top
+# level, taking whole strings in one step. It stops at a string whose
+# closing quote is still missing, which the rest of the string completes.
+STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+SKIP_TOP_LEVEL = re.compile(rb'(?:[^"\[\]{},]+|' + STRING + rb")*", re.DOTALL)
+SKIP_NESTED = re.compile(rb'(?:[^"\[\]{}]+|' + STRING + rb")*", re.DOTALL)
+STRING_REST = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*("?)', re.DOTALL)
+WHITESPACE = b" \t\r\n"
+QUOTE, COMMA = ord('"'), ord(",")
+CLOSING_BRACKET = ord("]")
+OPENING = b"[{"
+
+
+class ParsedRequest(JSONRPCRequest):
+    """A request whose params were validated against the schema of its method.
+
+    `params` keeps the raw dict, e.g. for `_meta`, which the typed params drop.
+    A request that doesn't match its schema still parses, so that it gets an
+    error response of its own instead of failing the whole batch.
+    """
+
+    request: Optional[ClientRequest] = None
+    error: Optional[str] = None
+
+
+class ParsedNotification(JSONRPCNotification):
+    """A notification whose params were validated against the schema of its method"""
+
+    notification: Optional[ClientNotification] = None
+    error: Optional[str] = None
+
+
+def describe(e: ValidationError, kind: str, method: str) -> str:
+    errors = e.errors(include_url=False)
+    if errors[0]["type"] == "union_tag_invalid":
+        return f"Unknown {kind} method: {method}"
+    # The first item of each location is the union member, i.e. the method
+    details = "; ".join(
+        f"{'.'.join(str(item) for item in error['loc'][1:])}: {error['msg']}"
+        for error in errors
+    )
+    return f"Invalid {kind} for {method}: {details}"
+
+
+def parse_message(message: Any) -> JSONRPC:
+    """Validate one message, dispatching on `method` and `id` instead of trying each type"""
+    if not (
+        isinstance(message, dict)
+        and message.get("jsonrpc") == "2.0"
+        and isinstance(message.get("method"), str)
+        and isinstance(message.get("params", {}), (dict, type(None)))
+    ):
+        # Raises for anything that is no JSON-RPC message
+        return MESSAGE.validate_python(message)
+
+    method = message["method"]
+    params = message.get("params")
+    if "id" in message:
+        request_id = REQUEST_ID.validate_python(message["id"])
+        try:
+            request, error = CLIENT_REQUEST.validate_python(message), None
+        except ValidationError as e:
+            request, error = None, describe(e, "request", method)
+        return ParsedRequest.model_construct(
+            id=request_id, method=method, params=params, request=request, error=error
+        )
+
+    try:
+        notification, error = CLIENT_NOTIFICATION.validate_python(message), None
+    except ValidationError as e:
+        notification, error = None, describe(e, "notification", method)
+    return ParsedNotification.model_construct(
+        method=method, params=params, notification=notification, error=error
+    )
+
+
+class PayloadTooLarge(Exception):
+    pass
+
+
+class JSONArraySplitter:
+    """Splits a JSON array into the bytes of its elements while it arrives in chunks.
+
+    Only strings and nesting are tracked, to find the commas between elements
+    and the bracket closing the array, and everything in between is skipped
+    by regexes. Each element is parsed on its own, which also checks its
+    syntax. `feed` takes the bytes after the opening bracket and keeps only
+    the element that is still incomplete.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._elements = 0
+        self.done = False
+
+    def _element(self, data: bytearray, last: bool) -> Optional[bytes]:
+        data = bytes(data).strip(WHITESPACE)
+        if data:
+            self._elements += 1
+            return data
+        if last and self._elements == 0:
+            return None  # An empty array
+        raise ValueError("missing batch entry")
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        buffer = self._buffer
+        buffer += chunk
+        if self.done:
+            if buffer.strip(WHITESPACE):
+                raise ValueError("trailing data after the batch")
+            buffer.clear()
+            return []
+
+        elements = []
+        start, position = 0, self._position
+        while True:
+            if self._in_string:
+                match = STRING_REST.match(buffer, position)
+                position = match.end()
+                if not match.group(1):
+                    break
+                self._in_string = False
+
+            skip = SKIP_NESTED if self._depth else SKIP_TOP_LEVEL
+            index = skip.match(buffer, position).end()
+            if index == len(buffer):
+                position = index
+                break
+            char, position = buffer[index], index + 1
+            if char == QUOTE:
+                # A string that goes on in the next chunk
+                self._in_string = True
+            elif char in OPENING:
+                self._depth += 1
+            elif self._depth > 0:
+                self._depth -= 1
+            elif char == COMMA:
+                elements.append(self._element(buffer[start:index], False))
+                start = position
+            elif char == CLOSING_BRACKET:
+                element = self._element(buffer[start:index], True)
+                if element is not None:
+                    elements.append(element)
+                self.done = True
+                if buffer[position:].strip(WHITESPACE):
+                    raise ValueError("trailing data after the batch")
+                start = position = len(buffer)
+                break
+            else:
+                raise ValueError("unbalanced brackets")
+
+        del buffer[:start]
+        self._position = position - start
+        return elements
+
+    def close(self):
+        if not self.done:
+            raise ValueError("the batch is not closed")
+
+
+async def parse_stream(
+    chunks: AsyncIterable[bytes],
+    max_bytes: int = MCP_MAX_BODY_BYTES,
+    max_batch_size: int = MCP_MAX_BATCH_SIZE,
+) -> AsyncIterator[JSONRPC]:
+    """Parse a POST body while it arrives, yielding each message once it is complete.
+
+    A batch that arrives in more than one chunk is split into its entries as
+    the bytes come in, so the first entries can be processed while the rest
+    is still being received, and only one incomplete entry is held in memory.
+    A single message, or a batch that fits in one chunk, is parsed whole.
+
+    Raises `PayloadTooLarge` once the body exceeds `max_bytes` or the batch
+    exceeds `max_batch_size` entries, `ValueError` for invalid JSON and
+    `ValidationError` for messages that are no JSON-RPC at all."""
+    received = entries = 0
+    body = bytearray()
+    splitter: Optional[JSONArraySplitter] = None
+    async for chunk in chunks:
+        received += len(chunk)
+        if received > max_bytes:
+            raise PayloadTooLarge(f"The body exceeds {max_bytes} bytes")
+
+        if splitter is None:
+            if body[:1] != b"[":
+                # Leading whitespace is dropped, so the first byte tells a batch
+                body += chunk if body else chunk.lstrip(WHITESPACE)
+                continue
+            splitter, chunk = JSONArraySplitter(), bytes(body[1:]) + chunk
+            body.clear()
+
+        for element in splitter.feed(chunk):
+            entries += 1
+            if entries > max_batch_size:
+                raise PayloadTooLarge(
+                    f"The batch has more than {max_batch_size} entries"
+                )
+            yield parse_message(from_json(element))
+
+    if splitter is not None:
+        splitter.close()
+        return
+
+    data = from_json(body)
+    if not isinstance(data, list):
+        yield parse_message(data)
+        return
+    if len(data) > max_batch_size:
+        raise PayloadTooLarge(f"The batch has more than {max_batch_size} entries")
+    for message in data:
+        yield parse_message(message)
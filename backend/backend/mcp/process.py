@@ -1,37 +1,88 @@
-from typing import TypeAlias
+import asyncio
+import inspect
+from typing import AsyncIterable, AsyncIterator, Awaitable, Optional, Set
+from pydantic import ConfigDict
 from backend.mcp.schema import (
-    Tool,
     JSONRPCRequest,
     JSONRPCNotification,
     JSONRPCResponse,
     ClientRequest,
     Result,
+    CallToolResult,
+    TextContent,
     InitializeResult,
     EmptyResult,
     Implementation,
     ServerCapabilities,
     ToolsCapabilities,
-    ListToolsResult,
-    CallToolResult,
-    TextContent,
+    ResourcesCapabilities,
+    CompletionsCapabilities,
+    ListResourceTemplatesResult,
+    JSONRPCError,
     InitializeRequest as InitializeRequestBase,
     ListToolsRequest as ListToolsRequestBase,
     CallToolRequest as CallToolRequestBase,
     PingRequest as PingRequestBase,
+    ListResourcesRequest as ListResourcesRequestBase,
+    ListResourceTemplatesRequest as ListResourceTemplatesRequestBase,
+    ReadResourceRequest as ReadResourceRequestBase,
+    SubscribeRequest as SubscribeRequestBase,
+    UnsubscribeRequest as UnsubscribeRequestBase,
+    CompleteRequest as CompleteRequestBase,
+)
+from backend.auth.utils import User
+from backend.mcp.context import (
+    Caller,
+    ToolCancelled,
+    ToolContext,
+    in_flight,
+    progress_token,
 )
-from backend.auth.utils import User, db_in_memory
+from backend.mcp.executors import DEFAULT, run_sync
+from backend.mcp.idempotency import idempotency
+from backend.mcp.parsing import (
+    JSONRPC,
+    REQUEST_ID,
+    ParsedNotification,
+    ParsedRequest,
+    parse_message,
+)
+from backend.mcp.streams import dump_message, stream_key
+from backend.mcp.resources import (
+    RESOURCE_TEMPLATES,
+    complete,
+    get_blog_post,
+    list_resources,
+    read_resource,
+    subscriptions,
+)
+from backend.mcp.tools.cache import result_cache
+from backend.mcp.tools.registry import registry
 from abc import ABC, abstractmethod
 from functools import lru_cache
 import os
 
-JSONRPC: TypeAlias = JSONRPCRequest | JSONRPCNotification | JSONRPCResponse
+# Maximum number of entries of one batch processed at the same time
+MCP_BATCH_CONCURRENCY = int(os.environ.get("MCP_BATCH_CONCURRENCY", "8"))
+
+
+class SerializedResult(Result):
+    """A result serialized ahead of time, spliced into the response as is.
+
+    `etag` is only set for results that clients may revalidate, i.e. the tool list.
+    """
+
+    serialized: bytes
+    etag: Optional[str] = None
 
 
 class Processable(ABC):
     user: User  # For authorization and filtering data based on user
 
+    # `process` may also be a coroutine function. A synchronous `process` runs
+    # on the event loop, so it must be cheap; slow work belongs in a tool.
     @abstractmethod
-    def process(self) -> Result: ...
+    def process(self) -> Result | Awaitable[Result]: ...
 
 
 class InitializeRequest(Processable, InitializeRequestBase):
@@ -41,124 +92,108 @@ class InitializeRequest(Processable, InitializeRequestBase):
         return InitializeResult(
             serverInfo=Implementation(name="My MCP Server", version="0.0.1"),
             protocolVersion="2025-06-18",
-            capabilities=ServerCapabilities(tools=ToolsCapabilities(listChanged=False)),
+            capabilities=ServerCapabilities(
+                tools=ToolsCapabilities(listChanged=True),
+                resources=ResourcesCapabilities(subscribe=True, listChanged=False),
+                completions=CompletionsCapabilities(),
+            ),
             instructions="Optional instructions for the client",
         )
 
 
 class ListToolsRequest(Processable, ListToolsRequestBase):
     def process(self) -> Result:
-        return ListToolsResult(
-            tools=[
-                Tool(
-                    name="read_blog_post",
-                    description="Read a blog post that the user wrote",
-                    inputSchema={"blog_post_id": {"type": "str"}},
-                ),
-                Tool(
-                    name="create_blog_post",
-                    description="Create a new blog post",
-                    inputSchema={
-                        "content": {
-                            "type": "str",
-                            "description": "Content of the blog post",
-                        }
-                    },
-                ),
-                Tool(
-                    name="update_blog_post",
-                    description="Update an existing blog post",
-                    inputSchema={
-                        "blog_post_id": {"type": "str"},
-                        "new_content": {
-                            "type": "str",
-                            "description": "New content of the blog post",
-                        },
-                    },
-                ),
-            ]
-        )
+        etag, serialized = registry.list_tools_json()
+        return SerializedResult(etag=etag, serialized=serialized)
 
 
 class CallToolRequest(Processable, CallToolRequestBase):
-    def process(self) -> Result:
-        if self.params.name == "read_blog_post":
-            return self.read_blog_post()
-        elif self.params.name == "create_blog_post":
-            return self.create_blog_post()
-        elif self.params.name == "update_blog_post":
-            return self.update_blog_post()
-        else:
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    context: ToolContext
+
+    async def process(self) -> Result:
+        registered = registry.get(self.params.name)
+        if registered is None:
             raise ValueError(f"Tool name {self.params.name} not Found")
 
-    def read_blog_post(self):
-        blog_post_id = int(self.params.arguments["blog_post_id"])
-
-        for blog_post_dict in db_in_memory["blog_posts"]:
-            if (
-                blog_post_dict["user_id"] == self.user.id
-                and blog_post_dict["id"] == blog_post_id
-            ):
-                return CallToolResult(
-                    content=[
-                        TextContent(
-                            text=f"Here is the content of the blog post {blog_post_id} authored by {self.user.username}\n\n{blog_post_dict['content']}"
-                        )
-                    ],
-                )
-
-        return CallToolResult(
-            content=[
-                TextContent(
-                    text=f"Blog post {blog_post_id} not found for user {self.user.id}"
-                )
-            ],
-            isError=True,
-        )
+        arguments = self.params.arguments or {}
+        # Before the cache and the handler, so bad calls cost no store access
+        errors = registered.validate(arguments)
+        if errors:
+            return CallToolResult(
+                content=[
+                    TextContent(
+                        text=f"Invalid arguments for tool {self.params.name}: {'; '.join(errors)}"
+                    )
+                ],
+                isError=True,
+            )
 
-    def create_blog_post(self):
-        new_blog_post_id = len(db_in_memory["blog_posts"]) + 1
-        blog_post_dict = {
-            "id": new_blog_post_id,
-            "user_id": self.user.id,
-            "content": self.params.arguments["content"],
-        }
-        db_in_memory["blog_posts"].append(blog_post_dict)
-
-        return CallToolResult(
-            content=[
-                TextContent(
-                    text=f"New blog post {new_blog_post_id} is successfully created by {self.user.username}"
-                )
-            ]
-        )
+        if registered.cache_tags is not None:
+            key = result_cache.key(self.user.id, self.params.name, arguments)
+            cached = result_cache.get(key)
+            if cached is not None:
+                return SerializedResult(serialized=cached.serialized)
+            generation = result_cache.generation(self.user.id)
+
+        args = (self.user, arguments)
+        if registered.takes_context:
+            args += (self.context,)
 
-    def update_blog_post(self):
-        blog_post_id = int(self.params.arguments["blog_post_id"])
-
-        for blog_post_dict in db_in_memory["blog_posts"]:
-            if (
-                blog_post_dict["user_id"] == self.user.id
-                and blog_post_dict["id"] == blog_post_id
-            ):
-                blog_post_dict["content"] = self.params.arguments["new_content"]
-
-                return CallToolResult(
-                    content=[
-                        TextContent(
-                            text=f"Existing blog post {blog_post_id} is successfully updated by {self.user.username}"
-                        )
-                    ],
-                )
-
-        return CallToolResult(
-            content=[
-                TextContent(
-                    text=f"Blog post {blog_post_id} not found for user {self.user.id}"
-                )
-            ],
-            isError=True,
+        if inspect.iscoroutinefunction(registered.handler):
+            result = await registered.handler(*args)
+        else:
+            result = await run_sync(registered.executor, registered.handler, *args)
+
+        if registered.cache_tags is None or result.isError:
+            return result
+        cached = result_cache.put(
+            key,
+            registered.cache_tags(arguments),
+            generation,
+            dump_message(result),
         )
+        return SerializedResult(serialized=cached.serialized)
+
+
+class ListResourcesRequest(Processable, ListResourcesRequestBase):
+    async def process(self) -> Result:
+        cursor = self.params.cursor if self.params else None
+        return await run_sync(DEFAULT, list_resources, self.user, cursor)
+
+
+class ListResourceTemplatesRequest(Processable, ListResourceTemplatesRequestBase):
+    def process(self) -> Result:
+        return ListResourceTemplatesResult(resourceTemplates=RESOURCE_TEMPLATES)
+
+
+class ReadResourceRequest(Processable, ReadResourceRequestBase):
+    async def process(self) -> Result:
+        return await run_sync(DEFAULT, read_resource, self.user, self.params.uri)
+
+
+class SubscribeRequest(Processable, SubscribeRequestBase):
+    caller_key: str
+
+    async def process(self) -> Result:
+        # Only the author may watch a post, this raises for anyone else
+        await run_sync(DEFAULT, get_blog_post, self.user, self.params.uri)
+        subscriptions.subscribe(self.caller_key, self.params.uri)
+        return EmptyResult()
+
+
+class UnsubscribeRequest(Processable, UnsubscribeRequestBase):
+    caller_key: str
+
+    def process(self) -> Result:
+        subscriptions.unsubscribe(self.caller_key, self.params.uri)
+        return EmptyResult()
+
+
+class CompleteRequest(Processable, CompleteRequestBase):
+    async def process(self) -> Result:
+        return await run_sync(DEFAULT, complete, self.user, self.params)
 
 
 class PingRequest(Processable, PingRequestBase):
@@ -166,25 +201,83 @@ class PingRequest(Processable, PingRequestBase):
         return EmptyResult()
 
 
-def process_rpc(rpc: JSONRPC, user: User):
+def process_notification(notification: ParsedNotification, caller: Caller):
+    if notification.error is not None:
+        raise ValueError(notification.error)
+
+    match notification.method:
+        case "notifications/initialized":
+            pass
+        case "notifications/cancelled":
+            # https://modelcontextprotocol.io/specification/2025-06-18/basic/utilities/cancellation
+            in_flight.cancel(caller.key, notification.notification.params.requestId)
+        case _:
+            raise ValueError(f"Unknown notification method: {notification.method}")
+
+
+async def process_rpc(rpc: JSONRPC, caller: Caller) -> Optional[JSONRPCResponse]:
+    if isinstance(rpc, (JSONRPCRequest, JSONRPCNotification)) and not isinstance(
+        rpc, (ParsedRequest, ParsedNotification)
+    ):
+        rpc = parse_message(rpc.model_dump(exclude_none=True))
+    if isinstance(rpc, JSONRPCNotification):
+        process_notification(rpc, caller)
+        return None
     if not isinstance(rpc, JSONRPCRequest):
         raise NotImplementedError(f"{rpc.__class__} is not implemented")
+    if rpc.error is not None:
+        raise ValueError(rpc.error)
 
+    # The params were validated while parsing, so the requests are built as is
+    user = caller.user
+    params = rpc.request.params
     request: ClientRequest = None
+    context: Optional[ToolContext] = None
 
     match rpc.method:
         case "initialize":
-            request = InitializeRequest(user=user, params=rpc.params)
+            request = InitializeRequest.model_construct(user=user, params=params)
         case "ping":
-            request = PingRequest(user=user)
+            request = PingRequest.model_construct(user=user, params=params)
         case "tools/list":
-            request = ListToolsRequest(user=user, params=rpc.params)
+            request = ListToolsRequest.model_construct(user=user, params=params)
         case "tools/call":
-            request = CallToolRequest(user=user, params=rpc.params)
+            context = ToolContext(caller, rpc.id, progress_token(rpc.params))
+            request = CallToolRequest.model_construct(
+                user=user, params=params, context=context
+            )
+        case "resources/list":
+            request = ListResourcesRequest.model_construct(user=user, params=params)
+        case "resources/templates/list":
+            request = ListResourceTemplatesRequest.model_construct(
+                user=user, params=params
+            )
+        case "resources/read":
+            request = ReadResourceRequest.model_construct(user=user, params=params)
+        case "resources/subscribe":
+            request = SubscribeRequest.model_construct(
+                user=user, params=params, caller_key=caller.key
+            )
+        case "resources/unsubscribe":
+            request = UnsubscribeRequest.model_construct(
+                user=user, params=params, caller_key=caller.key
+            )
+        case "completion/complete":
+            request = CompleteRequest.model_construct(user=user, params=params)
         case _:
             raise ValueError(f"Unknown request method: {rpc.method}")
 
-    result: Result = request.process()
+    if context is not None and replays_retries(caller, params.name):
+        # Retries of a call that already ran, or still runs, get its response
+        return await idempotency.run(
+            caller.key, rpc, lambda: call_tool(rpc, request, context)
+        )
+    if context is not None:
+        return await call_tool(rpc, request, context)
+
+    result = request.process()
+    if inspect.isawaitable(result):
+        result = await result
 
     return JSONRPCResponse(
         id=rpc.id,
@@ -192,6 +285,143 @@ def process_rpc(rpc: JSONRPC, user: User):
     )
 
 
+def replays_retries(caller: Caller, name: str) -> bool:
+    """Whether a repeated tools/call is a retry that gets the first call's response.
+
+    Only calls of tools that write, since repeating a read-only one is
+    harmless, `result_cache` already serves it, and a replayed read would
+    hide the writes made since. And only within a session, where request ids
+    are never reused, while clients without one reuse them, e.g. the webview
+    sends id 1 on every call."""
+    registered = registry.get(name)
+    annotations = registered.definition.annotations if registered else None
+    read_only = annotations is not None and bool(annotations.readOnlyHint)
+    return not read_only and caller.key != stream_key(None, caller.user)
+
+
+async def call_tool(
+    rpc: JSONRPCRequest, request: CallToolRequest, context: ToolContext
+) -> Optional[JSONRPCResponse]:
+    # A task of its own, so `notifications/cancelled` can cancel just this call
+    task = asyncio.ensure_future(request.process())
+    in_flight.add(context, task)
+    try:
+        result = await task
+    except (asyncio.CancelledError, ToolCancelled):
+        if not context.cancelled.is_set():
+            raise
+        # The receiver of a cancellation SHOULD NOT send a response for the cancelled request
+        return None
+    finally:
+        in_flight.remove(context)
+
+    return JSONRPCResponse(
+        id=rpc.id,
+        result=result,
+    )
+
+
+async def process_entry(
+    rpc: JSONRPC, caller: Caller
+) -> Optional[JSONRPCResponse | JSONRPCError]:
+    """Process one message, turning a failure into an error response of its own"""
+    try:
+        return await process_rpc(rpc, caller)
+    except Exception as e:
+        if hasattr(rpc, "id"):
+            return JSONRPCError(id=rpc.id, error={"message": str(e)})
+        return None
+
+
+async def process_batch(
+    rpcs: AsyncIterable[JSONRPC], caller: Caller
+) -> AsyncIterator[JSONRPCResponse | JSONRPCError]:
+    """Process a batch while it is parsed and yield each response as soon as it is ready.
+
+    Entries are independent and start in request order, at most
+    MCP_BATCH_CONCURRENCY at a time, so responses come out in completion
+    order. The next entry is only read once it may start, so a long batch is
+    never held in memory whole. An `initialize` entry runs alone, after the
+    entries before it and before the ones after it, since nothing else may
+    run during initialization.
+    """
+    semaphore = asyncio.Semaphore(MCP_BATCH_CONCURRENCY)
+    responses: asyncio.Queue[Optional[JSONRPCResponse | JSONRPCError]] = asyncio.Queue()
+    tasks: Set[asyncio.Future] = set()
+
+    async def process_limited(rpc: JSONRPC):
+        try:
+            response = await process_entry(rpc, caller)
+            if response is not None:
+                responses.put_nowait(response)
+        finally:
+            semaphore.release()
+
+    async def feed():
+        try:
+            entries = aiter(rpcs)
+            while True:
+                await semaphore.acquire()
+                try:
+                    rpc = await anext(entries)
+                except BaseException:
+                    semaphore.release()
+                    raise
+                if getattr(rpc, "method", None) != "initialize":
+                    task = asyncio.ensure_future(process_limited(rpc))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                    continue
+                # Waits for every running entry by taking all the permits
+                for _ in range(MCP_BATCH_CONCURRENCY - 1):
+                    await semaphore.acquire()
+                try:
+                    response = await process_entry(rpc, caller)
+                finally:
+                    for _ in range(MCP_BATCH_CONCURRENCY):
+                        semaphore.release()
+                if response is not None:
+                    responses.put_nowait(response)
+        except StopAsyncIteration:
+            await asyncio.gather(*tasks)
+        finally:
+            # Every response is queued before this
+            responses.put_nowait(None)
+
+    feeder = asyncio.ensure_future(feed())
+    try:
+        while (response := await responses.get()) is not None:
+            yield response
+        # Raises what reading the batch raised
+        await feeder
+    finally:
+        # The client went away before the batch finished
+        feeder.cancel()
+        for task in list(tasks):
+            task.cancel()
+
+
+def dump_response(
+    response: JSONRPCResponse | JSONRPCError | JSONRPCNotification,
+) -> bytes:
+    if not isinstance(response, JSONRPCResponse):
+        return dump_message(response)
+
+    result = response.result
+    if isinstance(result, SerializedResult):
+        serialized = result.serialized
+    else:
+        serialized = dump_message(result)
+    return (
+        b'{"jsonrpc":"2.0","id":'
+        # Written around the result instead of dumping the envelope model
+        + REQUEST_ID.dump_json(response.id)
+        + b',"result":'
+        + serialized
+        + b"}"
+    )
+
+
 @lru_cache
 def get_mcp_version():
     path = os.path.join(os.path.dirname(__file__), "VERSION")
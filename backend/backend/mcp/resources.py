@@ -0,0 +1,167 @@
+import re
+import threading
+from typing import Dict, Optional, Set
+from backend.auth.utils import User
+from backend.db import get_blog_post_id_index, get_blog_post_repository
+from backend.db.base import BlogPost, decode_cursor, encode_cursor, sort_key
+from backend.mcp.schema import (
+    CompleteRequestParams,
+    CompleteResult,
+    CompletionValues,
+    JSONRPCNotification,
+    ListResourcesResult,
+    ReadResourceResult,
+    Resource,
+    ResourceTemplate,
+    ResourceUpdatedNotification,
+    TextResourceContents,
+)
+from backend.mcp.streams import streams
+
+BLOG_POST_URI_TEMPLATE = "blog://posts/{blog_post_id}"
+BLOG_POST_URI = re.compile(r"blog://posts/(\d+)")
+RESOURCES_PAGE_SIZE = 100
+# The most values a completion may return
+COMPLETION_MAX_VALUES = 100
+
+RESOURCE_TEMPLATES = [
+    ResourceTemplate(
+        name="blog_post",
+        title="Blog post",
+        uriTemplate=BLOG_POST_URI_TEMPLATE,
+        description="A blog post that the user wrote",
+        mimeType="text/plain",
+    )
+]
+
+
+def blog_post_uri(blog_post_id: int) -> str:
+    return BLOG_POST_URI_TEMPLATE.format(blog_post_id=blog_post_id)
+
+
+def parse_blog_post_uri(uri: str) -> int:
+    match = BLOG_POST_URI.fullmatch(uri)
+    if match is None:
+        raise ValueError(f"Unknown resource URI: {uri}")
+    return int(match.group(1))
+
+
+def get_blog_post(user: User, uri: str) -> BlogPost:
+    blog_post = get_blog_post_repository().get(user.id, parse_blog_post_uri(uri))
+    if blog_post is None:
+        raise ValueError(f"Resource not found: {uri}")
+    return blog_post
+
+
+def list_resources(user: User, cursor: Optional[str] = None) -> ListResourcesResult:
+    after = None
+    if cursor:
+        order_by, descending, after = decode_cursor(cursor)
+        if order_by != "id" or descending:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+    # Fetch one extra row to know whether there is a next page
+    blog_posts = get_blog_post_repository().list_page(
+        user.id, "id", False, after, RESOURCES_PAGE_SIZE + 1
+    )
+    next_cursor = None
+    if len(blog_posts) > RESOURCES_PAGE_SIZE:
+        blog_posts = blog_posts[:RESOURCES_PAGE_SIZE]
+        next_cursor = encode_cursor("id", False, sort_key(blog_posts[-1], "id"))
+
+    return ListResourcesResult(
+        resources=[
+            Resource(
+                uri=blog_post_uri(blog_post.id),
+                name=f"blog_post_{blog_post.id}",
+                title=f"Blog post {blog_post.id}",
+                mimeType="text/plain",
+            )
+            for blog_post in blog_posts
+        ],
+        nextCursor=next_cursor,
+    )
+
+
+def read_resource(user: User, uri: str) -> ReadResourceResult:
+    blog_post = get_blog_post(user, uri)
+    return ReadResourceResult(
+        contents=[
+            TextResourceContents(uri=uri, text=blog_post.content, mimeType="text/plain")
+        ]
+    )
+
+
+def complete(user: User, params: CompleteRequestParams) -> CompleteResult:
+    ref, argument = params.ref, params.argument
+    # There are no prompts, only the blog post template has an argument
+    if ref.type != "ref/resource":
+        raise ValueError(f"No completions for prompt {ref.name}")
+    if ref.uri != BLOG_POST_URI_TEMPLATE:
+        raise ValueError(f"No completions for resource {ref.uri}")
+    if argument.name != "blog_post_id":
+        raise ValueError(f"Unknown argument: {argument.name}")
+
+    values, total = get_blog_post_id_index().complete(
+        user.id, argument.value, COMPLETION_MAX_VALUES
+    )
+    return CompleteResult(
+        completion=CompletionValues(
+            values=values, total=total, hasMore=total > len(values)
+        )
+    )
+
+
+class Subscriptions:
+    """Which callers (sessions, or users without one) subscribed to which resource URIs.
+
+    `notify_updated` publishes `notifications/resources/updated` on the
+    server-to-client stream of every subscriber of the URI.
+    """
+
+    def __init__(self):
+        self._callers_by_uri: Dict[str, Set[str]] = {}
+        self._uris_by_caller: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, caller_key: str, uri: str):
+        with self._lock:
+            self._callers_by_uri.setdefault(uri, set()).add(caller_key)
+            self._uris_by_caller.setdefault(caller_key, set()).add(uri)
+
+    def unsubscribe(self, caller_key: str, uri: str):
+        with self._lock:
+            self._discard(caller_key, uri)
+
+    def unsubscribe_all(self, caller_key: str):
+        with self._lock:
+            for uri in list(self._uris_by_caller.get(caller_key, ())):
+                self._discard(caller_key, uri)
+
+    def _discard(self, caller_key: str, uri: str):
+        callers = self._callers_by_uri.get(uri)
+        if callers is not None:
+            callers.discard(caller_key)
+            if not callers:
+                del self._callers_by_uri[uri]
+        uris = self._uris_by_caller.get(caller_key)
+        if uris is not None:
+            uris.discard(uri)
+            if not uris:
+                del self._uris_by_caller[caller_key]
+
+    def notify_updated(self, uri: str):
+        with self._lock:
+            callers = list(self._callers_by_uri.get(uri, ()))
+        if not callers:
+            return
+
+        notification = ResourceUpdatedNotification(params={"uri": uri})
+        message = JSONRPCNotification(
+            method=notification.method, params=notification.params.model_dump()
+        )
+        for caller_key in callers:
+            streams.get(caller_key).publish(message)
+
+
+subscriptions = Subscriptions()
@@ -1,11 +1,15 @@
-# This file is auto-generated based on https://raw.githubusercontent.com/modelcontextprotocol/modelcontextprotocol/main/schema/2025-06-18/schema.json - do not modify manually.
+# This file is auto-generated from schema.json by scripts/generate_schema.py - do not modify manually.
 
 from enum import StrEnum
-from typing import Any, Dict, List, Optional, Literal, Union, TypeAlias
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Dict, List, Literal, Optional, TypeAlias, Union
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SchemaModel(BaseModel):
+    # Validators are built on first use, most models are never used by the server
+    model_config = ConfigDict(defer_build=True)
 
 
-# Enums
 class Role(StrEnum):
     """The sender or recipient of messages and data in a conversation."""
 
@@ -13,30 +17,7 @@ class Role(StrEnum):
     USER = "user"
 
 
-class LoggingLevel(StrEnum):
-    """The severity of a log message.
-
-    These map to syslog message severities, as specified in RFC-5424:
-    https://datatracker.ietf.org/doc/html/rfc5424#section-6.2.1"""
-
-    ALERT = "alert"
-    CRITICAL = "critical"
-    DEBUG = "debug"
-    EMERGENCY = "emergency"
-    ERROR = "error"
-    INFO = "info"
-    NOTICE = "notice"
-    WARNING = "warning"
-
-
-# Type aliases
-RequestId: TypeAlias = Union[str, int]
-Cursor: TypeAlias = str
-ProgressToken: TypeAlias = Union[str, int]
-
-
-# Models
-class Annotations(BaseModel):
+class Annotations(SchemaModel):
     """Optional annotations for the client. The client can use annotations to inform how objects are used or displayed"""
 
     audience: Optional[List[Role]] = Field(
@@ -46,8 +27,6 @@ class Annotations(BaseModel):
     priority: Optional[float] = Field(
         None,
         description='Describes how important this data is for operating the server.\n\nA value of 1 means "most important," and indicates that the data is\neffectively required, while 0 means "least important," and indicates that\nthe data is entirely optional.',
-        ge=0,
-        le=1,
     )
     lastModified: Optional[str] = Field(
         None,
@@ -55,34 +34,10 @@ class Annotations(BaseModel):
     )
 
 
-class TextContent(BaseModel):
-    """Text provided to or from an LLM."""
-
-    type: Literal["text"] = "text"
-    text: str = Field(description="The text content of the message.")
-    annotations: Optional[Annotations] = Field(
-        None, description="Optional annotations for the client."
-    )
-    _meta: Optional[Dict[str, Any]] = None
-
-
-class ImageContent(BaseModel):
-    """An image provided to or from an LLM."""
-
-    type: Literal["image"] = "image"
-    data: str = Field(description="The base64-encoded image data.")
-    mimeType: str = Field(
-        description="The MIME type of the image. Different providers may support different image types."
-    )
-    annotations: Optional[Annotations] = Field(
-        None, description="Optional annotations for the client."
-    )
-    _meta: Optional[Dict[str, Any]] = None
-
-
-class AudioContent(BaseModel):
+class AudioContent(SchemaModel):
     """Audio provided to or from an LLM."""
 
+    _meta: Optional[Dict[str, Any]] = None
     type: Literal["audio"] = "audio"
     data: str = Field(description="The base64-encoded audio data.")
     mimeType: str = Field(
@@ -91,21 +46,22 @@ class AudioContent(BaseModel):
     annotations: Optional[Annotations] = Field(
         None, description="Optional annotations for the client."
     )
-    _meta: Optional[Dict[str, Any]] = None
 
 
-class TextResourceContents(BaseModel):
-    uri: str = Field(description="The URI of this resource.")
-    text: str = Field(
-        description="The text of the item. This must only be set if the item can actually be represented as text (not binary data)."
+class BaseMetadata(SchemaModel):
+    """Base interface for metadata with name (identifier) and title (display name) properties."""
+
+    name: str = Field(
+        description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
     )
-    mimeType: Optional[str] = Field(
-        None, description="The MIME type of this resource, if known."
+    title: Optional[str] = Field(
+        None,
+        description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
     )
-    _meta: Optional[Dict[str, Any]] = None
 
 
-class BlobResourceContents(BaseModel):
+class BlobResourceContents(SchemaModel):
+    _meta: Optional[Dict[str, Any]] = None
     uri: str = Field(description="The URI of this resource.")
     blob: str = Field(
         description="A base64-encoded string representing the binary data of the item."
@@ -113,15 +69,63 @@ class BlobResourceContents(BaseModel):
     mimeType: Optional[str] = Field(
         None, description="The MIME type of this resource, if known."
     )
+
+
+class BooleanSchema(SchemaModel):
+    type: Literal["boolean"] = "boolean"
+    title: Optional[str] = None
+    description: Optional[str] = None
+    default: Optional[bool] = None
+
+
+class CallToolRequestParams(SchemaModel):
+    name: str
+    arguments: Optional[Dict[str, Any]] = None
+
+
+class CallToolRequest(SchemaModel):
+    """Used by the client to invoke a tool provided by the server."""
+
+    method: Literal["tools/call"] = "tools/call"
+    params: CallToolRequestParams
+
+
+class Result(SchemaModel):
+    _meta: Optional[Dict[str, Any]] = None
+
+
+class TextContent(SchemaModel):
+    """Text provided to or from an LLM."""
+
+    _meta: Optional[Dict[str, Any]] = None
+    type: Literal["text"] = "text"
+    text: str = Field(description="The text content of the message.")
+    annotations: Optional[Annotations] = Field(
+        None, description="Optional annotations for the client."
+    )
+
+
+class ImageContent(SchemaModel):
+    """An image provided to or from an LLM."""
+
     _meta: Optional[Dict[str, Any]] = None
+    type: Literal["image"] = "image"
+    data: str = Field(description="The base64-encoded image data.")
+    mimeType: str = Field(
+        description="The MIME type of the image. Different providers may support different image types."
+    )
+    annotations: Optional[Annotations] = Field(
+        None, description="Optional annotations for the client."
+    )
 
 
-class ResourceLink(BaseModel):
+class ResourceLink(SchemaModel):
     """A resource that the server is capable of reading, included in a prompt or tool call result.
 
     Note: resource links returned by tools are not guaranteed to appear in the results of `resources/list` requests.
     """
 
+    _meta: Optional[Dict[str, Any]] = None
     type: Literal["resource_link"] = "resource_link"
     name: str = Field(
         description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
@@ -145,127 +149,93 @@ class ResourceLink(BaseModel):
     annotations: Optional[Annotations] = Field(
         None, description="Optional annotations for the client."
     )
+
+
+class TextResourceContents(SchemaModel):
     _meta: Optional[Dict[str, Any]] = None
+    uri: str = Field(description="The URI of this resource.")
+    text: str = Field(
+        description="The text of the item. This must only be set if the item can actually be represented as text (not binary data)."
+    )
+    mimeType: Optional[str] = Field(
+        None, description="The MIME type of this resource, if known."
+    )
 
 
-class EmbeddedResource(BaseModel):
+class EmbeddedResource(SchemaModel):
     """The contents of a resource, embedded into a prompt or tool call result.
 
     It is up to the client how best to render embedded resources for the benefit
     of the LLM and/or the user."""
 
+    _meta: Optional[Dict[str, Any]] = None
     type: Literal["resource"] = "resource"
     resource: Union[TextResourceContents, BlobResourceContents]
     annotations: Optional[Annotations] = Field(
         None, description="Optional annotations for the client."
     )
-    _meta: Optional[Dict[str, Any]] = None
-
-
-class ContentBlock(BaseModel):
-    pass  # This is just a placeholder for Union[TextContent, ImageContent, AudioContent, ResourceLink, EmbeddedResource]
-
-
-class SamplingMessage(BaseModel):
-    """Describes a message issued to or received from an LLM API."""
 
-    role: Role
-    content: Union[TextContent, ImageContent, AudioContent]
-
-
-class PromptMessage(BaseModel):
-    """Describes a message returned as part of a prompt.
 
-    This is similar to `SamplingMessage`, but also supports the embedding of
-    resources from the MCP server."""
+class CallToolResult(Result):
+    """The server's response to a tool call."""
 
-    role: Role
-    content: Union[
-        TextContent, ImageContent, AudioContent, ResourceLink, EmbeddedResource
+    content: List[
+        Annotated[
+            Union[
+                TextContent, ImageContent, AudioContent, ResourceLink, EmbeddedResource
+            ],
+            Field(discriminator="type"),
+        ]
     ]
-
-
-class BaseMetadata(BaseModel):
-    """Base interface for metadata with name (identifier) and title (display name) properties."""
-
-    name: str = Field(
-        description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
+    structuredContent: Optional[Dict[str, Any]] = Field(
+        None,
+        description="An optional JSON object that represents the structured result of the tool call.",
     )
-    title: Optional[str] = Field(
+    isError: Optional[bool] = Field(
         None,
-        description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
+        description="Whether the tool call ended in an error.\n\nIf not set, this is assumed to be false (the call was successful).\n\nAny errors that originate from the tool SHOULD be reported inside the result\nobject, with `isError` set to true, _not_ as an MCP protocol-level error\nresponse. Otherwise, the LLM would not be able to see that an error occurred\nand self-correct.\n\nHowever, any errors in _finding_ the tool, an error indicating that the\nserver does not support tool calls, or any other exceptional conditions,\nshould be reported as an MCP error response.",
     )
 
 
-class Implementation(BaseModel):
-    """Describes the name and version of an MCP implementation, with an optional title for UI representation."""
-
-    name: str = Field(
-        description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
+class CancelledNotificationParams(SchemaModel):
+    requestId: Union[str, int] = Field(
+        description="The ID of the request to cancel.\n\nThis MUST correspond to the ID of a request previously issued in the same direction."
     )
-    version: str
-    title: Optional[str] = Field(
+    reason: Optional[str] = Field(
         None,
-        description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
+        description="An optional string describing the reason for the cancellation. This MAY be logged or presented to the user.",
     )
 
 
-class StringSchema(BaseModel):
-    type: Literal["string"] = "string"
-    title: Optional[str] = None
-    description: Optional[str] = None
-    minLength: Optional[int] = None
-    maxLength: Optional[int] = None
-    format: Optional[Literal["date", "date-time", "email", "uri"]] = None
-
-
-class NumberSchema(BaseModel):
-    type: Literal["integer", "number"]
-    title: Optional[str] = None
-    description: Optional[str] = None
-    minimum: Optional[int] = None
-    maximum: Optional[int] = None
-
-
-class BooleanSchema(BaseModel):
-    type: Literal["boolean"] = "boolean"
-    title: Optional[str] = None
-    description: Optional[str] = None
-    default: Optional[bool] = None
-
+class CancelledNotification(SchemaModel):
+    """This notification can be sent by either side to indicate that it is cancelling a previously-issued request.
 
-class EnumSchema(BaseModel):
-    type: Literal["string"] = "string"
-    title: Optional[str] = None
-    description: Optional[str] = None
-    enum: List[str]
-    enumNames: Optional[List[str]] = None
+    The request SHOULD still be in-flight, but due to communication latency, it is always possible that this notification MAY arrive after the request has already finished.
 
+    This notification indicates that the result will be unused, so any associated processing SHOULD cease.
 
-class PrimitiveSchemaDefinition(BaseModel):
-    """Restricted schema definitions that only allow primitive types
-    without nested objects or arrays."""
+    A client MUST NOT attempt to cancel its `initialize` request."""
 
-    pass
+    method: Literal["notifications/cancelled"] = "notifications/cancelled"
+    params: CancelledNotificationParams
 
 
-# Capabilities models
-class RootsCapabilities(BaseModel):
+class RootsCapabilities(SchemaModel):
     listChanged: Optional[bool] = Field(
         None,
         description="Whether the client supports notifications for changes to the roots list.",
     )
 
 
-class SamplingCapabilities(BaseModel):
-    pass  # No additional properties defined in the schema
+class SamplingCapabilities(SchemaModel):
+    pass
 
 
-class ElicitationCapabilities(BaseModel):
-    pass  # No additional properties defined in the schema
+class ElicitationCapabilities(SchemaModel):
+    pass
 
 
-class ClientCapabilities(BaseModel):
+class ClientCapabilities(SchemaModel):
     """Capabilities a client may support. Known capabilities are defined here, in this schema, but this is not a closed set: any client can define its own, additional capabilities."""
 
     roots: Optional[RootsCapabilities] = Field(
@@ -283,180 +253,243 @@ class ClientCapabilities(BaseModel):
     )
 
 
-class PromptsCapabilities(BaseModel):
-    listChanged: Optional[bool] = Field(
-        None,
-        description="Whether this server supports notifications for changes to the prompt list.",
-    )
+class InitializedNotificationParams(SchemaModel):
+    _meta: Optional[Dict[str, Any]] = None
 
 
-class ResourcesCapabilities(BaseModel):
-    listChanged: Optional[bool] = Field(
-        None,
-        description="Whether this server supports notifications for changes to the resource list.",
-    )
-    subscribe: Optional[bool] = Field(
-        None,
-        description="Whether this server supports subscribing to resource updates.",
-    )
+class InitializedNotification(SchemaModel):
+    """This notification is sent from the client to the server after initialization has finished."""
+
+    method: Literal["notifications/initialized"] = "notifications/initialized"
+    params: Optional[InitializedNotificationParams] = None
 
 
-class ToolsCapabilities(BaseModel):
-    listChanged: Optional[bool] = Field(
+class ProgressNotificationParams(SchemaModel):
+    progressToken: Union[str, int] = Field(
+        description="The progress token which was given in the initial request, used to associate this notification with the request that is proceeding."
+    )
+    progress: float = Field(
+        description="The progress thus far. This should increase every time progress is made, even if the total is unknown."
+    )
+    total: Optional[float] = Field(
         None,
-        description="Whether this server supports notifications for changes to the tool list.",
+        description="Total number of items to process (or total progress required), if known.",
+    )
+    message: Optional[str] = Field(
+        None, description="An optional message describing the current progress."
     )
 
 
-class LoggingCapabilities(BaseModel):
-    pass  # No additional properties defined in the schema
+class ProgressNotification(SchemaModel):
+    """An out-of-band notification used to inform the receiver of a progress update for a long-running request."""
 
+    method: Literal["notifications/progress"] = "notifications/progress"
+    params: ProgressNotificationParams
 
-class CompletionsCapabilities(BaseModel):
-    pass  # No additional properties defined in the schema
 
+class RootsListChangedNotificationParams(SchemaModel):
+    _meta: Optional[Dict[str, Any]] = None
 
-class ServerCapabilities(BaseModel):
-    """Capabilities that a server may support. Known capabilities are defined here, in this schema, but this is not a closed set: any server can define its own, additional capabilities."""
 
-    prompts: Optional[PromptsCapabilities] = Field(
-        None, description="Present if the server offers any prompt templates."
-    )
-    resources: Optional[ResourcesCapabilities] = Field(
-        None, description="Present if the server offers any resources to read."
-    )
-    tools: Optional[ToolsCapabilities] = Field(
-        None, description="Present if the server offers any tools to call."
-    )
-    logging: Optional[LoggingCapabilities] = Field(
-        None,
-        description="Present if the server supports sending log messages to the client.",
-    )
-    completions: Optional[CompletionsCapabilities] = Field(
-        None,
-        description="Present if the server supports argument autocompletion suggestions.",
-    )
-    experimental: Optional[Dict[str, Dict[str, Any]]] = Field(
-        None,
-        description="Experimental, non-standard capabilities that the server supports.",
+class RootsListChangedNotification(SchemaModel):
+    """A notification from the client to the server, informing it that the list of roots has changed.
+    This notification should be sent whenever the client adds, removes, or modifies any root.
+    The server should then request an updated list of roots using the ListRootsRequest.
+    """
+
+    method: Literal["notifications/roots/list_changed"] = (
+        "notifications/roots/list_changed"
     )
+    params: Optional[RootsListChangedNotificationParams] = None
 
 
-# Resource models
-class Resource(BaseModel):
-    """A known resource that the server is capable of reading."""
+ClientNotification: TypeAlias = Annotated[
+    Union[
+        CancelledNotification,
+        InitializedNotification,
+        ProgressNotification,
+        RootsListChangedNotification,
+    ],
+    Field(discriminator="method"),
+]
+
+
+class Implementation(SchemaModel):
+    """Describes the name and version of an MCP implementation, with an optional title for UI representation."""
 
     name: str = Field(
         description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
     )
-    uri: str = Field(description="The URI of this resource.")
+    version: str
     title: Optional[str] = Field(
         None,
         description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
     )
-    description: Optional[str] = Field(
-        None,
-        description='A description of what this resource represents.\n\nThis can be used by clients to improve the LLM\'s understanding of available resources. It can be thought of like a "hint" to the model.',
-    )
-    mimeType: Optional[str] = Field(
-        None, description="The MIME type of this resource, if known."
-    )
-    size: Optional[int] = Field(
-        None,
-        description="The size of the raw resource content, in bytes (i.e., before base64 encoding or any tokenization), if known.\n\nThis can be used by Hosts to display file sizes and estimate context window usage.",
-    )
-    annotations: Optional[Annotations] = Field(
-        None, description="Optional annotations for the client."
+
+
+class InitializeRequestParams(SchemaModel):
+    clientInfo: Implementation
+    protocolVersion: str = Field(
+        description="The latest version of the Model Context Protocol that the client supports. The client MAY decide to support older versions as well."
     )
+    capabilities: ClientCapabilities
+
+
+class InitializeRequest(SchemaModel):
+    """This request is sent from the client to the server when it first connects, asking it to begin initialization."""
+
+    method: Literal["initialize"] = "initialize"
+    params: InitializeRequestParams
+
+
+class PingRequestParams(SchemaModel):
     _meta: Optional[Dict[str, Any]] = None
 
 
-class ResourceTemplate(BaseModel):
-    """A template description for resources available on the server."""
+class PingRequest(SchemaModel):
+    """A ping, issued by either the server or the client, to check that the other party is still alive. The receiver must promptly respond, or else may be disconnected."""
 
-    name: str = Field(
-        description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
-    )
-    uriTemplate: str = Field(
-        description="A URI template (according to RFC 6570) that can be used to construct resource URIs."
-    )
-    title: Optional[str] = Field(
-        None,
-        description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
-    )
-    description: Optional[str] = Field(
+    method: Literal["ping"] = "ping"
+    params: Optional[PingRequestParams] = None
+
+
+class ListResourcesRequestParams(SchemaModel):
+    cursor: Optional[str] = Field(
         None,
-        description='A description of what this template is for.\n\nThis can be used by clients to improve the LLM\'s understanding of available resources. It can be thought of like a "hint" to the model.',
+        description="An opaque token representing the current pagination position.\nIf provided, the server should return results starting after this cursor.",
     )
-    mimeType: Optional[str] = Field(
+
+
+class ListResourcesRequest(SchemaModel):
+    """Sent from the client to request a list of resources the server has."""
+
+    method: Literal["resources/list"] = "resources/list"
+    params: Optional[ListResourcesRequestParams] = None
+
+
+class ListResourceTemplatesRequestParams(SchemaModel):
+    cursor: Optional[str] = Field(
         None,
-        description="The MIME type for all resources that match this template. This should only be included if all resources matching this template have the same type.",
-    )
-    annotations: Optional[Annotations] = Field(
-        None, description="Optional annotations for the client."
+        description="An opaque token representing the current pagination position.\nIf provided, the server should return results starting after this cursor.",
     )
-    _meta: Optional[Dict[str, Any]] = None
-
 
-class ResourceTemplateReference(BaseModel):
-    """A reference to a resource or resource template definition."""
 
-    type: Literal["ref/resource"] = "ref/resource"
-    uri: str = Field(description="The URI or URI template of the resource.")
+class ListResourceTemplatesRequest(SchemaModel):
+    """Sent from the client to request a list of resource templates the server has."""
 
+    method: Literal["resources/templates/list"] = "resources/templates/list"
+    params: Optional[ListResourceTemplatesRequestParams] = None
 
-class Root(BaseModel):
-    """Represents a root directory or file that the server can operate on."""
 
+class ReadResourceRequestParams(SchemaModel):
     uri: str = Field(
-        description="The URI identifying the root. This *must* start with file:// for now.\nThis restriction may be relaxed in future versions of the protocol to allow\nother URI schemes."
-    )
-    name: Optional[str] = Field(
-        None,
-        description="An optional name for the root. This can be used to provide a human-readable\nidentifier for the root, which may be useful for display purposes or for\nreferencing the root in other parts of the application.",
+        description="The URI of the resource to read. The URI can use any protocol; it is up to the server how to interpret it."
     )
-    _meta: Optional[Dict[str, Any]] = None
 
 
-# Prompt models
-class PromptArgument(BaseModel):
-    """Describes an argument that a prompt can accept."""
+class ReadResourceRequest(SchemaModel):
+    """Sent from the client to the server, to read a specific resource URI."""
 
-    name: str = Field(
-        description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
+    method: Literal["resources/read"] = "resources/read"
+    params: ReadResourceRequestParams
+
+
+class SubscribeRequestParams(SchemaModel):
+    uri: str = Field(
+        description="The URI of the resource to subscribe to. The URI can use any protocol; it is up to the server how to interpret it."
     )
-    title: Optional[str] = Field(
+
+
+class SubscribeRequest(SchemaModel):
+    """Sent from the client to request resources/updated notifications from the server whenever a particular resource changes."""
+
+    method: Literal["resources/subscribe"] = "resources/subscribe"
+    params: SubscribeRequestParams
+
+
+class UnsubscribeRequestParams(SchemaModel):
+    uri: str = Field(description="The URI of the resource to unsubscribe from.")
+
+
+class UnsubscribeRequest(SchemaModel):
+    """Sent from the client to request cancellation of resources/updated notifications from the server. This should follow a previous resources/subscribe request."""
+
+    method: Literal["resources/unsubscribe"] = "resources/unsubscribe"
+    params: UnsubscribeRequestParams
+
+
+class ListPromptsRequestParams(SchemaModel):
+    cursor: Optional[str] = Field(
         None,
-        description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
-    )
-    description: Optional[str] = Field(
-        None, description="A human-readable description of the argument."
-    )
-    required: Optional[bool] = Field(
-        None, description="Whether this argument must be provided."
+        description="An opaque token representing the current pagination position.\nIf provided, the server should return results starting after this cursor.",
     )
 
 
-class Prompt(BaseModel):
-    """A prompt or prompt template that the server offers."""
+class ListPromptsRequest(SchemaModel):
+    """Sent from the client to request a list of prompts and prompt templates the server has."""
 
-    name: str = Field(
-        description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
+    method: Literal["prompts/list"] = "prompts/list"
+    params: Optional[ListPromptsRequestParams] = None
+
+
+class GetPromptRequestParams(SchemaModel):
+    name: str = Field(description="The name of the prompt or prompt template.")
+    arguments: Optional[Dict[str, str]] = Field(
+        None, description="Arguments to use for templating the prompt."
     )
-    title: Optional[str] = Field(
+
+
+class GetPromptRequest(SchemaModel):
+    """Used by the client to get a prompt provided by the server."""
+
+    method: Literal["prompts/get"] = "prompts/get"
+    params: GetPromptRequestParams
+
+
+class ListToolsRequestParams(SchemaModel):
+    cursor: Optional[str] = Field(
         None,
-        description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
-    )
-    description: Optional[str] = Field(
-        None, description="An optional description of what this prompt provides"
+        description="An opaque token representing the current pagination position.\nIf provided, the server should return results starting after this cursor.",
     )
-    arguments: Optional[List[PromptArgument]] = Field(
-        None, description="A list of arguments to use for templating the prompt."
+
+
+class ListToolsRequest(SchemaModel):
+    """Sent from the client to request a list of tools the server has."""
+
+    method: Literal["tools/list"] = "tools/list"
+    params: Optional[ListToolsRequestParams] = None
+
+
+class LoggingLevel(StrEnum):
+    """The severity of a log message.
+
+    These map to syslog message severities, as specified in RFC-5424:
+    https://datatracker.ietf.org/doc/html/rfc5424#section-6.2.1"""
+
+    ALERT = "alert"
+    CRITICAL = "critical"
+    DEBUG = "debug"
+    EMERGENCY = "emergency"
+    ERROR = "error"
+    INFO = "info"
+    NOTICE = "notice"
+    WARNING = "warning"
+
+
+class SetLevelRequestParams(SchemaModel):
+    level: LoggingLevel = Field(
+        description="The level of logging that the client wants to receive from the server. The server should send all logs at this level and higher (i.e., more severe) to the client as notifications/message."
     )
-    _meta: Optional[Dict[str, Any]] = None
 
 
-class PromptReference(BaseModel):
+class SetLevelRequest(SchemaModel):
+    """A request from the client to the server, to enable or adjust logging."""
+
+    method: Literal["logging/setLevel"] = "logging/setLevel"
+    params: SetLevelRequestParams
+
+
+class PromptReference(SchemaModel):
     """Identifies a prompt."""
 
     type: Literal["ref/prompt"] = "ref/prompt"
@@ -469,68 +502,154 @@ class PromptReference(BaseModel):
     )
 
 
-# Tool models
-class ToolAnnotations(BaseModel):
-    """Additional properties describing a Tool to clients.
+class ResourceTemplateReference(SchemaModel):
+    """A reference to a resource or resource template definition."""
 
-    NOTE: all properties in ToolAnnotations are **hints**.
-    They are not guaranteed to provide a faithful description of
-    tool behavior (including descriptive properties like `title`).
+    type: Literal["ref/resource"] = "ref/resource"
+    uri: str = Field(description="The URI or URI template of the resource.")
 
-    Clients should never make tool use decisions based on ToolAnnotations
-    received from untrusted servers."""
 
-    title: Optional[str] = Field(
-        None, description="A human-readable title for the tool."
-    )
-    readOnlyHint: Optional[bool] = Field(
-        None,
-        description="If true, the tool does not modify its environment.\n\nDefault: false",
+class CompleteRequestArgumentParams(SchemaModel):
+    name: str = Field(description="The name of the argument")
+    value: str = Field(
+        description="The value of the argument to use for completion matching."
     )
-    destructiveHint: Optional[bool] = Field(
-        None,
-        description="If true, the tool may perform destructive updates to its environment.\nIf false, the tool performs only additive updates.\n\n(This property is meaningful only when `readOnlyHint == false`)\n\nDefault: true",
+
+
+class CompleteRequestContextParams(SchemaModel):
+    arguments: Optional[Dict[str, str]] = Field(
+        None, description="Previously-resolved variables in a URI template or prompt."
     )
-    idempotentHint: Optional[bool] = Field(
-        None,
-        description="If true, calling the tool repeatedly with the same arguments\nwill have no additional effect on the its environment.\n\n(This property is meaningful only when `readOnlyHint == false`)\n\nDefault: false",
+
+
+class CompleteRequestParams(SchemaModel):
+    ref: Annotated[
+        Union[PromptReference, ResourceTemplateReference], Field(discriminator="type")
+    ]
+    argument: CompleteRequestArgumentParams = Field(
+        description="The argument's information"
     )
-    openWorldHint: Optional[bool] = Field(
-        None,
-        description='If true, this tool may interact with an "open world" of external\nentities. If false, the tool\'s domain of interaction is closed.\nFor example, the world of a web search tool is open, whereas that\nof a memory tool is not.\n\nDefault: true',
+    context: Optional[CompleteRequestContextParams] = Field(
+        None, description="Additional, optional context for completions"
     )
 
 
-class Tool(BaseModel):
-    """Definition for a tool the client can call."""
+class CompleteRequest(SchemaModel):
+    """A request from the client to the server, to ask for completion options."""
 
-    name: str = Field(
-        description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
+    method: Literal["completion/complete"] = "completion/complete"
+    params: CompleteRequestParams
+
+
+ClientRequest: TypeAlias = Annotated[
+    Union[
+        InitializeRequest,
+        PingRequest,
+        ListResourcesRequest,
+        ListResourceTemplatesRequest,
+        ReadResourceRequest,
+        SubscribeRequest,
+        UnsubscribeRequest,
+        ListPromptsRequest,
+        GetPromptRequest,
+        ListToolsRequest,
+        CallToolRequest,
+        SetLevelRequest,
+        CompleteRequest,
+    ],
+    Field(discriminator="method"),
+]
+
+
+class CreateMessageResult(Result):
+    """The client's response to a sampling/create_message request from the server. The client should inform the user before returning the sampled message, to allow them to inspect the response (human in the loop) and decide whether to allow the server to see it."""
+
+    role: Role
+    model: str = Field(description="The name of the model that generated the message.")
+    content: Annotated[
+        Union[TextContent, ImageContent, AudioContent], Field(discriminator="type")
+    ]
+    stopReason: Optional[str] = Field(
+        None, description="The reason why sampling stopped, if known."
     )
-    inputSchema: Dict[str, Any] = Field(
-        description="A JSON Schema object defining the expected parameters for the tool."
+
+
+class Root(SchemaModel):
+    """Represents a root directory or file that the server can operate on."""
+
+    _meta: Optional[Dict[str, Any]] = None
+    uri: str = Field(
+        description="The URI identifying the root. This *must* start with file:// for now.\nThis restriction may be relaxed in future versions of the protocol to allow\nother URI schemes."
     )
-    title: Optional[str] = Field(
+    name: Optional[str] = Field(
         None,
-        description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
+        description="An optional name for the root. This can be used to provide a human-readable\nidentifier for the root, which may be useful for display purposes or for\nreferencing the root in other parts of the application.",
     )
-    description: Optional[str] = Field(
+
+
+class ListRootsResult(Result):
+    """The client's response to a roots/list request from the server.
+    This result contains an array of Root objects, each representing a root directory
+    or file that the server can operate on."""
+
+    roots: List[Root]
+
+
+class ElicitResult(Result):
+    """The client's response to an elicitation request."""
+
+    action: Literal["accept", "decline", "cancel"] = Field(
+        description='The user action in response to the elicitation.\n- "accept": User submitted the form/confirmed the action\n- "decline": User explicitly declined the action\n- "cancel": User dismissed without making an explicit choice'
+    )
+    content: Optional[Dict[str, Union[str, int, bool]]] = Field(
         None,
-        description='A human-readable description of the tool.\n\nThis can be used by clients to improve the LLM\'s understanding of available tools. It can be thought of like a "hint" to the model.',
+        description='The submitted form data, only present when action is "accept".\nContains values matching the requested schema.',
     )
-    outputSchema: Optional[Dict[str, Any]] = Field(
+
+
+ClientResult: TypeAlias = Union[
+    Result, CreateMessageResult, ListRootsResult, ElicitResult
+]
+
+
+class CompletionValues(SchemaModel):
+    values: List[str] = Field(
+        description="An array of completion values. Must not exceed 100 items."
+    )
+    total: Optional[int] = Field(
         None,
-        description="An optional JSON Schema object defining the structure of the tool's output returned in\nthe structuredContent field of a CallToolResult.",
+        description="The total number of completion options available. This can exceed the number of values actually sent in the response.",
     )
-    annotations: Optional[ToolAnnotations] = Field(
+    hasMore: Optional[bool] = Field(
         None,
-        description="Optional additional tool information.\n\nDisplay name precedence order is: title, annotations.title, then name.",
+        description="Indicates whether there are additional completion options beyond those provided in the current response, even if the exact total is unknown.",
     )
-    _meta: Optional[Dict[str, Any]] = None
 
 
-# Model preferences models
-class ModelHint(BaseModel):
+class CompleteResult(Result):
+    """The server's response to a completion/complete request"""
+
+    completion: CompletionValues
+
+
+class CompletionsCapabilities(SchemaModel):
+    pass
+
+
+class ContentBlock(SchemaModel):
+    pass
+
+
+class SamplingMessage(SchemaModel):
+    """Describes a message issued to or received from an LLM API."""
+
+    role: Role
+    content: Annotated[
+        Union[TextContent, ImageContent, AudioContent], Field(discriminator="type")
+    ]
+
+
+class ModelHint(SchemaModel):
     """Hints to use for model selection.
 
     Keys not declared here are currently left unspecified by the spec and are up
@@ -542,10 +661,10 @@ class ModelHint(BaseModel):
     )
 
 
-class ModelPreferences(BaseModel):
+class ModelPreferences(SchemaModel):
     """The server's preferences for model selection, requested of the client during sampling.
 
-    Because LLMs can vary along multiple dimensions, choosing the \"best\" model is
+    Because LLMs can vary along multiple dimensions, choosing the "best" model is
     rarely straightforward.  Different models excel in different areas—some are
     faster but less capable, others are more capable but more expensive, and so
     on. This interface allows servers to express their priorities across multiple
@@ -558,20 +677,14 @@ class ModelPreferences(BaseModel):
     speedPriority: Optional[float] = Field(
         None,
         description="How much to prioritize sampling speed (latency) when selecting a model. A\nvalue of 0 means speed is not important, while a value of 1 means speed is\nthe most important factor.",
-        ge=0,
-        le=1,
     )
     costPriority: Optional[float] = Field(
         None,
         description="How much to prioritize cost when selecting a model. A value of 0 means cost\nis not important, while a value of 1 means cost is the most important\nfactor.",
-        ge=0,
-        le=1,
     )
     intelligencePriority: Optional[float] = Field(
         None,
         description="How much to prioritize intelligence and capabilities when selecting a\nmodel. A value of 0 means intelligence is not important, while a value of 1\nmeans intelligence is the most important factor.",
-        ge=0,
-        le=1,
     )
     hints: Optional[List[ModelHint]] = Field(
         None,
@@ -579,285 +692,231 @@ class ModelPreferences(BaseModel):
     )
 
 
-# Request and result models
-class Result(BaseModel):
-    _meta: Optional[Dict[str, Any]] = None
-
-
-class EmptyResult(Result):
-    pass
-
-
-class InitializeRequestParams(BaseModel):
-    clientInfo: Implementation
-    protocolVersion: str = Field(
-        description="The latest version of the Model Context Protocol that the client supports. The client MAY decide to support older versions as well."
-    )
-    capabilities: ClientCapabilities
-
-
-class InitializeRequest(BaseModel):
-    """This request is sent from the client to the server when it first connects, asking it to begin initialization."""
-
-    method: Literal["initialize"] = "initialize"
-    params: InitializeRequestParams
-
-
-class InitializeResult(Result):
-    """After receiving an initialize request from the client, the server sends this response."""
-
-    serverInfo: Implementation
-    protocolVersion: str = Field(
-        description="The version of the Model Context Protocol that the server wants to use. This may not match the version that the client requested. If the client cannot support this version, it MUST disconnect."
+class CreateMessageRequestParams(SchemaModel):
+    messages: List[SamplingMessage]
+    maxTokens: int = Field(
+        description="The maximum number of tokens to sample, as requested by the server. The client MAY choose to sample fewer tokens than requested."
     )
-    capabilities: ServerCapabilities
-    instructions: Optional[str] = Field(
+    systemPrompt: Optional[str] = Field(
         None,
-        description='Instructions describing how to use the server and its features.\n\nThis can be used by clients to improve the LLM\'s understanding of available tools, resources, etc. It can be thought of like a "hint" to the model. For example, this information MAY be added to the system prompt.',
-    )
-
-
-class InitializedNotificationParams(BaseModel):
-    _meta: Optional[Dict[str, Any]] = None
-
-
-class InitializedNotification(BaseModel):
-    """This notification is sent from the client to the server after initialization has finished."""
-
-    method: Literal["notifications/initialized"] = "notifications/initialized"
-    params: Optional[InitializedNotificationParams] = None
-
-
-class PingRequestParams(BaseModel):
-    _meta: Optional[Dict[str, Any]] = None
-
-
-class PingRequest(BaseModel):
-    """A ping, issued by either the server or the client, to check that the other party is still alive. The receiver must promptly respond, or else may be disconnected."""
-
-    method: Literal["ping"] = "ping"
-    params: Optional[PingRequestParams] = None
-
-
-class CancelledNotificationParams(BaseModel):
-    requestId: RequestId = Field(
-        description="The ID of the request to cancel.\n\nThis MUST correspond to the ID of a request previously issued in the same direction."
+        description="An optional system prompt the server wants to use for sampling. The client MAY modify or omit this prompt.",
     )
-    reason: Optional[str] = Field(
+    temperature: Optional[float] = None
+    stopSequences: Optional[List[str]] = None
+    modelPreferences: Optional[ModelPreferences] = Field(
         None,
-        description="An optional string describing the reason for the cancellation. This MAY be logged or presented to the user.",
-    )
-
-
-class CancelledNotification(BaseModel):
-    """This notification can be sent by either side to indicate that it is cancelling a previously-issued request.
-
-    The request SHOULD still be in-flight, but due to communication latency, it is always possible that this notification MAY arrive after the request has already finished.
-
-    This notification indicates that the result will be unused, so any associated processing SHOULD cease.
-
-    A client MUST NOT attempt to cancel its `initialize` request."""
-
-    method: Literal["notifications/cancelled"] = "notifications/cancelled"
-    params: CancelledNotificationParams
-
-
-class ProgressNotificationParams(BaseModel):
-    progressToken: ProgressToken = Field(
-        description="The progress token which was given in the initial request, used to associate this notification with the request that is proceeding."
-    )
-    progress: float = Field(
-        description="The progress thus far. This should increase every time progress is made, even if the total is unknown."
+        description="The server's preferences for which model to select. The client MAY ignore these preferences.",
     )
-    total: Optional[float] = Field(
+    metadata: Optional[Dict[str, Any]] = Field(
         None,
-        description="Total number of items to process (or total progress required), if known.",
+        description="Optional metadata to pass through to the LLM provider. The format of this metadata is provider-specific.",
     )
-    message: Optional[str] = Field(
-        None, description="An optional message describing the current progress."
+    includeContext: Optional[Literal["allServers", "none", "thisServer"]] = Field(
+        None,
+        description="A request to include context from one or more MCP servers (including the caller), to be attached to the prompt. The client MAY ignore this request.",
     )
 
 
-class ProgressNotification(BaseModel):
-    """An out-of-band notification used to inform the receiver of a progress update for a long-running request."""
-
-    method: Literal["notifications/progress"] = "notifications/progress"
-    params: ProgressNotificationParams
-
-
-class ListRootsRequestParams(BaseModel):
-    _meta: Optional[Dict[str, Any]] = None
-
-
-class ListRootsRequest(BaseModel):
-    """Sent from the server to request a list of root URIs from the client. Roots allow
-    servers to ask for specific directories or files to operate on. A common example
-    for roots is providing a set of repositories or directories a server should operate
-    on.
-
-    This request is typically used when the server needs to understand the file system
-    structure or access specific locations that the client has permission to read from.
-    """
-
-    method: Literal["roots/list"] = "roots/list"
-    params: Optional[ListRootsRequestParams] = None
-
-
-class ListRootsResult(Result):
-    """The client's response to a roots/list request from the server.
-    This result contains an array of Root objects, each representing a root directory
-    or file that the server can operate on."""
-
-    roots: List[Root]
+class CreateMessageRequest(SchemaModel):
+    """A request from the server to sample an LLM via the client. The client has full discretion over which model to select. The client should also inform the user before beginning sampling, to allow them to inspect the request (human in the loop) and decide whether to approve it."""
 
+    method: Literal["sampling/createMessage"] = "sampling/createMessage"
+    params: CreateMessageRequestParams
 
-class RootsListChangedNotificationParams(BaseModel):
-    _meta: Optional[Dict[str, Any]] = None
 
+Cursor: TypeAlias = str
 
-class RootsListChangedNotification(BaseModel):
-    """A notification from the client to the server, informing it that the list of roots has changed.
-    This notification should be sent whenever the client adds, removes, or modifies any root.
-    The server should then request an updated list of roots using the ListRootsRequest.
-    """
 
-    method: Literal["notifications/roots/list_changed"] = (
-        "notifications/roots/list_changed"
+class ElicitRequestParams(SchemaModel):
+    message: str = Field(description="The message to present to the user.")
+    requestedSchema: Dict[str, Any] = Field(
+        description="A restricted subset of JSON Schema.\nOnly top-level properties are allowed, without nesting."
     )
-    params: Optional[RootsListChangedNotificationParams] = None
 
 
-class ListResourcesRequestParams(BaseModel):
-    cursor: Optional[str] = Field(
-        None,
-        description="An opaque token representing the current pagination position.\nIf provided, the server should return results starting after this cursor.",
-    )
+class ElicitRequest(SchemaModel):
+    """A request from the server to elicit additional information from the user via the client."""
 
+    method: Literal["elicitation/create"] = "elicitation/create"
+    params: ElicitRequestParams
 
-class ListResourcesRequest(BaseModel):
-    """Sent from the client to request a list of resources the server has."""
 
-    method: Literal["resources/list"] = "resources/list"
-    params: Optional[ListResourcesRequestParams] = None
+class EmptyResult(Result):
+    pass
 
 
-class ListResourcesResult(Result):
-    """The server's response to a resources/list request from the client."""
+class EnumSchema(SchemaModel):
+    type: Literal["string"] = "string"
+    title: Optional[str] = None
+    description: Optional[str] = None
+    enum: List[str]
+    enumNames: Optional[List[str]] = None
 
-    resources: List[Resource]
-    nextCursor: Optional[str] = Field(
-        None,
-        description="An opaque token representing the pagination position after the last returned result.\nIf present, there may be more results available.",
-    )
 
+class PromptMessage(SchemaModel):
+    """Describes a message returned as part of a prompt.
 
-class ResourceListChangedNotificationParams(BaseModel):
-    _meta: Optional[Dict[str, Any]] = None
+    This is similar to `SamplingMessage`, but also supports the embedding of
+    resources from the MCP server."""
 
+    role: Role
+    content: Annotated[
+        Union[TextContent, ImageContent, AudioContent, ResourceLink, EmbeddedResource],
+        Field(discriminator="type"),
+    ]
 
-class ResourceListChangedNotification(BaseModel):
-    """An optional notification from the server to the client, informing it that the list of resources it can read from has changed. This may be issued by servers without any previous subscription from the client."""
 
-    method: Literal["notifications/resources/list_changed"] = (
-        "notifications/resources/list_changed"
+class GetPromptResult(Result):
+    """The server's response to a prompts/get request from the client."""
+
+    messages: List[PromptMessage]
+    description: Optional[str] = Field(
+        None, description="An optional description for the prompt."
     )
-    params: Optional[ResourceListChangedNotificationParams] = None
 
 
-class ListResourceTemplatesRequestParams(BaseModel):
-    cursor: Optional[str] = Field(
+class PromptsCapabilities(SchemaModel):
+    listChanged: Optional[bool] = Field(
         None,
-        description="An opaque token representing the current pagination position.\nIf provided, the server should return results starting after this cursor.",
+        description="Whether this server supports notifications for changes to the prompt list.",
     )
 
 
-class ListResourceTemplatesRequest(BaseModel):
-    """Sent from the client to request a list of resource templates the server has."""
-
-    method: Literal["resources/templates/list"] = "resources/templates/list"
-    params: Optional[ListResourceTemplatesRequestParams] = None
-
-
-class ListResourceTemplatesResult(Result):
-    """The server's response to a resources/templates/list request from the client."""
-
-    resourceTemplates: List[ResourceTemplate]
-    nextCursor: Optional[str] = Field(
+class ResourcesCapabilities(SchemaModel):
+    listChanged: Optional[bool] = Field(
         None,
-        description="An opaque token representing the pagination position after the last returned result.\nIf present, there may be more results available.",
+        description="Whether this server supports notifications for changes to the resource list.",
+    )
+    subscribe: Optional[bool] = Field(
+        None,
+        description="Whether this server supports subscribing to resource updates.",
     )
 
 
-class ReadResourceRequestParams(BaseModel):
-    uri: str = Field(
-        description="The URI of the resource to read. The URI can use any protocol; it is up to the server how to interpret it."
+class ToolsCapabilities(SchemaModel):
+    listChanged: Optional[bool] = Field(
+        None,
+        description="Whether this server supports notifications for changes to the tool list.",
     )
 
 
-class ReadResourceRequest(BaseModel):
-    """Sent from the client to the server, to read a specific resource URI."""
+class LoggingCapabilities(SchemaModel):
+    pass
 
-    method: Literal["resources/read"] = "resources/read"
-    params: ReadResourceRequestParams
 
+class ServerCapabilities(SchemaModel):
+    """Capabilities that a server may support. Known capabilities are defined here, in this schema, but this is not a closed set: any server can define its own, additional capabilities."""
 
-class ReadResourceResult(Result):
-    """The server's response to a resources/read request from the client."""
+    prompts: Optional[PromptsCapabilities] = Field(
+        None, description="Present if the server offers any prompt templates."
+    )
+    resources: Optional[ResourcesCapabilities] = Field(
+        None, description="Present if the server offers any resources to read."
+    )
+    tools: Optional[ToolsCapabilities] = Field(
+        None, description="Present if the server offers any tools to call."
+    )
+    logging: Optional[LoggingCapabilities] = Field(
+        None,
+        description="Present if the server supports sending log messages to the client.",
+    )
+    completions: Optional[CompletionsCapabilities] = Field(
+        None,
+        description="Present if the server supports argument autocompletion suggestions.",
+    )
+    experimental: Optional[Dict[str, Dict[str, Any]]] = Field(
+        None,
+        description="Experimental, non-standard capabilities that the server supports.",
+    )
 
-    contents: List[Union[TextResourceContents, BlobResourceContents]]
 
+class InitializeResult(Result):
+    """After receiving an initialize request from the client, the server sends this response."""
 
-class SubscribeRequestParams(BaseModel):
-    uri: str = Field(
-        description="The URI of the resource to subscribe to. The URI can use any protocol; it is up to the server how to interpret it."
+    serverInfo: Implementation
+    protocolVersion: str = Field(
+        description="The version of the Model Context Protocol that the server wants to use. This may not match the version that the client requested. If the client cannot support this version, it MUST disconnect."
+    )
+    capabilities: ServerCapabilities
+    instructions: Optional[str] = Field(
+        None,
+        description='Instructions describing how to use the server and its features.\n\nThis can be used by clients to improve the LLM\'s understanding of available tools, resources, etc. It can be thought of like a "hint" to the model. For example, this information MAY be added to the system prompt.',
     )
 
 
-class SubscribeRequest(BaseModel):
-    """Sent from the client to request resources/updated notifications from the server whenever a particular resource changes."""
+class JSONRPCError(SchemaModel):
+    """A response to a request that indicates an error occurred."""
 
-    method: Literal["resources/subscribe"] = "resources/subscribe"
-    params: SubscribeRequestParams
+    jsonrpc: Literal["2.0"] = "2.0"
+    id: Union[str, int]
+    error: Dict[str, Any]
 
 
-class UnsubscribeRequestParams(BaseModel):
-    uri: str = Field(description="The URI of the resource to unsubscribe from.")
+class JSONRPCRequest(SchemaModel):
+    """A request that expects a response."""
 
+    jsonrpc: Literal["2.0"] = "2.0"
+    id: Union[str, int]
+    method: str
+    params: Optional[Dict[str, Any]] = None
 
-class UnsubscribeRequest(BaseModel):
-    """Sent from the client to request cancellation of resources/updated notifications from the server. This should follow a previous resources/subscribe request."""
 
-    method: Literal["resources/unsubscribe"] = "resources/unsubscribe"
-    params: UnsubscribeRequestParams
+class JSONRPCNotification(SchemaModel):
+    """A notification which does not expect a response."""
 
+    jsonrpc: Literal["2.0"] = "2.0"
+    method: str
+    params: Optional[Dict[str, Any]] = None
 
-class ResourceUpdatedNotificationParams(BaseModel):
-    uri: str = Field(
-        description="The URI of the resource that has been updated. This might be a sub-resource of the one that the client actually subscribed to."
-    )
 
+class JSONRPCResponse(SchemaModel):
+    """A successful (non-error) response to a request."""
 
-class ResourceUpdatedNotification(BaseModel):
-    """A notification from the server to the client, informing it that a resource has changed and may need to be read again. This should only be sent if the client previously sent a resources/subscribe request."""
+    jsonrpc: Literal["2.0"] = "2.0"
+    id: Union[str, int]
+    result: Result
 
-    method: Literal["notifications/resources/updated"] = (
-        "notifications/resources/updated"
-    )
-    params: ResourceUpdatedNotificationParams
+
+JSONRPCMessage: TypeAlias = Union[
+    JSONRPCRequest, JSONRPCNotification, JSONRPCResponse, JSONRPCError
+]
 
 
-class ListPromptsRequestParams(BaseModel):
-    cursor: Optional[str] = Field(
+class PromptArgument(SchemaModel):
+    """Describes an argument that a prompt can accept."""
+
+    name: str = Field(
+        description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
+    )
+    title: Optional[str] = Field(
         None,
-        description="An opaque token representing the current pagination position.\nIf provided, the server should return results starting after this cursor.",
+        description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
+    )
+    description: Optional[str] = Field(
+        None, description="A human-readable description of the argument."
+    )
+    required: Optional[bool] = Field(
+        None, description="Whether this argument must be provided."
     )
 
 
-class ListPromptsRequest(BaseModel):
-    """Sent from the client to request a list of prompts and prompt templates the server has."""
+class Prompt(SchemaModel):
+    """A prompt or prompt template that the server offers."""
 
-    method: Literal["prompts/list"] = "prompts/list"
-    params: Optional[ListPromptsRequestParams] = None
+    _meta: Optional[Dict[str, Any]] = None
+    name: str = Field(
+        description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
+    )
+    title: Optional[str] = Field(
+        None,
+        description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
+    )
+    description: Optional[str] = Field(
+        None, description="An optional description of what this prompt provides"
+    )
+    arguments: Optional[List[PromptArgument]] = Field(
+        None, description="A list of arguments to use for templating the prompt."
+    )
 
 
 class ListPromptsResult(Result):
@@ -870,335 +929,283 @@ class ListPromptsResult(Result):
     )
 
 
-class PromptListChangedNotificationParams(BaseModel):
-    _meta: Optional[Dict[str, Any]] = None
-
-
-class PromptListChangedNotification(BaseModel):
-    """An optional notification from the server to the client, informing it that the list of prompts it offers has changed. This may be issued by servers without any previous subscription from the client."""
+class ResourceTemplate(SchemaModel):
+    """A template description for resources available on the server."""
 
-    method: Literal["notifications/prompts/list_changed"] = (
-        "notifications/prompts/list_changed"
+    _meta: Optional[Dict[str, Any]] = None
+    name: str = Field(
+        description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
     )
-    params: Optional[PromptListChangedNotificationParams] = None
-
-
-class GetPromptRequestParams(BaseModel):
-    name: str = Field(description="The name of the prompt or prompt template.")
-    arguments: Optional[Dict[str, str]] = Field(
-        None, description="Arguments to use for templating the prompt."
+    uriTemplate: str = Field(
+        description="A URI template (according to RFC 6570) that can be used to construct resource URIs."
+    )
+    title: Optional[str] = Field(
+        None,
+        description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
+    )
+    description: Optional[str] = Field(
+        None,
+        description='A description of what this template is for.\n\nThis can be used by clients to improve the LLM\'s understanding of available resources. It can be thought of like a "hint" to the model.',
+    )
+    mimeType: Optional[str] = Field(
+        None,
+        description="The MIME type for all resources that match this template. This should only be included if all resources matching this template have the same type.",
+    )
+    annotations: Optional[Annotations] = Field(
+        None, description="Optional annotations for the client."
     )
 
 
-class GetPromptRequest(BaseModel):
-    """Used by the client to get a prompt provided by the server."""
+class ListResourceTemplatesResult(Result):
+    """The server's response to a resources/templates/list request from the client."""
 
-    method: Literal["prompts/get"] = "prompts/get"
-    params: GetPromptRequestParams
+    resourceTemplates: List[ResourceTemplate]
+    nextCursor: Optional[str] = Field(
+        None,
+        description="An opaque token representing the pagination position after the last returned result.\nIf present, there may be more results available.",
+    )
 
 
-class GetPromptResult(Result):
-    """The server's response to a prompts/get request from the client."""
+class Resource(SchemaModel):
+    """A known resource that the server is capable of reading."""
 
-    messages: List[PromptMessage]
+    _meta: Optional[Dict[str, Any]] = None
+    name: str = Field(
+        description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
+    )
+    uri: str = Field(description="The URI of this resource.")
+    title: Optional[str] = Field(
+        None,
+        description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
+    )
     description: Optional[str] = Field(
-        None, description="An optional description for the prompt."
+        None,
+        description='A description of what this resource represents.\n\nThis can be used by clients to improve the LLM\'s understanding of available resources. It can be thought of like a "hint" to the model.',
     )
-
-
-class ListToolsRequestParams(BaseModel):
-    cursor: Optional[str] = Field(
+    mimeType: Optional[str] = Field(
+        None, description="The MIME type of this resource, if known."
+    )
+    size: Optional[int] = Field(
         None,
-        description="An opaque token representing the current pagination position.\nIf provided, the server should return results starting after this cursor.",
+        description="The size of the raw resource content, in bytes (i.e., before base64 encoding or any tokenization), if known.\n\nThis can be used by Hosts to display file sizes and estimate context window usage.",
+    )
+    annotations: Optional[Annotations] = Field(
+        None, description="Optional annotations for the client."
     )
 
 
-class ListToolsRequest(BaseModel):
-    """Sent from the client to request a list of tools the server has."""
-
-    method: Literal["tools/list"] = "tools/list"
-    params: Optional[ListToolsRequestParams] = None
-
-
-class ListToolsResult(Result):
-    """The server's response to a tools/list request from the client."""
+class ListResourcesResult(Result):
+    """The server's response to a resources/list request from the client."""
 
-    tools: List[Tool]
+    resources: List[Resource]
     nextCursor: Optional[str] = Field(
         None,
         description="An opaque token representing the pagination position after the last returned result.\nIf present, there may be more results available.",
     )
 
 
-class ToolListChangedNotificationParams(BaseModel):
+class ListRootsRequestParams(SchemaModel):
     _meta: Optional[Dict[str, Any]] = None
 
 
-class ToolListChangedNotification(BaseModel):
-    """An optional notification from the server to the client, informing it that the list of tools it offers has changed. This may be issued by servers without any previous subscription from the client."""
-
-    method: Literal["notifications/tools/list_changed"] = (
-        "notifications/tools/list_changed"
-    )
-    params: Optional[ToolListChangedNotificationParams] = None
-
+class ListRootsRequest(SchemaModel):
+    """Sent from the server to request a list of root URIs from the client. Roots allow
+    servers to ask for specific directories or files to operate on. A common example
+    for roots is providing a set of repositories or directories a server should operate
+    on.
 
-class CallToolRequestParams(BaseModel):
-    name: str
-    arguments: Optional[Dict[str, Any]] = None
+    This request is typically used when the server needs to understand the file system
+    structure or access specific locations that the client has permission to read from.
+    """
 
+    method: Literal["roots/list"] = "roots/list"
+    params: Optional[ListRootsRequestParams] = None
 
-class CallToolRequest(BaseModel):
-    """Used by the client to invoke a tool provided by the server."""
 
-    method: Literal["tools/call"] = "tools/call"
-    params: CallToolRequestParams
+class ToolAnnotations(SchemaModel):
+    """Additional properties describing a Tool to clients.
 
+    NOTE: all properties in ToolAnnotations are **hints**.
+    They are not guaranteed to provide a faithful description of
+    tool behavior (including descriptive properties like `title`).
 
-class CallToolResult(Result):
-    """The server's response to a tool call."""
+    Clients should never make tool use decisions based on ToolAnnotations
+    received from untrusted servers."""
 
-    content: List[
-        Union[TextContent, ImageContent, AudioContent, ResourceLink, EmbeddedResource]
-    ]
-    structuredContent: Optional[Dict[str, Any]] = Field(
-        None,
-        description="An optional JSON object that represents the structured result of the tool call.",
+    title: Optional[str] = Field(
+        None, description="A human-readable title for the tool."
     )
-    isError: Optional[bool] = Field(
+    readOnlyHint: Optional[bool] = Field(
         None,
-        description="Whether the tool call ended in an error.\n\nIf not set, this is assumed to be false (the call was successful).\n\nAny errors that originate from the tool SHOULD be reported inside the result\nobject, with `isError` set to true, _not_ as an MCP protocol-level error\nresponse. Otherwise, the LLM would not be able to see that an error occurred\nand self-correct.\n\nHowever, any errors in _finding_ the tool, an error indicating that the\nserver does not support tool calls, or any other exceptional conditions,\nshould be reported as an MCP error response.",
+        description="If true, the tool does not modify its environment.\n\nDefault: false",
     )
-
-
-class SetLevelRequestParams(BaseModel):
-    level: LoggingLevel = Field(
-        description="The level of logging that the client wants to receive from the server. The server should send all logs at this level and higher (i.e., more severe) to the client as notifications/message."
+    destructiveHint: Optional[bool] = Field(
+        None,
+        description="If true, the tool may perform destructive updates to its environment.\nIf false, the tool performs only additive updates.\n\n(This property is meaningful only when `readOnlyHint == false`)\n\nDefault: true",
     )
-
-
-class SetLevelRequest(BaseModel):
-    """A request from the client to the server, to enable or adjust logging."""
-
-    method: Literal["logging/setLevel"] = "logging/setLevel"
-    params: SetLevelRequestParams
-
-
-class LoggingMessageNotificationParams(BaseModel):
-    level: LoggingLevel = Field(description="The severity of this log message.")
-    data: Any = Field(
-        description="The data to be logged, such as a string message or an object. Any JSON serializable type is allowed here."
+    idempotentHint: Optional[bool] = Field(
+        None,
+        description="If true, calling the tool repeatedly with the same arguments\nwill have no additional effect on the its environment.\n\n(This property is meaningful only when `readOnlyHint == false`)\n\nDefault: false",
     )
-    logger: Optional[str] = Field(
-        None, description="An optional name of the logger issuing this message."
+    openWorldHint: Optional[bool] = Field(
+        None,
+        description='If true, this tool may interact with an "open world" of external\nentities. If false, the tool\'s domain of interaction is closed.\nFor example, the world of a web search tool is open, whereas that\nof a memory tool is not.\n\nDefault: true',
     )
 
 
-class LoggingMessageNotification(BaseModel):
-    """Notification of a log message passed from server to client. If no logging/setLevel request has been sent from the client, the server MAY decide which messages to send automatically."""
-
-    method: Literal["notifications/message"] = "notifications/message"
-    params: LoggingMessageNotificationParams
-
+class Tool(SchemaModel):
+    """Definition for a tool the client can call."""
 
-class CreateMessageRequestParams(BaseModel):
-    messages: List[SamplingMessage]
-    maxTokens: int = Field(
-        description="The maximum number of tokens to sample, as requested by the server. The client MAY choose to sample fewer tokens than requested."
+    _meta: Optional[Dict[str, Any]] = None
+    name: str = Field(
+        description="Intended for programmatic or logical use, but used as a display name in past specs or fallback (if title isn't present)."
     )
-    systemPrompt: Optional[str] = Field(
+    inputSchema: Dict[str, Any] = Field(
+        description="A JSON Schema object defining the expected parameters for the tool."
+    )
+    title: Optional[str] = Field(
         None,
-        description="An optional system prompt the server wants to use for sampling. The client MAY modify or omit this prompt.",
+        description="Intended for UI and end-user contexts — optimized to be human-readable and easily understood,\neven by those unfamiliar with domain-specific terminology.\n\nIf not provided, the name should be used for display (except for Tool,\nwhere `annotations.title` should be given precedence over using `name`,\nif present).",
     )
-    temperature: Optional[float] = None
-    stopSequences: Optional[List[str]] = None
-    modelPreferences: Optional[ModelPreferences] = Field(
+    description: Optional[str] = Field(
         None,
-        description="The server's preferences for which model to select. The client MAY ignore these preferences.",
+        description='A human-readable description of the tool.\n\nThis can be used by clients to improve the LLM\'s understanding of available tools. It can be thought of like a "hint" to the model.',
     )
-    metadata: Optional[Dict[str, Any]] = Field(
+    outputSchema: Optional[Dict[str, Any]] = Field(
         None,
-        description="Optional metadata to pass through to the LLM provider. The format of this metadata is provider-specific.",
+        description="An optional JSON Schema object defining the structure of the tool's output returned in\nthe structuredContent field of a CallToolResult.",
     )
-    includeContext: Optional[Literal["allServers", "none", "thisServer"]] = Field(
+    annotations: Optional[ToolAnnotations] = Field(
         None,
-        description="A request to include context from one or more MCP servers (including the caller), to be attached to the prompt. The client MAY ignore this request.",
+        description="Optional additional tool information.\n\nDisplay name precedence order is: title, annotations.title, then name.",
     )
 
 
-class CreateMessageRequest(BaseModel):
-    """A request from the server to sample an LLM via the client. The client has full discretion over which model to select. The client should also inform the user before beginning sampling, to allow them to inspect the request (human in the loop) and decide whether to approve it."""
-
-    method: Literal["sampling/createMessage"] = "sampling/createMessage"
-    params: CreateMessageRequestParams
-
-
-class CreateMessageResult(Result):
-    """The client's response to a sampling/create_message request from the server. The client should inform the user before returning the sampled message, to allow them to inspect the response (human in the loop) and decide whether to allow the server to see it."""
+class ListToolsResult(Result):
+    """The server's response to a tools/list request from the client."""
 
-    role: Role
-    model: str = Field(description="The name of the model that generated the message.")
-    content: Union[TextContent, ImageContent, AudioContent]
-    stopReason: Optional[str] = Field(
-        None, description="The reason why sampling stopped, if known."
+    tools: List[Tool]
+    nextCursor: Optional[str] = Field(
+        None,
+        description="An opaque token representing the pagination position after the last returned result.\nIf present, there may be more results available.",
     )
 
 
-class ElicitRequestParams(BaseModel):
-    message: str = Field(description="The message to present to the user.")
-    requestedSchema: Dict[str, Any] = Field(
-        description="A restricted subset of JSON Schema.\nOnly top-level properties are allowed, without nesting."
+class LoggingMessageNotificationParams(SchemaModel):
+    level: LoggingLevel = Field(description="The severity of this log message.")
+    data: Any = Field(
+        description="The data to be logged, such as a string message or an object. Any JSON serializable type is allowed here."
+    )
+    logger: Optional[str] = Field(
+        None, description="An optional name of the logger issuing this message."
     )
 
 
-class ElicitRequest(BaseModel):
-    """A request from the server to elicit additional information from the user via the client."""
+class LoggingMessageNotification(SchemaModel):
+    """Notification of a log message passed from server to client. If no logging/setLevel request has been sent from the client, the server MAY decide which messages to send automatically."""
 
-    method: Literal["elicitation/create"] = "elicitation/create"
-    params: ElicitRequestParams
+    method: Literal["notifications/message"] = "notifications/message"
+    params: LoggingMessageNotificationParams
 
 
-class ElicitResult(Result):
-    """The client's response to an elicitation request."""
+class NumberSchema(SchemaModel):
+    type: Literal["integer", "number"]
+    title: Optional[str] = None
+    description: Optional[str] = None
+    minimum: Optional[int] = None
+    maximum: Optional[int] = None
 
-    action: Literal["accept", "decline", "cancel"] = Field(
-        description='The user action in response to the elicitation.\n- "accept": User submitted the form/confirmed the action\n- "decline": User explicitly declined the action\n- "cancel": User dismissed without making an explicit choice'
-    )
-    content: Optional[Dict[str, Union[str, int, bool]]] = Field(
-        None,
-        description='The submitted form data, only present when action is "accept".\nContains values matching the requested schema.',
-    )
 
+class PrimitiveSchemaDefinition(SchemaModel):
+    """Restricted schema definitions that only allow primitive types
+    without nested objects or arrays."""
 
-class CompleteRequestArgumentParams(BaseModel):
-    name: str = Field(description="The name of the argument")
-    value: str = Field(
-        description="The value of the argument to use for completion matching."
-    )
 
+ProgressToken: TypeAlias = Union[str, int]
 
-class CompleteRequestContextParams(BaseModel):
-    arguments: Optional[Dict[str, str]] = Field(
-        None, description="Previously-resolved variables in a URI template or prompt."
-    )
 
+class PromptListChangedNotificationParams(SchemaModel):
+    _meta: Optional[Dict[str, Any]] = None
 
-class CompleteRequestParams(BaseModel):
-    ref: Union[PromptReference, ResourceTemplateReference]
-    argument: CompleteRequestArgumentParams = Field(
-        description="The argument's information"
-    )
-    context: Optional[CompleteRequestContextParams] = Field(
-        None, description="Additional, optional context for completions"
-    )
 
+class PromptListChangedNotification(SchemaModel):
+    """An optional notification from the server to the client, informing it that the list of prompts it offers has changed. This may be issued by servers without any previous subscription from the client."""
 
-class CompleteRequest(BaseModel):
-    """A request from the client to the server, to ask for completion options."""
+    method: Literal["notifications/prompts/list_changed"] = (
+        "notifications/prompts/list_changed"
+    )
+    params: Optional[PromptListChangedNotificationParams] = None
 
-    method: Literal["completion/complete"] = "completion/complete"
-    params: CompleteRequestParams
 
+class ReadResourceResult(Result):
+    """The server's response to a resources/read request from the client."""
 
-class CompletionValues(BaseModel):
-    values: List[str] = Field(
-        description="An array of completion values. Must not exceed 100 items."
-    )
-    total: Optional[int] = Field(
-        None,
-        description="The total number of completion options available. This can exceed the number of values actually sent in the response.",
-    )
-    hasMore: Optional[bool] = Field(
-        None,
-        description="Indicates whether there are additional completion options beyond those provided in the current response, even if the exact total is unknown.",
-    )
+    contents: List[Union[TextResourceContents, BlobResourceContents]]
 
 
-class CompleteResult(Result):
-    """The server's response to a completion/complete request"""
+RequestId: TypeAlias = Union[str, int]
 
-    completion: CompletionValues
 
+class ResourceListChangedNotificationParams(SchemaModel):
+    _meta: Optional[Dict[str, Any]] = None
 
-# JSON-RPC message models
-class JSONRPCNotification(BaseModel):
-    """A notification which does not expect a response."""
 
-    jsonrpc: Literal["2.0"] = "2.0"
-    method: str
-    params: Optional[Dict[str, Any]] = None
+class ResourceListChangedNotification(SchemaModel):
+    """An optional notification from the server to the client, informing it that the list of resources it can read from has changed. This may be issued by servers without any previous subscription from the client."""
 
+    method: Literal["notifications/resources/list_changed"] = (
+        "notifications/resources/list_changed"
+    )
+    params: Optional[ResourceListChangedNotificationParams] = None
 
-class JSONRPCRequest(BaseModel):
-    """A request that expects a response."""
 
-    jsonrpc: Literal["2.0"] = "2.0"
-    id: RequestId
-    method: str
-    params: Optional[Dict[str, Any]] = None
+class ResourceUpdatedNotificationParams(SchemaModel):
+    uri: str = Field(
+        description="The URI of the resource that has been updated. This might be a sub-resource of the one that the client actually subscribed to."
+    )
 
 
-class JSONRPCResponse(BaseModel):
-    """A successful (non-error) response to a request."""
+class ResourceUpdatedNotification(SchemaModel):
+    """A notification from the server to the client, informing it that a resource has changed and may need to be read again. This should only be sent if the client previously sent a resources/subscribe request."""
 
-    jsonrpc: Literal["2.0"] = "2.0"
-    id: RequestId
-    result: Result
+    method: Literal["notifications/resources/updated"] = (
+        "notifications/resources/updated"
+    )
+    params: ResourceUpdatedNotificationParams
 
 
-class JSONRPCError(BaseModel):
-    """A response to a request that indicates an error occurred."""
+class ToolListChangedNotificationParams(SchemaModel):
+    _meta: Optional[Dict[str, Any]] = None
 
-    jsonrpc: Literal["2.0"] = "2.0"
-    id: RequestId
-    error: Dict[str, Any]
 
+class ToolListChangedNotification(SchemaModel):
+    """An optional notification from the server to the client, informing it that the list of tools it offers has changed. This may be issued by servers without any previous subscription from the client."""
 
-# Type aliases for unions
-JSONRPCMessage: TypeAlias = Union[
-    JSONRPCRequest, JSONRPCNotification, JSONRPCResponse, JSONRPCError
-]
+    method: Literal["notifications/tools/list_changed"] = (
+        "notifications/tools/list_changed"
+    )
+    params: Optional[ToolListChangedNotificationParams] = None
 
-ClientNotification: TypeAlias = Union[
-    CancelledNotification,
-    InitializedNotification,
-    ProgressNotification,
-    RootsListChangedNotification,
-]
 
-ClientRequest: TypeAlias = Union[
-    InitializeRequest,
-    PingRequest,
-    ListResourcesRequest,
-    ListResourceTemplatesRequest,
-    ReadResourceRequest,
-    SubscribeRequest,
-    UnsubscribeRequest,
-    ListPromptsRequest,
-    GetPromptRequest,
-    ListToolsRequest,
-    CallToolRequest,
-    SetLevelRequest,
-    CompleteRequest,
+ServerNotification: TypeAlias = Annotated[
+    Union[
+        CancelledNotification,
+        ProgressNotification,
+        ResourceListChangedNotification,
+        ResourceUpdatedNotification,
+        PromptListChangedNotification,
+        ToolListChangedNotification,
+        LoggingMessageNotification,
+    ],
+    Field(discriminator="method"),
 ]
 
-ClientResult: TypeAlias = Union[
-    Result, CreateMessageResult, ListRootsResult, ElicitResult
-]
 
-ServerNotification: TypeAlias = Union[
-    CancelledNotification,
-    ProgressNotification,
-    ResourceListChangedNotification,
-    ResourceUpdatedNotification,
-    PromptListChangedNotification,
-    ToolListChangedNotification,
-    LoggingMessageNotification,
+ServerRequest: TypeAlias = Annotated[
+    Union[PingRequest, CreateMessageRequest, ListRootsRequest, ElicitRequest],
+    Field(discriminator="method"),
 ]
 
-ServerRequest: TypeAlias = Union[
-    PingRequest, CreateMessageRequest, ListRootsRequest, ElicitRequest
-]
 
 ServerResult: TypeAlias = Union[
     Result,
@@ -1212,3 +1219,12 @@ ServerResult: TypeAlias = Union[
     CallToolResult,
     CompleteResult,
 ]
+
+
+class StringSchema(SchemaModel):
+    type: Literal["string"] = "string"
+    title: Optional[str] = None
+    description: Optional[str] = None
+    minLength: Optional[int] = None
+    maxLength: Optional[int] = None
+    format: Optional[Literal["date", "date-time", "email", "uri"]] = None
@@ -0,0 +1,252 @@
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+import jwt
+from pydantic import BaseModel, ConfigDict
+from backend.auth.utils import User
+from backend.db import DB_BACKEND, get_connection_pool
+from backend.db.sqlite import ConnectionPool
+from backend.mcp.resources import subscriptions
+from backend.mcp.schema import ClientCapabilities, Implementation
+from backend.mcp.streams import stream_key, streams
+
+# Seconds a session survives without requests
+MCP_SESSION_TTL = float(os.environ.get("MCP_SESSION_TTL", "3600"))
+# Sessions kept at once, least recently used ones are dropped first
+MCP_MAX_SESSIONS = int(os.environ.get("MCP_MAX_SESSIONS", "10000"))
+# Seconds between writes of `last_used_at` to a shared session store, so that
+# not every request waits for the SQLite writer
+MCP_SESSION_TOUCH_INTERVAL = float(os.environ.get("MCP_SESSION_TOUCH_INTERVAL", "60"))
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def token_expires_at(token: str) -> float:
+    """Expiry of an access token that was already verified, or no expiry for other tokens"""
+    try:
+        payload = jwt.decode(token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return float("inf")
+    return float(payload.get("exp", "inf"))
+
+
+class Session(BaseModel):
+    """State negotiated on `initialize` and reused by the requests that follow"""
+
+    # Tokens without an expiry never expire, also once stored as JSON
+    model_config = ConfigDict(ser_json_inf_nan="constants")
+
+    id: str
+    user: User
+    protocol_version: str
+    client_info: Implementation
+    client_capabilities: ClientCapabilities
+    token_hash: str
+    token_expires_at: float
+    last_used_at: float
+
+    def authenticates(self, token: str) -> bool:
+        """Whether `token` is the already verified token this session was opened with"""
+        return time.time() < self.token_expires_at and hmac.compare_digest(
+            self.token_hash, hash_token(token)
+        )
+
+    def remember_token(self, token: str):
+        self.token_hash = hash_token(token)
+        self.token_expires_at = token_expires_at(token)
+
+
+class SessionStore:
+    """Sessions by `Mcp-Session-Id`, dropped after MCP_SESSION_TTL seconds unused.
+
+    Ids are random and unguessable. The access token isn't stored, only its
+    hash, so a request that presents the same token can skip verifying it.
+    """
+
+    def __init__(self):
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _new(
+        user: User,
+        token: str,
+        protocol_version: str,
+        client_info: Implementation,
+        client_capabilities: ClientCapabilities,
+    ) -> Session:
+        return Session(
+            id=secrets.token_urlsafe(32),
+            user=user,
+            protocol_version=protocol_version,
+            client_info=client_info,
+            client_capabilities=client_capabilities,
+            token_hash=hash_token(token),
+            token_expires_at=token_expires_at(token),
+            last_used_at=time.time(),
+        )
+
+    def create(
+        self,
+        user: User,
+        token: str,
+        protocol_version: str,
+        client_info: Implementation,
+        client_capabilities: ClientCapabilities,
+    ) -> Session:
+        session = self._new(
+            user, token, protocol_version, client_info, client_capabilities
+        )
+        now = session.last_used_at
+        with self._lock:
+            self._sessions[session.id] = session
+            # Least recently used first, so expired sessions are at the front
+            while self._sessions:
+                oldest = next(iter(self._sessions.values()))
+                if (
+                    len(self._sessions) <= MCP_MAX_SESSIONS
+                    and now - oldest.last_used_at < MCP_SESSION_TTL
+                ):
+                    break
+                self._drop(oldest)
+        return session
+
+    def get(self, session_id: str) -> Optional[Session]:
+        now = time.time()
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            if now - session.last_used_at >= MCP_SESSION_TTL:
+                self._drop(session)
+                return None
+            session.last_used_at = now
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return False
+            self._drop(session)
+            return True
+
+    def remember_token(self, session: Session, token: str):
+        """Let `session` authenticate `token` from now on, e.g. after a token refresh"""
+        session.remember_token(token)
+
+    def _drop(self, session: Session):
+        del self._sessions[session.id]
+        forget(session)
+
+
+def forget(session: Session):
+    """Drop what this process keeps for a session that ended"""
+    key = stream_key(session.id, session.user)
+    streams.discard(key)
+    subscriptions.unsubscribe_all(key)
+
+
+class SQLiteSessionStore(SessionStore):
+    """Sessions in the `mcp_sessions` table, so every worker process sharing the
+    database accepts the session ids that any of them issued.
+
+    Only the sessions are shared. Server-to-client streams, their replay
+    buffers, subscriptions and the requests a cancellation can reach stay
+    in the worker that has them, see the README.
+    """
+
+    def __init__(self, pool: Callable[[], ConnectionPool] = get_connection_pool):
+        # Called on use, so the database is only opened once a session is
+        self._pool = pool
+
+    def create(
+        self,
+        user: User,
+        token: str,
+        protocol_version: str,
+        client_info: Implementation,
+        client_capabilities: ClientCapabilities,
+    ) -> Session:
+        session = self._new(
+            user, token, protocol_version, client_info, client_capabilities
+        )
+        with self._pool().connection() as conn, conn:
+            conn.execute(
+                "DELETE FROM mcp_sessions WHERE last_used_at <= ?",
+                (session.last_used_at - MCP_SESSION_TTL,),
+            )
+            conn.execute(
+                "INSERT INTO mcp_sessions (id, data, last_used_at) VALUES (?, ?, ?)",
+                (session.id, dump_session(session), session.last_used_at),
+            )
+            # Least recently used first
+            conn.execute(
+                "DELETE FROM mcp_sessions WHERE id IN (SELECT id FROM mcp_sessions "
+                "ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                (MCP_MAX_SESSIONS,),
+            )
+        return session
+
+    def get(self, session_id: str) -> Optional[Session]:
+        now = time.time()
+        with self._pool().connection() as conn:
+            row = conn.execute(
+                "SELECT data, last_used_at FROM mcp_sessions WHERE id = ?",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            session = load_session(row["data"], row["last_used_at"])
+            expired = now - session.last_used_at >= MCP_SESSION_TTL
+            if not expired and now - session.last_used_at >= MCP_SESSION_TOUCH_INTERVAL:
+                with conn:
+                    conn.execute(
+                        "UPDATE mcp_sessions SET last_used_at = ? WHERE id = ?",
+                        (now, session_id),
+                    )
+                session.last_used_at = now
+        if expired:
+            self.delete(session_id)
+            return None
+        return session
+
+    def delete(self, session_id: str) -> bool:
+        with self._pool().connection() as conn, conn:
+            row = conn.execute(
+                "DELETE FROM mcp_sessions WHERE id = ? RETURNING data, last_used_at",
+                (session_id,),
+            ).fetchone()
+        if row is None:
+            return False
+        forget(load_session(row["data"], row["last_used_at"]))
+        return True
+
+    def remember_token(self, session: Session, token: str):
+        session.remember_token(token)
+        with self._pool().connection() as conn, conn:
+            conn.execute(
+                "UPDATE mcp_sessions SET data = ? WHERE id = ?",
+                (dump_session(session), session.id),
+            )
+
+
+def dump_session(session: Session) -> str:
+    return session.model_dump_json(by_alias=True, exclude={"last_used_at"})
+
+
+def load_session(data: str, last_used_at: float) -> Session:
+    return Session.model_validate({**json.loads(data), "last_used_at": last_used_at})
+
+
+# Shared by the worker processes when they share the database
+sessions = SQLiteSessionStore() if DB_BACKEND == "sqlite" else SessionStore()
@@ -0,0 +1,170 @@
+import asyncio
+import itertools
+import os
+import threading
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Deque, Optional, Set, Tuple
+from pydantic import BaseModel
+from backend.auth.utils import User
+from backend.mcp.notifications import hub
+
+# Events kept per stream so a reconnecting client can replay what it missed
+MCP_STREAM_BUFFER = int(os.environ.get("MCP_STREAM_BUFFER", "1000"))
+# Events queued for one connection before the client is considered too slow
+# and disconnected; it resumes from the replay buffer with Last-Event-ID
+MCP_STREAM_QUEUE = int(os.environ.get("MCP_STREAM_QUEUE", "100"))
+# Streams kept at once, least recently used ones are dropped first
+MCP_MAX_STREAMS = int(os.environ.get("MCP_MAX_STREAMS", "10000"))
+# Seconds of silence after which a comment is sent to keep proxies from timing out
+MCP_STREAM_KEEPALIVE = float(os.environ.get("MCP_STREAM_KEEPALIVE", "15"))
+
+Event = Tuple[int, bytes]  # event id, encoded SSE frame
+
+# Event ids are shared by all streams, so a stream created again for a key
+# whose stream was dropped continues after the ids its clients have seen
+_event_ids = itertools.count(1)
+
+
+def dump_message(message: BaseModel) -> bytes:
+    """JSON of `message` as bytes, straight from its compiled serializer.
+
+    `serialize_as_any` serializes every value by its own class, so a result
+    declared as `Result` keeps its fields and content unions skip trying each
+    member in turn."""
+    return message.__pydantic_serializer__.to_json(
+        message, exclude_none=True, serialize_as_any=True
+    )
+
+
+class _Connection:
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[Optional[Event]] = asyncio.Queue(MCP_STREAM_QUEUE)
+
+    def deliver(self, event: Event):
+        """Runs on the connection's event loop"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Too slow: drop what is queued and end the connection
+            self.close()
+
+    def close(self):
+        """Runs on the connection's event loop"""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class Stream:
+    """Outbound messages of one session, delivered over GET /mcp.
+
+    Every message gets an increasing event id and is encoded once into an SSE
+    frame, kept in a ring buffer of the last MCP_STREAM_BUFFER events and
+    queued to each open connection. `publish` may be called from any thread.
+    `close` ends the open connections, whose clients then reconnect to the
+    stream that replaces this one.
+    """
+
+    def __init__(self):
+        self._events: Deque[Event] = deque(maxlen=MCP_STREAM_BUFFER)
+        self._connections: Set[_Connection] = set()
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def publish(self, message: BaseModel):
+        self.publish_json(dump_message(message))
+
+    def publish_json(self, data: bytes):
+        with self._lock:
+            event_id = next(_event_ids)
+            event = (
+                event_id,
+                b"id: %d\nevent: message\ndata: %s\n\n" % (event_id, data),
+            )
+            self._events.append(event)
+            for connection in self._connections:
+                connection.loop.call_soon_threadsafe(connection.deliver, event)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            for connection in self._connections:
+                connection.loop.call_soon_threadsafe(connection.close)
+            self._connections.clear()
+
+    async def listen(self, last_event_id: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Yield SSE frames, first the ones after `last_event_id`, until disconnected"""
+        connection = _Connection()
+        with self._lock:
+            if self._closed:
+                return
+            replay = []
+            if last_event_id is not None:
+                replay = [
+                    frame
+                    for event_id, frame in self._events
+                    if event_id > last_event_id
+                ]
+            self._connections.add(connection)
+
+        try:
+            for frame in replay:
+                yield frame
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        connection.queue.get(), MCP_STREAM_KEEPALIVE
+                    )
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                if event is None:
+                    return
+                yield event[1]
+        finally:
+            with self._lock:
+                self._connections.discard(connection)
+
+
+class Streams:
+    """Streams by key, at most MCP_MAX_STREAMS of them"""
+
+    def __init__(self):
+        self._streams: OrderedDict[str, Stream] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Stream:
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is None:
+                stream = self._streams[key] = Stream()
+                if len(self._streams) > MCP_MAX_STREAMS:
+                    self._streams.popitem(last=False)[1].close()
+            else:
+                self._streams.move_to_end(key)
+            return stream
+
+    def discard(self, key: str):
+        with self._lock:
+            stream = self._streams.pop(key, None)
+        if stream is not None:
+            stream.close()
+
+    def broadcast(self, message: BaseModel):
+        data = dump_message(message)
+        with self._lock:
+            streams = list(self._streams.values())
+        for stream in streams:
+            stream.publish_json(data)
+
+
+def stream_key(session_id: Optional[str], user: User) -> str:
+    """Streams belong to the MCP session, or to the user without one"""
+    if session_id:
+        return f"session:{session_id}"
+    return f"user:{user.id}"
+
+
+streams = Streams()
+hub.subscribe(streams.broadcast)
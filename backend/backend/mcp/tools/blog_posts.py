@@ -0,0 +1,264 @@
+from typing import Any, Dict
+from backend.auth.utils import User
+from backend.db import (
+    get_blog_post_id_index,
+    get_blog_post_repository,
+    get_search_index,
+)
+from backend.db.base import ORDER_BY, decode_cursor, encode_cursor, sort_key
+from backend.mcp.resources import blog_post_uri, subscriptions
+from backend.mcp.schema import CallToolResult, TextContent, ToolAnnotations
+from backend.mcp.tools.cache import result_cache
+from backend.mcp.tools.registry import tool
+
+SEARCH_DEFAULT_LIMIT = 10
+SEARCH_MAX_LIMIT = 50
+LIST_DEFAULT_LIMIT = 20
+LIST_MAX_LIMIT = 100
+SNIPPET_LENGTH = 200
+# Cache tag of results that depend on which posts a user has, e.g. lists and searches
+BLOG_POSTS_TAG = "blog://posts"
+# Digit strings are accepted as well, clients sent ids as strings before ids had a schema
+# Bounded to what the stores hold, SQLite integers are 64-bit
+BLOG_POST_ID_SCHEMA = {
+    "type": ["integer", "string"],
+    "minimum": 1,
+    "maximum": 2**63 - 1,
+    "pattern": "^[0-9]{1,18}$",
+    "description": "Id of the blog post",
+}
+
+
+def snippet(content: str) -> str:
+    text = " ".join(content.split())
+    if len(text) > SNIPPET_LENGTH:
+        text = text[:SNIPPET_LENGTH] + "..."
+    return text
+
+
+def blog_post_not_found(user: User, blog_post_id: int) -> CallToolResult:
+    return CallToolResult(
+        content=[
+            TextContent(text=f"Blog post {blog_post_id} not found for user {user.id}")
+        ],
+        isError=True,
+    )
+
+
+@tool(
+    name="read_blog_post",
+    description="Read a blog post that the user wrote",
+    input_schema={
+        "type": "object",
+        "properties": {"blog_post_id": BLOG_POST_ID_SCHEMA},
+        "required": ["blog_post_id"],
+    },
+    annotations=ToolAnnotations(readOnlyHint=True),
+    cache_tags=lambda arguments: [blog_post_uri(int(arguments["blog_post_id"]))],
+)
+def read_blog_post(user: User, arguments: Dict[str, Any]) -> CallToolResult:
+    blog_post_id = int(arguments["blog_post_id"])
+    blog_post = get_blog_post_repository().get(user.id, blog_post_id)
+
+    if blog_post is None:
+        return blog_post_not_found(user, blog_post_id)
+
+    return CallToolResult(
+        content=[
+            TextContent(
+                text=f"Here is the content of the blog post {blog_post_id} authored by {user.username}\n\n{blog_post.content}"
+            )
+        ],
+    )
+
+
+@tool(
+    name="create_blog_post",
+    description="Create a new blog post",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "content": {
+                "type": "string",
+                "description": "Content of the blog post",
+            }
+        },
+        "required": ["content"],
+    },
+    annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=False),
+)
+def create_blog_post(user: User, arguments: Dict[str, Any]) -> CallToolResult:
+    blog_post = get_blog_post_repository().create(user.id, arguments["content"])
+    get_search_index().index_post(blog_post)
+    get_blog_post_id_index().index_post(blog_post)
+    result_cache.invalidate(user.id, BLOG_POSTS_TAG)
+
+    return CallToolResult(
+        content=[
+            TextContent(
+                text=f"New blog post {blog_post.id} is successfully created by {user.username}"
+            )
+        ]
+    )
+
+
+@tool(
+    name="update_blog_post",
+    description="Update an existing blog post",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "blog_post_id": BLOG_POST_ID_SCHEMA,
+            "new_content": {
+                "type": "string",
+                "description": "New content of the blog post",
+            },
+        },
+        "required": ["blog_post_id", "new_content"],
+    },
+    annotations=ToolAnnotations(readOnlyHint=False, idempotentHint=True),
+)
+def update_blog_post(user: User, arguments: Dict[str, Any]) -> CallToolResult:
+    blog_post_id = int(arguments["blog_post_id"])
+    blog_post = get_blog_post_repository().update(
+        user.id, blog_post_id, arguments["new_content"]
+    )
+
+    if blog_post is None:
+        return blog_post_not_found(user, blog_post_id)
+
+    get_search_index().index_post(blog_post)
+    result_cache.invalidate(user.id, blog_post_uri(blog_post_id), BLOG_POSTS_TAG)
+    subscriptions.notify_updated(blog_post_uri(blog_post_id))
+
+    return CallToolResult(
+        content=[
+            TextContent(
+                text=f"Existing blog post {blog_post_id} is successfully updated by {user.username}"
+            )
+        ],
+    )
+
+
+@tool(
+    name="search_blog_posts",
+    description="Search the blog posts that the user wrote by keywords, best matches first",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Keywords to search for",
+            },
+            "limit": {
+                "type": "integer",
+                "description": f"Maximum number of blog posts to return (default: {SEARCH_DEFAULT_LIMIT}, max: {SEARCH_MAX_LIMIT})",
+            },
+        },
+        "required": ["query"],
+    },
+    annotations=ToolAnnotations(readOnlyHint=True),
+    cache_tags=lambda arguments: [BLOG_POSTS_TAG],
+)
+def search_blog_posts(user: User, arguments: Dict[str, Any]) -> CallToolResult:
+    query = arguments["query"]
+    limit = int(arguments.get("limit", SEARCH_DEFAULT_LIMIT))
+    limit = max(1, min(limit, SEARCH_MAX_LIMIT))
+
+    matches = get_search_index().search(user.id, query, limit)
+    if not matches:
+        return CallToolResult(
+            content=[
+                TextContent(text=f'No blog posts matched "{query}" for user {user.id}')
+            ],
+        )
+
+    repository = get_blog_post_repository()
+    lines = [
+        f'Found {len(matches)} blog posts matching "{query}" authored by {user.username}'
+    ]
+    for blog_post_id, score in matches:
+        blog_post = repository.get(user.id, blog_post_id)
+        if blog_post is None:
+            continue
+        lines.append(
+            f"- Blog post {blog_post_id} (score: {score:.2f}): {snippet(blog_post.content)}"
+        )
+
+    return CallToolResult(content=[TextContent(text="\n".join(lines))])
+
+
+@tool(
+    name="list_blog_posts",
+    description="List the blog posts that the user wrote, one page at a time",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "order_by": {
+                "type": "string",
+                "enum": list(ORDER_BY),
+                "description": "Column to order by (default: created_at)",
+            },
+            "order": {
+                "type": "string",
+                "enum": ["asc", "desc"],
+                "description": "Sort direction (default: desc)",
+            },
+            "limit": {
+                "type": "integer",
+                "description": f"Maximum number of blog posts to return (default: {LIST_DEFAULT_LIMIT}, max: {LIST_MAX_LIMIT})",
+            },
+            "cursor": {
+                "type": "string",
+                "pattern": "^[A-Za-z0-9_-]*$",
+                "maxLength": 200,
+                "description": "Cursor returned by the previous call to get the next page. Ordering follows the cursor.",
+            },
+        },
+    },
+    annotations=ToolAnnotations(readOnlyHint=True),
+    cache_tags=lambda arguments: [BLOG_POSTS_TAG],
+)
+def list_blog_posts(user: User, arguments: Dict[str, Any]) -> CallToolResult:
+    limit = int(arguments.get("limit", LIST_DEFAULT_LIMIT))
+    limit = max(1, min(limit, LIST_MAX_LIMIT))
+
+    if arguments.get("cursor"):
+        try:
+            order_by, descending, after = decode_cursor(arguments["cursor"])
+        except ValueError as e:
+            return CallToolResult(content=[TextContent(text=str(e))], isError=True)
+    else:
+        order_by = arguments.get("order_by", "created_at")
+        descending = arguments.get("order", "desc") == "desc"
+        after = None
+
+    # Fetch one extra row to know whether there is a next page
+    blog_posts = get_blog_post_repository().list_page(
+        user.id, order_by, descending, after, limit + 1
+    )
+    has_more = len(blog_posts) > limit
+    blog_posts = blog_posts[:limit]
+
+    if not blog_posts:
+        return CallToolResult(
+            content=[TextContent(text=f"No more blog posts found for user {user.id}")],
+        )
+
+    lines = [
+        f"Blog posts authored by {user.username} ordered by {order_by} ({'desc' if descending else 'asc'})"
+    ]
+    for blog_post in blog_posts:
+        lines.append(
+            f"- Blog post {blog_post.id} (created: {blog_post.created_at.isoformat()}, updated: {blog_post.updated_at.isoformat()}): {snippet(blog_post.content)}"
+        )
+
+    if has_more:
+        next_cursor = encode_cursor(
+            order_by, descending, sort_key(blog_posts[-1], order_by)
+        )
+        lines.append(
+            f"\nMore blog posts are available. Call list_blog_posts with cursor {next_cursor} to get the next page."
+        )
+
+    return CallToolResult(content=[TextContent(text="\n".join(lines))])
@@ -0,0 +1,117 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Set, Tuple
+from backend.db import DB_BACKEND
+
+# Bytes of serialized results kept at once, least recently used ones are dropped first.
+# Off by default with a shared database, where other workers' writes never
+# invalidate this process's results.
+MCP_TOOL_CACHE_MAX_BYTES = int(
+    os.environ.get(
+        "MCP_TOOL_CACHE_MAX_BYTES", str(64 << 20) if DB_BACKEND == "memory" else "0"
+    )
+)
+
+# user id, tool name, arguments as canonical JSON
+CacheKey = Tuple[int, str, str]
+
+
+class CachedResult(NamedTuple):
+    serialized: bytes
+    tags: Tuple[str, ...]
+
+
+class ResultCache:
+    """Serialized results of read-only tools, per user, by tool name and arguments.
+
+    Every result carries tags naming the data it was computed from, e.g. the
+    URI of a post, and a write drops the results carrying the tags it touched
+    with `invalidate`. A hit returns the JSON as stored, so it skips the
+    repository, the handler and pydantic alike.
+
+    A result computed while an invalidation for its user ran may already be
+    stale, so `put` ignores results older than that user's last `generation`,
+    and other users' writes leave it alone. Handlers invalidate from worker
+    threads, so every method takes the lock.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._generations: Dict[int, int] = {}
+        self._entries: OrderedDict[CacheKey, CachedResult] = OrderedDict()
+        self._keys_by_tag: Dict[Tuple[int, str], Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(user_id: int, name: str, arguments: Dict[str, Any]) -> CacheKey:
+        return (
+            user_id,
+            name,
+            json.dumps(arguments, sort_keys=True, separators=(",", ":")),
+        )
+
+    def generation(self, user_id: int) -> int:
+        """Read before computing a result of the user, to pass to `put`"""
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def get(self, key: CacheKey) -> Optional[CachedResult]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+    def put(
+        self, key: CacheKey, tags: Iterable[str], generation: int, serialized: bytes
+    ) -> CachedResult:
+        """Store a result computed since `generation` was read, and return it"""
+        cached = CachedResult(serialized, tuple(tags))
+        if len(serialized) > self.max_bytes:
+            return cached
+
+        user_id = key[0]
+        with self._lock:
+            if generation != self._generations.get(user_id, 0):
+                return cached
+            self._drop(key)
+            self._entries[key] = cached
+            self.size += len(serialized)
+            for tag in cached.tags:
+                self._keys_by_tag.setdefault((user_id, tag), set()).add(key)
+            while self.size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+        return cached
+
+    def invalidate(self, user_id: int, *tags: str):
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            for tag in tags:
+                for key in self._keys_by_tag.pop((user_id, tag), ()):
+                    self._drop(key)
+
+    def _drop(self, key: CacheKey):
+        cached = self._entries.pop(key, None)
+        if cached is None:
+            return
+        self.size -= len(cached.serialized)
+        for tag in cached.tags:
+            keys = self._keys_by_tag.get((key[0], tag))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[(key[0], tag)]
+
+
+result_cache = ResultCache(MCP_TOOL_CACHE_MAX_BYTES)
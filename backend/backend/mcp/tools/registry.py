@@ -0,0 +1,219 @@
+import ast
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from backend.mcp.executors import DEFAULT
+from backend.mcp.notifications import hub
+from backend.mcp.schema import (
+    CallToolResult,
+    JSONRPCNotification,
+    ListToolsResult,
+    Tool,
+    ToolAnnotations,
+    ToolListChangedNotification,
+)
+from backend.mcp.tools.validation import Validator, compile_schema
+
+# Called as `handler(user, arguments)`, or `handler(user, arguments, context)`
+# when it takes a `context` parameter, see `backend.mcp.context.ToolContext`
+ToolHandler = Callable[..., CallToolResult | Awaitable[CallToolResult]]
+# Tags of the data a read-only tool's result depends on, given its arguments
+CacheTags = Callable[[Dict[str, Any]], Iterable[str]]
+
+
+class RegisteredTool(NamedTuple):
+    definition: Tool
+    handler: ToolHandler
+    # Executor that runs a synchronous handler, see `backend.mcp.executors`
+    executor: str
+    takes_context: bool
+    # Set for read-only tools, whose results are cached, see `backend.mcp.tools.cache`
+    cache_tags: Optional[CacheTags]
+    # Compiled from the input schema, see `backend.mcp.tools.validation`
+    validate: Validator
+
+
+class ToolRegistry:
+    """Tools the server exposes, keyed by name.
+
+    Handlers register with the `tool` decorator and are looked up with a dict
+    access, so dispatch costs the same with five tools or five hundred. A
+    module declared with `register_module` is only imported when one of its
+    tools is first called or when the full tool list is needed, so startup
+    doesn't pay for tools nobody uses.
+
+    Handlers may be coroutine functions. Synchronous ones run on the thread
+    pool named by `executor`, or on the event loop itself with `INLINE`.
+
+    `version` changes whenever the tool list clients see changes, and every
+    change publishes `notifications/tools/list_changed`. Loading a declared
+    module doesn't count: its tools were part of the list all along.
+
+    Results of tools annotated with `readOnlyHint` are cached per user. Such
+    tools declare `cache_tags`, and the tools writing that data invalidate
+    those tags on `result_cache`.
+
+    `input_schema` is the JSON Schema of a tool's arguments. It is compiled
+    when the tool registers, and calls whose arguments don't match it are
+    rejected before the handler runs.
+    """
+
+    def __init__(self):
+        self._tools: Dict[str, RegisteredTool] = {}
+        self._pending: Dict[str, str] = {}  # tool name -> module registering it
+        self._lock = threading.Lock()
+        self.version = 0
+        self._serialized: Tuple[int, str, bytes] = (-1, "", b"")
+
+    def tool(
+        self,
+        name: str,
+        description: str,
+        input_schema: Dict[str, Any],
+        title: Optional[str] = None,
+        executor: str = DEFAULT,
+        annotations: Optional[ToolAnnotations] = None,
+        cache_tags: Optional[CacheTags] = None,
+    ) -> Callable[[ToolHandler], ToolHandler]:
+        read_only = annotations is not None and bool(annotations.readOnlyHint)
+        if read_only and cache_tags is None:
+            raise ValueError(f"Read-only tool {name} must declare cache_tags")
+        validate = compile_schema(input_schema)
+
+        def decorator(handler: ToolHandler) -> ToolHandler:
+            definition = Tool(
+                name=name,
+                title=title,
+                description=description,
+                inputSchema=input_schema,
+                annotations=annotations,
+            )
+            with self._lock:
+                if name in self._tools:
+                    raise ValueError(f"Tool {name} is already registered")
+                self._tools[name] = RegisteredTool(
+                    definition,
+                    handler,
+                    executor,
+                    "context" in inspect.signature(handler).parameters,
+                    cache_tags if read_only else None,
+                    validate,
+                )
+                changed = name not in self._pending
+                if changed:
+                    self.version += 1
+            if changed:
+                self._publish_list_changed()
+            return handler
+
+        return decorator
+
+    def unregister(self, name: str):
+        with self._lock:
+            self._pending.pop(name, None)
+            if self._tools.pop(name, None) is None:
+                return
+            self.version += 1
+        self._publish_list_changed()
+
+    def register_module(self, module: str):
+        """Declare the tools `module` registers without importing it yet.
+
+        Their names are read from the module's `@tool(name=...)` decorators,
+        so a tool is declared where it is defined and nowhere else."""
+        names = tool_names(module)
+        with self._lock:
+            for name in names:
+                self._pending[name] = module
+            self.version += 1
+        self._publish_list_changed()
+
+    def _publish_list_changed(self):
+        hub.publish(JSONRPCNotification(method=ToolListChangedNotification().method))
+
+    def _load(self, module: str):
+        importlib.import_module(module)
+        with self._lock:
+            for name in [name for name, m in self._pending.items() if m == module]:
+                if name not in self._tools:
+                    raise ValueError(f"Module {module} did not register tool {name}")
+                del self._pending[name]
+
+    def get(self, name: str) -> Optional[RegisteredTool]:
+        registered = self._tools.get(name)
+        if registered is None:
+            module = self._pending.get(name)
+            if module is not None:
+                self._load(module)
+                registered = self._tools.get(name)
+        return registered
+
+    def list_tools(self) -> List[Tool]:
+        for module in dict.fromkeys(self._pending.values()):
+            self._load(module)
+        return [registered.definition for registered in self._tools.values()]
+
+    def list_tools_json(self) -> Tuple[str, bytes]:
+        """Return the ETag and JSON of the `tools/list` result for the current version.
+
+        The result is serialized once per version instead of once per call."""
+        version, etag, serialized = self._serialized
+        if version != self.version:
+            version = self.version
+            serialized = ListToolsResult(tools=self.list_tools()).model_dump_json(
+                exclude_none=True
+            )
+            serialized = serialized.encode()
+            etag = '"' + hashlib.sha256(serialized).hexdigest()[:32] + '"'
+            self._serialized = (version, etag, serialized)
+        return etag, serialized
+
+
+def tool_names(module: str) -> List[str]:
+    """Names of the tools `module` registers, found by parsing it rather than importing it"""
+    spec = importlib.util.find_spec(module)
+    if spec is None or spec.origin is None:
+        raise ValueError(f"Module {module} not found")
+    with open(spec.origin, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), spec.origin)
+
+    names = []
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            if not (
+                isinstance(decorator, ast.Call)
+                and isinstance(decorator.func, ast.Name)
+                and decorator.func.id == "tool"
+            ):
+                continue
+            name = next(
+                (k.value for k in decorator.keywords if k.arg == "name"),
+                decorator.args[0] if decorator.args else None,
+            )
+            if not (isinstance(name, ast.Constant) and isinstance(name.value, str)):
+                raise ValueError(
+                    f"Tool {node.name} in {module} must have a literal name to be loaded lazily"
+                )
+            names.append(name.value)
+    return names
+
+
+registry = ToolRegistry()
+tool = registry.tool
+
+registry.register_module("backend.mcp.tools.blog_posts")
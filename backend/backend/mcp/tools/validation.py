@@ -0,0 +1,194 @@
+import re
+from typing import Any, Callable, Dict, List
+
+# Appends what is wrong with the value found at `path` to the errors
+Check = Callable[[Any, str, List[str]], None]
+# Returns what is wrong with the arguments of a tool call, nothing when they are valid
+Validator = Callable[[Dict[str, Any]], List[str]]
+
+
+def is_integer(value: Any) -> bool:
+    # JSON has a single number type, so 1.0 is an integer too
+    if isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def json_equal(a: Any, b: Any) -> bool:
+    # Unlike in Python, booleans are no numbers in JSON, also inside arrays and objects
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(map(json_equal, a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(json_equal(a[k], b[k]) for k in a)
+    return a == b
+
+
+TYPES: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": is_integer,
+    "number": is_number,
+    "boolean": lambda value: isinstance(value, bool),
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "null": lambda value: value is None,
+}
+
+# Keywords that only document a value
+ANNOTATIONS = {"title", "description", "default", "examples", "$comment"}
+KEYWORDS = ANNOTATIONS | {
+    "type",
+    "enum",
+    "minimum",
+    "maximum",
+    "minLength",
+    "maxLength",
+    "pattern",
+    "items",
+    "properties",
+    "required",
+    "additionalProperties",
+}
+
+
+def type_name(value: Any) -> str:
+    for name, test in TYPES.items():
+        if test(value):
+            return name
+    return type(value).__name__
+
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    """Compile the JSON Schema of a tool's arguments into a validator.
+
+    The schema is read once, here, and turned into nested closures, so a call
+    only runs the checks its schema asks for. Only the keywords tools use are
+    supported, and any other raises `ValueError` so that no part of a schema
+    is silently left unchecked.
+    """
+    check = _compile(schema)
+
+    def validate(arguments: Dict[str, Any]) -> List[str]:
+        errors: List[str] = []
+        check(arguments, "arguments", errors)
+        return errors
+
+    return validate
+
+
+def _compile(schema: Dict[str, Any]) -> Check:
+    unknown = schema.keys() - KEYWORDS
+    if unknown:
+        raise ValueError(
+            f"Unsupported JSON Schema keywords: {', '.join(sorted(unknown))}"
+        )
+
+    checks: List[Check] = []
+    if "type" in schema:
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        for name in types:
+            if name not in TYPES:
+                raise ValueError(f"Unknown JSON Schema type: {name}")
+        tests = [TYPES[name] for name in types]
+        expected = " or ".join(types)
+
+        def check_type(value: Any, path: str, errors: List[str]):
+            if not any(test(value) for test in tests):
+                errors.append(f"{path}: expected {expected}, got {type_name(value)}")
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        values = schema["enum"]
+        allowed = ", ".join(str(value) for value in values)
+
+        def check_enum(value: Any, path: str, errors: List[str]):
+            if not any(json_equal(value, option) for option in values):
+                errors.append(f"{path}: must be one of {allowed}, got {value}")
+
+        checks.append(check_enum)
+
+    if "minimum" in schema or "maximum" in schema:
+        minimum = schema.get("minimum", float("-inf"))
+        maximum = schema.get("maximum", float("inf"))
+
+        def check_range(value: Any, path: str, errors: List[str]):
+            if is_number(value) and not minimum <= value <= maximum:
+                errors.append(
+                    f"{path}: must be between {minimum} and {maximum}, got {value}"
+                )
+
+        checks.append(check_range)
+
+    if "minLength" in schema or "maxLength" in schema:
+        min_length = schema.get("minLength", 0)
+        max_length = schema.get("maxLength", float("inf"))
+
+        def check_length(value: Any, path: str, errors: List[str]):
+            if isinstance(value, str) and not min_length <= len(value) <= max_length:
+                errors.append(
+                    f"{path}: length must be between {min_length} and {max_length}, got {len(value)}"
+                )
+
+        checks.append(check_length)
+
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+
+        def check_pattern(value: Any, path: str, errors: List[str]):
+            if isinstance(value, str) and not pattern.search(value):
+                errors.append(f"{path}: must match {pattern.pattern}")
+
+        checks.append(check_pattern)
+
+    if "items" in schema:
+        check_item = _compile(schema["items"])
+
+        def check_items(value: Any, path: str, errors: List[str]):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    check_item(item, f"{path}[{i}]", errors)
+
+        checks.append(check_items)
+
+    if {"properties", "required", "additionalProperties"} & schema.keys():
+        checks.append(_compile_object(schema))
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any, path: str, errors: List[str]):
+        for check in checks:
+            check(value, path, errors)
+
+    return check_all
+
+
+def _compile_object(schema: Dict[str, Any]) -> Check:
+    properties = {
+        name: _compile(property_schema)
+        for name, property_schema in schema.get("properties", {}).items()
+    }
+    required = schema.get("required", [])
+    additional = schema.get("additionalProperties", True)
+    check_additional = _compile(additional) if isinstance(additional, dict) else None
+
+    def check_object(value: Any, path: str, errors: List[str]):
+        if not isinstance(value, dict):
+            return
+        for name in required:
+            if name not in value:
+                errors.append(f"{path}.{name}: required")
+        for name, item in value.items():
+            check = properties.get(name, check_additional)
+            if check is not None:
+                check(item, f"{path}.{name}", errors)
+            elif additional is False:
+                errors.append(f"{path}.{name}: unexpected")
+
+    return check_object
@@ -1,6 +1,9 @@
+import asyncio
+import json
 from fastapi import APIRouter
-from typing import Annotated, List
-from backend.auth.utils import User, get_current_user
+from typing import Annotated, List, Optional
+from pydantic import ValidationError
+from backend.auth.utils import User, get_current_user, oauth2_scheme
 from fastapi import (
     Depends,
     HTTPException,
@@ -8,27 +11,109 @@ from fastapi import (
     Header,
     Response,
 )
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
 from backend.mcp.schema import (
+    JSONRPCNotification,
+    JSONRPCRequest,
     JSONRPCResponse,
     JSONRPCError,
 )
-from backend.mcp.process import process_rpc, get_mcp_version, JSONRPC
+from backend.mcp.context import Caller, progress_token
+from backend.mcp.parsing import (
+    MCP_MAX_BODY_BYTES,
+    ParsedRequest,
+    PayloadTooLarge,
+    parse_stream,
+)
+from backend.mcp.sessions import Session, sessions
+from backend.mcp.streams import stream_key, streams
+from backend.mcp.process import (
+    SerializedResult,
+    process_batch,
+    get_mcp_version,
+    dump_response,
+    JSONRPC,
+)
+
+# Frames around the messages of a streamed POST response, encoded once
+SSE_BEGIN = b"event: begin\n"
+SSE_END = b"event: end\ndata: {}\n\n"
+
+
+class PostStreamingResponse(StreamingResponse):
+    """A response streamed while the body of its request is still being read"""
+
+    def __init__(self, content, body_read: asyncio.Event, **kwargs):
+        super().__init__(content, **kwargs)
+        self.body_read = body_read
+
+    async def listen_for_disconnect(self, receive):
+        # Until the body is read, its chunks are for the request and would
+        # be dropped here. A disconnect meanwhile ends the body with an error.
+        await self.body_read.wait()
+        await super().listen_for_disconnect(receive)
+
+
+def parse_error_response(e: Exception) -> bytes:
+    """The error for a body that turned out to be invalid after its response started"""
+    # https://www.jsonrpc.org/specification#response_object
+    # If there was an error in detecting the id in the Request object (e.g. Parse error/Invalid Request), it MUST be Null.
+    if isinstance(e, ValidationError):
+        error = {"code": -32600, "message": "Invalid Request", "data": e.errors(include_url=False)}
+    elif isinstance(e, PayloadTooLarge):
+        error = {"code": -32600, "message": str(e)}
+    else:
+        error = {"code": -32700, "message": f"Invalid JSON body: {e}"}
+    return b'{"jsonrpc":"2.0","id":null,"error":%s}' % json.dumps(error, default=str).encode()
 
 
-def validate_mcp_headers(request: Request):
+def validate_mcp_headers(request: Request) -> Optional[Session]:
     if not request.headers.get("Origin"):
         raise HTTPException(status_code=400, detail="Missing Origin header")
 
+    # https://modelcontextprotocol.io/specification/2025-06-18/basic/transports#session-management
+    # The server MUST respond to requests containing a terminated session ID with HTTP 404 Not Found.
+    session: Optional[Session] = None
+    session_id = request.headers.get("Mcp-Session-Id")
+    if session_id:
+        session = sessions.get(session_id)
+        if session is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Session not found. Start a new session with initialize.",
+            )
+
     mcp_protocol_version = request.headers.get("MCP-Protocol-Version")
+    # Within a session the version was already negotiated on initialize
+    version = session.protocol_version if session else get_mcp_version()
 
     # https://modelcontextprotocol.io/specification/2025-06-18/basic/transports#protocol-version-header
-    if not mcp_protocol_version or get_mcp_version() != mcp_protocol_version:
+    if not mcp_protocol_version or version != mcp_protocol_version:
         raise HTTPException(
-            status_code=400, detail=f"You need to specify valid MCP-Protocol-Version. Current version: {get_mcp_version()}"
+            status_code=400, detail=f"You need to specify valid MCP-Protocol-Version. Current version: {version}"
         )
 
-    return request
+    return session
+
+
+async def get_mcp_user(
+    session: Annotated[Optional[Session], Depends(validate_mcp_headers)],
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> User:
+    """The current user, taken from the session when the token is the one it was opened with"""
+    if session is not None and session.authenticates(token):
+        return session.user
+
+    user = await get_current_user(token)
+    if session is not None:
+        if user.id != session.user.id:
+            raise HTTPException(
+                status_code=403, detail="Session belongs to another user"
+            )
+        # e.g. the client refreshed its access token
+        sessions.remember_token(session, token)
+    return user
 
 
 router = APIRouter(dependencies=[Depends(validate_mcp_headers)])
@@ -36,8 +121,10 @@ router = APIRouter(dependencies=[Depends(validate_mcp_headers)])
 
 @router.get("/mcp")
 async def mcp_get(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[User, Depends(get_mcp_user)],
     accept: Annotated[str | None, Header()] = "text/event-stream",
+    last_event_id: Annotated[str | None, Header()] = None,
+    mcp_session_id: Annotated[str | None, Header()] = None,
 ):
     if "text/event-stream" in accept:
         pass
@@ -47,12 +134,18 @@ async def mcp_get(
             detail="Invalid Accept header. Client must accept text/event-stream.",
         )
 
-    # https://modelcontextprotocol.io/specification/2025-06-18/basic/transports#sending-messages-to-the-server
-    # Listening for Messages from the Server
+    # https://modelcontextprotocol.io/specification/2025-06-18/basic/transports#listening-for-messages-from-the-server
     # The client MAY issue an HTTP GET to the MCP endpoint. This can be used to open an SSE stream, allowing the server to communicate to the client, without the client first sending data via HTTP POST.
-    raise HTTPException(
-        status_code=405,
-        detail="Not implemented: Listening for Messages from the Server",
+    # https://modelcontextprotocol.io/specification/2025-06-18/basic/transports#resumability-and-redelivery
+    # The client SHOULD include the Last-Event-ID header to resume, and the server MAY replay messages that would have been sent after the last event ID.
+    if last_event_id is not None and not last_event_id.isdigit():
+        raise HTTPException(status_code=400, detail="Invalid Last-Event-ID header")
+
+    stream = streams.get(stream_key(mcp_session_id, current_user))
+    return StreamingResponse(
+        stream.listen(None if last_event_id is None else int(last_event_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
     )
 
 
@@ -60,8 +153,9 @@ async def mcp_get(
 async def mcp_post(
     request: Request,
     response: Response,
-    current_user: Annotated[User, Depends(get_current_user)],
-    rpc: JSONRPC | List[JSONRPC],
+    current_user: Annotated[User, Depends(get_mcp_user)],
+    session: Annotated[Optional[Session], Depends(validate_mcp_headers)],
+    token: Annotated[str, Depends(oauth2_scheme)],
     accept: Annotated[str | None, Header()] = "application/json, text/event-stream",
 ):
     if "application/json" in accept and "text/event-stream" in accept:
@@ -72,40 +166,151 @@ async def mcp_post(
             detail="Invalid Accept header. Client must accept both application/json and text/event-stream.",
         )
 
-    if not isinstance(rpc, List):
-        rpc = [rpc]
+    # Rejected before reading the body when the client announces its size
+    content_length = request.headers.get("Content-Length")
+    if content_length and content_length.isdigit() and int(content_length) > MCP_MAX_BODY_BYTES:
+        raise HTTPException(status_code=413, detail=f"The body exceeds {MCP_MAX_BODY_BYTES} bytes")
 
-    responses: List[JSONRPCResponse] = []
-    for r in rpc:
-        response = None
+    caller_key = stream_key(session.id if session else None, current_user)
+    headers = {}
+    # Filled in while the body is parsed
+    requests = 0
+    progress_requested = False
+    parse_error: Optional[Exception] = None
+    # Set once the kind of response is known, which may be long before the
+    # body is read whole
+    decided = asyncio.Event()
+    streaming = False
+    body_read = asyncio.Event()
 
+    # Parsed here rather than as a body parameter, so every message is
+    # validated once, against the schema of its method only, and a batch is
+    # processed while it arrives instead of after it was read whole
+    async def entries():
+        nonlocal requests, progress_requested, parse_error, streaming
         try:
-            response = process_rpc(r, current_user)
-        except Exception as e:
-            if hasattr(r, "id"):
-                response = JSONRPCError(id=r.id, error={"message": str(e)})
+            async for r in parse_stream(request.stream()):
+                # Only requests get a response, notifications don't. A request
+                # asking for progress notifications needs a stream to send them on.
+                if hasattr(r, "id"):
+                    requests += 1
+                if isinstance(r, JSONRPCRequest) and progress_token(r.params) is not None:
+                    progress_requested = True
 
-        if response:
-            responses.append(response)
+                # https://modelcontextprotocol.io/specification/2025-06-18/basic/transports#session-management
+                # A server MAY assign a session ID at initialization time, by including it in an Mcp-Session-Id header on the HTTP response containing the InitializeResult.
+                # Processing an invalid initialize request reports the error
+                if (
+                    isinstance(r, ParsedRequest)
+                    and r.method == "initialize"
+                    and r.error is None
+                    and "Mcp-Session-Id" not in headers
+                ):
+                    headers["Mcp-Session-Id"] = sessions.create(
+                        current_user,
+                        token,
+                        get_mcp_version(),
+                        r.request.params.clientInfo,
+                        r.request.params.capabilities,
+                    ).id
+                # The response starts with the headers known so far, so an
+                # initialize is expected first in a batch
+                if requests > 1 or progress_requested:
+                    streaming = True
+                    decided.set()
+                yield r
+        except (PayloadTooLarge, ValueError) as e:
+            parse_error = e
+        finally:
+            body_read.set()
+            decided.set()
+
+    # Responses and the notifications tools send while they run, in the order they happen
+    messages: asyncio.Queue[Optional[JSONRPC | JSONRPCError]] = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+
+    def send(notification: JSONRPCNotification):
+        loop.call_soon_threadsafe(messages.put_nowait, notification)
+
+    async def process():
+        try:
+            caller = Caller(current_user, caller_key, send)
+            async for r in process_batch(entries(), caller):
+                messages.put_nowait(r)
+        finally:
+            body_read.set()
+            decided.set()
+            # After the notifications that tools sent from other threads
+            loop.call_soon_threadsafe(messages.put_nowait, None)
+
+    task = asyncio.ensure_future(process())
+    await decided.wait()
+    if parse_error is not None and not streaming:
+        # At most one request arrived before the error, and a tools/call that
+        # already ran replays its response to a retry
+        task.cancel()
+        if isinstance(parse_error, PayloadTooLarge):
+            raise HTTPException(status_code=413, detail=str(parse_error))
+        if isinstance(parse_error, ValidationError):
+            raise RequestValidationError(parse_error.errors(include_url=False))
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {parse_error}")
 
     # https://modelcontextprotocol.io/specification/2025-06-18/basic/transports#sending-messages-to-the-server
     # The SSE stream SHOULD eventually include one JSON-RPC response per each JSON-RPC request sent in the POST body. These responses MAY be batched.
     # The server MAY send JSON-RPC requests and notifications before sending a JSON-RPC response. These messages SHOULD relate to the originating client request. These requests and notifications MAY be batched.
     async def streaming_response():
-        yield "event: begin\n"
-        for r in responses:
-            yield "data: " + r.model_dump_json(serialize_as_any=True, exclude_none=True)
-            yield "\n\n"
-        yield "event: end\n"
-        yield "data: {}\n\n"
+        try:
+            yield SSE_BEGIN
+            # One chunk per message, sent as soon as the message is ready.
+            # Without an event id: ids must be unique across the session's
+            # streams, JSON-RPC ids aren't, and this stream can't be resumed.
+            while (message := await messages.get()) is not None:
+                yield b"data: %s\n\n" % dump_response(message)
+            await task
+            if parse_error is not None:
+                # The entries before the error ran, and keep their responses
+                yield b"data: %s\n\n" % parse_error_response(parse_error)
+            yield SSE_END
+        finally:
+            task.cancel()
+
+    if streaming:
+        return PostStreamingResponse(
+            streaming_response(), body_read, media_type="text/event-stream", headers=headers
+        )
+
+    await task
+    responses: List[JSONRPCResponse | JSONRPCError] = []
+    while (message := await messages.get()) is not None:
+        if not isinstance(message, JSONRPCNotification):
+            responses.append(message)
 
     if len(responses) == 0:
-        return JSONResponse(content={}, media_type="application/json", status_code=202)
-    elif len(responses) == 1:
-        return JSONResponse(
-            content=responses[0].model_dump(serialize_as_any=True, exclude_none=True),
+        return Response(content=b"{}", media_type="application/json", status_code=202)
+    else:
+        result = getattr(responses[0], "result", None)
+        if isinstance(result, SerializedResult) and result.etag is not None:
+            # The version of the tool list, so clients can tell it changed
+            # without comparing it. A POST always gets the full response.
+            headers["ETag"] = result.etag
+
+        return Response(
+            content=dump_response(responses[0]),
             media_type="application/json",
             status_code=202,
+            headers=headers,
         )
-    else:
-        return StreamingResponse(streaming_response(), media_type="text/event-stream")
+
+
+@router.delete("/mcp", status_code=204)
+async def mcp_delete(
+    current_user: Annotated[User, Depends(get_mcp_user)],
+    mcp_session_id: Annotated[str | None, Header()] = None,
+):
+    # https://modelcontextprotocol.io/specification/2025-06-18/basic/transports#session-management
+    # Clients that no longer need a particular session SHOULD send an HTTP DELETE to the MCP endpoint with the Mcp-Session-Id header, to explicitly terminate the session.
+    if not mcp_session_id:
+        raise HTTPException(status_code=400, detail="Missing Mcp-Session-Id header")
+
+    sessions.delete(mcp_session_id)
+    return Response(status_code=204)
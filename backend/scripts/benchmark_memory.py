@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+benchmark_memory.py - Measures resident memory per blog post for each storage layout
+
+This script:
+1. Starts one child process per (layout, size) pair so measurements don't leak into each other
+2. Loads `size` posts spread over 1000 users into the layout
+3. Reports the growth of peak RSS divided by the number of posts
+
+Layouts:
+- dicts: one Python dict per post, the layout the in-memory store used to have
+- columnar: `InMemoryBlogPostRepository` backed by `BlogPostTable`
+- mmap: the same repository with bodies in memory-mapped files (`MmapArena`)
+
+Usage:
+    poetry run python scripts/benchmark_memory.py [--sizes 100000 1000000 10000000]
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+USERS = 1000
+CONTENT_TEMPLATE = (
+    "Blog post {:>10} about a good day, written to benchmark memory usage."
+)
+LAYOUTS = ["dicts", "columnar", "mmap"]
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def peak_rss_bytes():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def generate_rows(size):
+    for i in range(1, size + 1):
+        yield {
+            "id": i,
+            "user_id": i % USERS + 1,
+            "content": CONTENT_TEMPLATE.format(i),
+            "created_at": 1_700_000_000_000_000 + i,
+            "updated_at": 1_700_000_000_000_000 + i,
+        }
+
+
+def load(layout, size):
+    if layout == "dicts":
+        return list(generate_rows(size))
+    elif layout == "columnar":
+        from backend.db.memory import InMemoryBlogPostRepository
+
+        return InMemoryBlogPostRepository(generate_rows(size))
+    elif layout == "mmap":
+        from functools import partial
+        from backend.db.blobs import MmapArena
+        from backend.db.memory import InMemoryBlogPostRepository
+
+        arena_factory = partial(MmapArena, tempfile.gettempdir())
+        return InMemoryBlogPostRepository(
+            generate_rows(size), arena_factory=arena_factory
+        )
+    raise ValueError(f"Unknown layout: {layout}")
+
+
+def measure(layout, size):
+    """Runs in the child process and prints `total_bytes content_bytes`"""
+    # Import everything the layout needs before taking the baseline
+    load(layout, 1)
+    baseline = peak_rss_bytes()
+    store = load(layout, size)
+    total = peak_rss_bytes() - baseline
+    content = sum(len(CONTENT_TEMPLATE.format(i)) for i in range(1, size + 1))
+    print(total, content)
+    del store
+
+
+def run(layout, size):
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", layout, str(size)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    total, content = (int(value) for value in output.split())
+    return total, content
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000]
+    )
+    parser.add_argument("--child", nargs=2, metavar=("LAYOUT", "SIZE"))
+    args = parser.parse_args()
+
+    if args.child:
+        measure(args.child[0], int(args.child[1]))
+        return 0
+
+    print(
+        f"{'layout':<10} {'posts':>10} {'RSS MiB':>10} {'bytes/post':>11} {'overhead/post':>14}"
+    )
+    for size in args.sizes:
+        for layout in LAYOUTS:
+            total, content = run(layout, size)
+            print(
+                f"{layout:<10} {size:>10} {total / 2**20:>10.1f} {total / size:>11.1f} {(total - content) / size:>14.1f}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
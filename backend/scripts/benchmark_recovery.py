@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+benchmark_recovery.py - Measures how long the in-memory backend takes to restart from its journal
+
+This script:
+1. Loads `size` posts spread over 1000 users into a journaled repository and checkpoints it
+2. Appends `tail` more writes (creates and updates) to the log without checkpointing
+3. Recovers a fresh repository from the snapshot plus the log tail and times it
+
+Usage:
+    poetry run python scripts/benchmark_recovery.py [--sizes 1000000 3000000] [--tail 100000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.db.memory import InMemoryBlogPostRepository  # noqa: E402
+from backend.db.wal import Journal  # noqa: E402
+
+USERS = 1000
+CONTENT_TEMPLATE = (
+    "Blog post {:>10} about a good day, written to benchmark recovery time."
+)
+
+
+def generate_rows(size):
+    for i in range(1, size + 1):
+        yield {
+            "id": i,
+            "user_id": i % USERS + 1,
+            "content": CONTENT_TEMPLATE.format(i),
+        }
+
+
+def open_repository(directory, rows=()):
+    # Never snapshot on its own, so the log tail stays the size we asked for
+    journal = Journal(directory, "blog_posts", snapshot_every=sys.maxsize)
+    return InMemoryBlogPostRepository(rows, journal=journal), journal
+
+
+def directory_size(directory):
+    return sum(entry.stat().st_size for entry in os.scandir(directory))
+
+
+def benchmark(size, tail):
+    with tempfile.TemporaryDirectory() as directory:
+        # The first open seeds the rows and writes the initial snapshot
+        repository, journal = open_repository(directory, generate_rows(size))
+        for i in range(tail):
+            if i % 2:
+                blog_post_id = i + 1
+                repository.update(
+                    blog_post_id % USERS + 1, blog_post_id, f"Updated {i}"
+                )
+            else:
+                repository.create(i % USERS + 1, CONTENT_TEMPLATE.format(size + i))
+        journal.close()
+        on_disk = directory_size(directory)
+        del repository
+
+        started = time.perf_counter()
+        repository, journal = open_repository(directory)
+        elapsed = time.perf_counter() - started
+        journal.close()
+
+        return elapsed, on_disk
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 3_000_000])
+    parser.add_argument("--tail", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'posts':>10} {'log tail':>10} {'on disk MiB':>12} {'recovery s':>11}")
+    for size in args.sizes:
+        elapsed, on_disk = benchmark(size, args.tail)
+        print(f"{size:>10} {args.tail:>10} {on_disk / 2**20:>12.1f} {elapsed:>11.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
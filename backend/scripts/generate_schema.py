@@ -1,158 +1,302 @@
 #!/usr/bin/env python3
 """
-generate_schema.py - Generates Pydantic models from JSON schema using Anthropic API
+generate_schema.py - Generates Pydantic models from the MCP JSON schema
 
 This script:
-1. Downloads the JSON schema from the MCP repository
-2. Sends the schema to Anthropic's API with a prompt to create Pydantic classes
-3. Extracts the code from the response
-4. Saves the output to mcp/schema.py
+1. Reads the MCP JSON schema checked in next to the generated module, see README.md
+2. Emits one Pydantic model, enum or type alias per definition, dependencies first
+3. Formats the code with black and saves it to backend/mcp/schema.py
+
+The output only depends on the schema, so regenerating an unchanged schema is a
+no-op and a spec upgrade shows up as a readable diff.
+
+Generated code:
+- `const` properties become `Literal` tags with the constant as the default, e.g. `method`
+- unions whose members all carry a distinct `Literal` tag are discriminated on it,
+  e.g. `ClientRequest` on `method` and `ContentBlock` on `type`
+- models defer building their validators until first use, so importing the module is cheap
+- results with `_meta` extend `Result`, so any of them fits `JSONRPCResponse.result`
+
+Usage:
+    poetry run python scripts/generate_schema.py [--schema backend/mcp/schema.json] [--output backend/mcp/schema.py]
 """
 
-import os
+import argparse
 import json
+import keyword
 import sys
-import requests
-import re
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
-# Configuration
-ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
-ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
-ANTHROPIC_MODEL = "claude-3-7-sonnet-20250219"
-JSON_SCHEMA_URL = os.environ.get("JSON_SCHEMA_URL")
-OUTPUT_FILE = "backend/mcp/schema.py"
-
-def download_schema():
-    """Download the JSON schema from GitHub"""
-    print("Downloading JSON schema...")
-    response = requests.get(JSON_SCHEMA_URL)
-    response.raise_for_status()
-    return response.text
-
-def call_anthropic_api(schema):
-    """Call the Anthropic API with the schema to generate Pydantic classes"""
-    if not ANTHROPIC_API_KEY:
-        raise ValueError("ANTHROPIC_API_KEY environment variable is not set")
-    
-    print(f"Calling Anthropic API using model {ANTHROPIC_MODEL}...")
-    
-    headers = {
-        "x-api-key": ANTHROPIC_API_KEY,
-        "anthropic-version": "2023-06-01",
-        "content-type": "application/json"
-    }
-
-    if os.path.isfile(OUTPUT_FILE):
-        with open(OUTPUT_FILE, 'r') as file:
-            current_file = file.read()
-    else:
-        current_file = ""
-
-    
-    prompt = f"""
-```json
-{schema}
-```
-
-Convert this JSON schema into pydantic models for the schema.py file.
-Copy descriptions of the JSON schema to the pydantic models as docstrings.
-If the field `type` is `object`, all keys must be defined as fields of an Pydantic Model.
-If the field `type` is not `object` or undefined, define a type alias instead of using BaseModel.
-If `enum` keyword is used with string values, use StrEnum from enum module.
-If `const` keyword is used, set it as the default value of the field.
-Use `Field` of pydantic feature as much as possible. If the field name starts with underscore, do not use `Field` class.
-Do not omit for brevity.
-Do not add docsstrings or comments that does not exist in the JSON schema.
-Do not use `Union` as the subclass.
-Do not use `RootModel` or `__root__` of pydantic features.
-Return only code blocks.
-"""
-    
-    if current_file:
-        prompt += f"""
-For the reference, here is the current schema.py file:
-
-```python
-{current_file}
-```
-"""
-        
-    # print(f"prompt: {prompt}")
-    
-    data = {
-        "model": ANTHROPIC_MODEL,
-        "max_tokens": 64000,
-        "messages": [
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ],
-        "thinking": {
-            "type": "enabled",
-            "budget_tokens": 30000
-        }
-    }
-    
-    response = requests.post(ANTHROPIC_API_URL, headers=headers, json=data)
-    response.raise_for_status()
-    return response.json()
-
-def extract_python_code(response):
-    """Extract Python code from the Anthropic API response"""
-    # print("response", response['content'])
-    text_block = [content for content in response['content'] if content.get('type')=='text'][0]
-    # Get the text from the first content block
-    content = text_block['text']
-    
-    # Extract code between Python code blocks
-    code_blocks = re.findall(r'```python\n(.*?)```', content, re.DOTALL)
-    
-    if not code_blocks:
-        # Try without language specifier
-        code_blocks = re.findall(r'```\n(.*?)```', content, re.DOTALL)
-    
-    if not code_blocks:
-        raise ValueError("No Python code blocks found in the response")
-    
-    # Join all code blocks - typically there should be just one
-    return "\n\n".join(code_blocks)
-
-def save_code(code, output_path):
-    """Save the generated code to the output file"""
-    # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-    header = f"""# This file is auto-generated based on {JSON_SCHEMA_URL} - do not modify manually.
+DEFAULT_SCHEMA = "backend/mcp/schema.json"
+DEFAULT_OUTPUT = "backend/mcp/schema.py"
+BASE_MODEL = "SchemaModel"
 
-"""
+# Names of inline objects, by (class name, property), that differ from `<class><Property>`.
+# They keep the names the rest of the code already imports.
+CLASS_NAMES = {
+    ("ClientCapabilities", "roots"): "RootsCapabilities",
+    ("ClientCapabilities", "sampling"): "SamplingCapabilities",
+    ("ClientCapabilities", "elicitation"): "ElicitationCapabilities",
+    ("ServerCapabilities", "prompts"): "PromptsCapabilities",
+    ("ServerCapabilities", "resources"): "ResourcesCapabilities",
+    ("ServerCapabilities", "tools"): "ToolsCapabilities",
+    ("ServerCapabilities", "logging"): "LoggingCapabilities",
+    ("ServerCapabilities", "completions"): "CompletionsCapabilities",
+    ("CompleteRequestParams", "argument"): "CompleteRequestArgumentParams",
+    ("CompleteRequestParams", "context"): "CompleteRequestContextParams",
+    ("CompleteResult", "completion"): "CompletionValues",
+}
 
-    code = header + code
-    
-    with open(output_path, 'w') as f:
-        f.write(code)
-    
-    print(f"Schema generated at {output_path}")
+# Properties kept as plain values instead of models, by (class name, property)
+TYPE_OVERRIDES = {
+    # JSON Schemas written by tool authors, passed on to clients as is
+    ("Tool", "inputSchema"): "Dict[str, Any]",
+    ("Tool", "outputSchema"): "Dict[str, Any]",
+    # Error responses are built from dicts
+    ("JSONRPCError", "error"): "Dict[str, Any]",
+}
+
+SCALAR_TYPES = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "null": "None",
+}
+
+# Property names preferred as the tag of a discriminated union, in this order
+DISCRIMINATORS = ["method", "type"]
+
+
+def docstring(text: str, indent: str) -> str:
+    text = text.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+    if text.endswith('"'):
+        text += " "
+    return f'{indent}"""{text}"""'
+
+
+def union(members: List[str]) -> str:
+    members = list(dict.fromkeys(members))
+    if len(members) == 1:
+        return members[0]
+    return f"Union[{', '.join(members)}]"
+
+
+class Generator:
+    def __init__(self, definitions: Dict[str, Any]):
+        self.definitions = definitions
+        self.blocks: List[str] = []
+        self.emitted: set = set()
+        self.visiting: set = set()
+
+    def ref_name(self, ref: str) -> str:
+        return ref.rsplit("/", 1)[1]
+
+    def definition_of(self, schema: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if "$ref" in schema:
+            return self.definitions.get(self.ref_name(schema["$ref"]))
+        return None
+
+    def generate(self) -> str:
+        for name in self.definitions:
+            self.emit(name)
+        return "\n\n\n".join(self.blocks) + "\n"
+
+    def emit(self, name: str):
+        if name in self.emitted or name in self.visiting:
+            return
+        self.visiting.add(name)
+        schema = self.definitions[name]
+        if "enum" in schema and schema.get("type") == "string":
+            self.emit_enum(name, schema)
+        elif schema.get("type") == "object" and "properties" in schema:
+            self.emit_class(name, schema)
+        else:
+            expression = self.type_of(schema, name, None)
+            block = f"{name}: TypeAlias = {expression}"
+            if schema.get("description"):
+                block = f"# {schema['description'].splitlines()[0]}\n{block}"
+            self.blocks.append(block)
+        self.visiting.discard(name)
+        self.emitted.add(name)
+
+    def emit_enum(self, name: str, schema: Dict[str, Any]):
+        lines = [f"class {name}(StrEnum):"]
+        if schema.get("description"):
+            lines += [docstring(schema["description"], "    "), ""]
+        for value in schema["enum"]:
+            member = "".join(c if c.isalnum() else "_" for c in value).upper()
+            lines.append(f"    {member} = {value!r}")
+        self.blocks.append("\n".join(lines))
+
+    def emit_class(self, name: str, schema: Dict[str, Any]):
+        properties: Dict[str, Any] = schema.get("properties", {})
+        required = set(schema.get("required", []))
+
+        base = BASE_MODEL
+        if (
+            name != "Result"
+            and name.endswith("Result")
+            and "Result" in self.definitions
+            and "_meta" in properties
+        ):
+            self.emit("Result")
+            base = "Result"
+
+        fields = []
+        for prop, prop_schema in properties.items():
+            if prop.startswith("_"):
+                # Pydantic keeps these as private attributes, which it never
+                # validates, e.g. `_meta`
+                if base != "Result":
+                    fields.append(f"    {prop}: Optional[Dict[str, Any]] = None")
+                continue
+            expression = TYPE_OVERRIDES.get((name, prop)) or self.type_of(
+                prop_schema, name, prop
+            )
+            fields.append(self.field(prop, prop_schema, expression, prop in required))
+
+        if schema.get("additionalProperties") not in (None, False):
+            # e.g. capabilities, whose keys are not all known up front
+            fields.insert(0, '    model_config = ConfigDict(extra="allow")')
+
+        lines = [f"class {name}({base}):"]
+        if schema.get("description"):
+            lines.append(docstring(schema["description"], "    "))
+            if fields:
+                lines.append("")
+        lines += fields
+        if len(lines) == 1:
+            lines.append("    pass")
+        self.blocks.append("\n".join(lines))
+
+    def field(
+        self, prop: str, schema: Dict[str, Any], expression: str, required: bool
+    ) -> str:
+        description = schema.get("description")
+
+        arguments = []
+        if "const" in schema:
+            arguments.append(repr(schema["const"]))
+        elif not required:
+            expression = f"Optional[{expression}]"
+            arguments.append("None")
+        if description:
+            arguments.append(f"description={description!r}")
+        name = prop
+        if keyword.iskeyword(prop) or not prop.isidentifier():
+            name = "".join(c if c.isalnum() else "_" for c in prop) + "_"
+            arguments.append(f"alias={prop!r}")
+
+        if not arguments:
+            return f"    {name}: {expression}"
+        if arguments == [arguments[0]] and not description and name == prop:
+            return f"    {name}: {expression} = {arguments[0]}"
+        return f"    {name}: {expression} = Field({', '.join(arguments)})"
+
+    def nested_name(self, owner: str, prop: Optional[str]) -> str:
+        if (owner, prop) in CLASS_NAMES:
+            return CLASS_NAMES[(owner, prop)]
+        return owner + (prop[0].upper() + prop[1:] if prop else "Value")
+
+    def discriminator(self, members: List[Dict[str, Any]]) -> Optional[str]:
+        definitions = [self.definition_of(member) for member in members]
+        if len(members) < 2 or any(d is None for d in definitions):
+            return None
+        for tag in DISCRIMINATORS:
+            values = [
+                d.get("properties", {}).get(tag, {}).get("const") for d in definitions
+            ]
+            if all(isinstance(v, str) for v in values) and len(set(values)) == len(
+                values
+            ):
+                return tag
+        return None
+
+    def type_of(self, schema: Dict[str, Any], owner: str, prop: Optional[str]) -> str:
+        if "$ref" in schema:
+            name = self.ref_name(schema["$ref"])
+            self.emit(name)
+            # Still being emitted: a cycle, resolved by pydantic when the model is built
+            return f'"{name}"' if name in self.visiting else name
+        if "const" in schema:
+            return f"Literal[{schema['const']!r}]"
+        if "enum" in schema:
+            return f"Literal[{', '.join(repr(value) for value in schema['enum'])}]"
+
+        members = schema.get("anyOf") or schema.get("oneOf")
+        if members:
+            expression = union([self.type_of(m, owner, prop) for m in members])
+            tag = self.discriminator(members)
+            if tag:
+                expression = f'Annotated[{expression}, Field(discriminator="{tag}")]'
+            return expression
+
+        kind = schema.get("type")
+        if isinstance(kind, list):
+            return union([SCALAR_TYPES.get(k, "Any") for k in kind])
+        if kind == "array":
+            return f"List[{self.type_of(schema.get('items', {}), owner, prop)}]"
+        if kind == "object":
+            if schema.get("properties") or (owner, prop) in CLASS_NAMES:
+                name = self.nested_name(owner, prop)
+                self.emit_class(name, schema)
+                return name
+            additional = schema.get("additionalProperties")
+            if isinstance(additional, dict) and additional:
+                return f"Dict[str, {self.type_of(additional, owner, prop)}]"
+            return "Dict[str, Any]"
+        return SCALAR_TYPES.get(kind, "Any")
+
+
+def generate(schema: Dict[str, Any], source: str) -> str:
+    definitions = schema.get("definitions") or schema.get("$defs") or {}
+    body = Generator(definitions).generate()
+    code = f"""# This file is auto-generated from {source} by scripts/generate_schema.py - do not modify manually.
+
+from enum import StrEnum
+from typing import Annotated, Any, Dict, List, Literal, Optional, TypeAlias, Union
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class {BASE_MODEL}(BaseModel):
+    # Validators are built on first use, most models are never used by the server
+    model_config = ConfigDict(defer_build=True)
+
+
+{body}"""
 
-def main():
     try:
-        # Download the JSON schema
-        schema = download_schema()
-        
-        # Call the Anthropic API
-        response = call_anthropic_api(schema)
-        
-        # Extract the Python code
-        code = extract_python_code(response)
-        
-        # Save the code
-        save_code(code, OUTPUT_FILE)
-        
-        return 0
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+        import black
+    except ImportError:
+        return code
+    return black.format_str(code, mode=black.Mode())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--schema", default=DEFAULT_SCHEMA)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    if not Path(args.schema).exists():
+        print(
+            f"{args.schema} not found, download the MCP JSON schema first (see README.md)",
+            file=sys.stderr,
+        )
         return 1
 
+    with open(args.schema) as f:
+        schema = json.load(f)
+
+    code = generate(schema, Path(args.schema).name)
+    with open(args.output, "w") as f:
+        f.write(code)
+
+    print(f"Schema generated at {args.output}")
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,29 @@
+import unittest
+from backend.auth.utils import User
+from backend.mcp.context import Caller
+from backend.mcp.process import replays_retries
+from backend.mcp.streams import stream_key
+
+USER = User(id=1, username="johndoe")
+
+
+class ReplaysRetriesTest(unittest.TestCase):
+    def test_writes_within_a_session(self):
+        caller = Caller(USER, stream_key("session", USER))
+        self.assertTrue(replays_retries(caller, "create_blog_post"))
+        self.assertTrue(replays_retries(caller, "update_blog_post"))
+
+    def test_read_only_tools_always_run(self):
+        # A replayed read would hide the writes made since
+        caller = Caller(USER, stream_key("session", USER))
+        self.assertFalse(replays_retries(caller, "read_blog_post"))
+        self.assertFalse(replays_retries(caller, "search_blog_posts"))
+
+    def test_no_replay_without_a_session(self):
+        # Clients without a session reuse request ids
+        caller = Caller(USER, stream_key(None, USER))
+        self.assertFalse(replays_retries(caller, "update_blog_post"))
+
+
+if __name__ == "__main__":
+    unittest.main()
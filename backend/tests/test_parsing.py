@@ -0,0 +1,161 @@
+import json
+import unittest
+from typing import List
+from pydantic import ValidationError
+from backend.mcp.parsing import (
+    JSONArraySplitter,
+    ParsedNotification,
+    ParsedRequest,
+    PayloadTooLarge,
+    parse_stream,
+)
+
+# Strings with brackets, commas and escapes, nested in objects and arrays
+BATCH = json.dumps(
+    [
+        {"a": "[]{},", "b": ['"', "\\", '\\"]', "é\U0001f600"]},
+        [1, [2, {"c": [3]}], "}"],
+        '"quoted, [bracketed]"',
+        "\\",
+        -1.5e3,
+        None,
+        {},
+        [],
+    ],
+    ensure_ascii=False,
+    indent=1,
+).encode()
+
+
+def chunked(data: bytes, size: int) -> List[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def split(chunks: List[bytes]) -> List[bytes]:
+    splitter = JSONArraySplitter()
+    # The caller strips the opening bracket
+    elements = splitter.feed(chunks[0].lstrip()[1:])
+    for chunk in chunks[1:]:
+        elements += splitter.feed(chunk)
+    splitter.close()
+    return elements
+
+
+async def body(chunks: List[bytes]):
+    for chunk in chunks:
+        yield chunk
+
+
+def request(id: int, **kwargs) -> dict:
+    return {"jsonrpc": "2.0", "id": id, "method": "ping", **kwargs}
+
+
+class JSONArraySplitterTest(unittest.TestCase):
+    def test_elements_of_any_chunking(self):
+        expected = json.loads(BATCH)
+        # Every size splits strings, escapes and multi-byte characters somewhere
+        for size in range(1, 40):
+            with self.subTest(size=size):
+                elements = split(chunked(BATCH, size))
+                self.assertEqual([json.loads(e) for e in elements], expected)
+
+    def test_split_inside_an_escape(self):
+        data = b'["a\\"b", "c"]'
+        index = data.index(b"\\") + 1
+        elements = split([data[:index], data[index:]])
+        self.assertEqual(elements, [b'"a\\"b"', b'"c"'])
+
+    def test_whitespace(self):
+        self.assertEqual(split([b" \r\n\t[ 1 ,\n2\t] \n", b"  "]), [b"1", b"2"])
+
+    def test_empty_arrays(self):
+        self.assertEqual(split([b"[]"]), [])
+        self.assertEqual(split([b"[ ", b"\n", b"]"]), [])
+        self.assertEqual(split([b"[[]]"]), [b"[]"])
+
+    def test_single_object(self):
+        self.assertEqual(split([b'[{"a":', b" 1}]"]), [b'{"a": 1}'])
+
+    def test_errors(self):
+        for chunks, message in [
+            ([b"[1,", b"]"], "missing batch entry"),
+            ([b"[,1]"], "missing batch entry"),
+            ([b"[1,,2]"], "missing batch entry"),
+            ([b"[1] 2"], "trailing data after the batch"),
+            ([b"[1]", b" x"], "trailing data after the batch"),
+            ([b"[1}"], "unbalanced brackets"),
+            ([b"[1, 2"], "the batch is not closed"),
+            ([b'["]', b""], "the batch is not closed"),
+        ]:
+            with self.subTest(chunks=chunks):
+                with self.assertRaisesRegex(ValueError, message):
+                    split(chunks)
+
+
+class ParseStreamTest(unittest.IsolatedAsyncioTestCase):
+    async def parse(self, chunks: List[bytes], **kwargs) -> list:
+        return [message async for message in parse_stream(body(chunks), **kwargs)]
+
+    async def test_messages_in_any_chunking(self):
+        batch = [
+            request(1, params={"_meta": {"note": '"[]{},\\'}}),
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            request("two"),
+        ]
+        data = b"\n " + json.dumps(batch).encode() + b" \n"
+        for size in [1, 2, 7, len(data)]:
+            with self.subTest(size=size):
+                messages = await self.parse(chunked(data, size))
+                self.assertEqual(
+                    [type(m) for m in messages],
+                    [ParsedRequest, ParsedNotification, ParsedRequest],
+                )
+                self.assertEqual([m.id for m in messages[::2]], [1, "two"])
+                self.assertEqual(messages[0].params, batch[0]["params"])
+
+    async def test_single_message(self):
+        data = json.dumps(request(1)).encode()
+        for size in [1, len(data)]:
+            with self.subTest(size=size):
+                (message,) = await self.parse(chunked(data, size))
+                self.assertEqual(message.id, 1)
+
+    async def test_empty_batch(self):
+        self.assertEqual(await self.parse([b"[]"]), [])
+        self.assertEqual(await self.parse([b" [", b" ]"]), [])
+
+    async def test_body_size_limit(self):
+        data = json.dumps([request(i) for i in range(10)]).encode()
+        self.assertEqual(len(await self.parse([data], max_bytes=len(data))), 10)
+        for chunks in [[data], chunked(data, 16)]:
+            with self.assertRaisesRegex(PayloadTooLarge, "exceeds 100 bytes"):
+                await self.parse(chunks, max_bytes=100)
+
+    async def test_batch_size_limit(self):
+        data = json.dumps([request(i) for i in range(4)]).encode()
+        self.assertEqual(len(await self.parse([data], max_batch_size=4)), 4)
+        for chunks in [[data], chunked(data, 16)]:
+            with self.assertRaisesRegex(PayloadTooLarge, "more than 3 entries"):
+                await self.parse(chunks, max_batch_size=3)
+
+    async def test_error_partway(self):
+        data = (
+            json.dumps([request(1), request(2)])[:-1] + ', {"jsonrpc": "2.0", oops}]'
+        ).encode()
+        messages = []
+        with self.assertRaises(ValueError):
+            async for message in parse_stream(body(chunked(data, 8))):
+                messages.append(message)
+        # The entries before the invalid one were already yielded
+        self.assertEqual([m.id for m in messages], [1, 2])
+
+        with self.assertRaises(ValueError):
+            await self.parse([data])
+
+    async def test_no_json_rpc(self):
+        with self.assertRaises(ValidationError):
+            await self.parse([b"[1,", b" 2]"])
+
+
+if __name__ == "__main__":
+    unittest.main()
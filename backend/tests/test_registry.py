@@ -0,0 +1,39 @@
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from backend.mcp.tools.registry import registry, tool_names
+
+
+class ToolNamesTest(unittest.TestCase):
+    def test_declared_tools_match_the_registered_ones(self):
+        module = "backend.mcp.tools.blog_posts"
+        names = tool_names(module)
+        importlib.import_module(module)
+        registered = [
+            name
+            for name, tool in registry._tools.items()
+            if tool.handler.__module__ == module
+        ]
+        self.assertEqual(sorted(names), sorted(registered))
+
+    def test_names_must_be_literals(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        with open(os.path.join(directory, "dynamic_tools.py"), "w") as f:
+            f.write(
+                "from backend.mcp.tools.registry import tool\n"
+                "NAME = 'dynamic'\n"
+                "@tool(name=NAME, description='', input_schema={})\n"
+                "def dynamic(user, arguments): ...\n"
+            )
+        sys.path.insert(0, directory)
+        self.addCleanup(sys.path.remove, directory)
+
+        with self.assertRaisesRegex(ValueError, "literal name"):
+            tool_names("dynamic_tools")
+        self.assertNotIn("dynamic_tools", sys.modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from backend.mcp.tools.cache import ResultCache
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResultCache(1 << 20)
+
+    def test_invalidation_drops_tagged_results(self):
+        key = self.cache.key(1, "read_blog_post", {"blog_post_id": 1})
+        self.cache.put(key, ["blog://posts/1"], self.cache.generation(1), b"{}")
+        self.cache.invalidate(2, "blog://posts/1")
+        self.assertIsNotNone(self.cache.get(key))
+        self.cache.invalidate(1, "blog://posts/1")
+        self.assertIsNone(self.cache.get(key))
+
+    def test_results_computed_during_an_invalidation_are_not_stored(self):
+        key = self.cache.key(1, "read_blog_post", {"blog_post_id": 1})
+        generation = self.cache.generation(1)
+        self.cache.invalidate(1, "blog://posts/1")
+        cached = self.cache.put(key, ["blog://posts/1"], generation, b"{}")
+        self.assertEqual(cached.serialized, b"{}")
+        self.assertIsNone(self.cache.get(key))
+
+    def test_other_users_writes_keep_results_in_flight(self):
+        key = self.cache.key(1, "read_blog_post", {"blog_post_id": 1})
+        generation = self.cache.generation(1)
+        self.cache.invalidate(2, "blog://posts/1")
+        self.cache.put(key, ["blog://posts/1"], generation, b"{}")
+        self.assertIsNotNone(self.cache.get(key))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+import json
+import unittest
+from pathlib import Path
+from scripts.generate_schema import DEFAULT_OUTPUT, DEFAULT_SCHEMA, generate
+
+ROOT = Path(__file__).parent.parent
+
+
+class GenerateSchemaTest(unittest.TestCase):
+    def test_generated_module_is_up_to_date(self):
+        schema = json.loads((ROOT / DEFAULT_SCHEMA).read_text())
+        self.assertEqual(
+            generate(schema, Path(DEFAULT_SCHEMA).name),
+            (ROOT / DEFAULT_OUTPUT).read_text(),
+            "backend/mcp/schema.py differs from what `make schema` generates",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from backend.auth.utils import User
+from backend.db.sqlite import ConnectionPool, migrate
+from backend.mcp import sessions as sessions_module
+from backend.mcp.schema import ClientCapabilities, Implementation
+from backend.mcp.sessions import SQLiteSessionStore
+
+USER = User(id=1, username="johndoe")
+
+
+class SQLiteSessionStoreTest(unittest.TestCase):
+    def setUp(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.path = os.path.join(directory, "test.sqlite3")
+
+    def store(self) -> SQLiteSessionStore:
+        # One pool per worker process, sharing the database file
+        pool = ConnectionPool(self.path)
+        self.addCleanup(pool.close)
+        migrate(pool)
+        return SQLiteSessionStore(lambda: pool)
+
+    def create(self, store: SQLiteSessionStore, token: str = "token"):
+        return store.create(
+            USER,
+            token,
+            "2025-06-18",
+            Implementation(name="client", version="1"),
+            ClientCapabilities(),
+        )
+
+    def test_sessions_are_shared_by_workers(self):
+        first, second = self.store(), self.store()
+        session = self.create(first)
+
+        found = second.get(session.id)
+        self.assertEqual(found.user, USER)
+        self.assertEqual(found.client_info.name, "client")
+        # Tokens without an expiry are stored as such
+        self.assertTrue(found.authenticates("token"))
+        self.assertFalse(found.authenticates("other"))
+
+        second.remember_token(found, "refreshed")
+        self.assertTrue(first.get(session.id).authenticates("refreshed"))
+
+        self.assertTrue(second.delete(session.id))
+        self.assertIsNone(first.get(session.id))
+        self.assertFalse(first.delete(session.id))
+
+    def test_unused_sessions_expire(self):
+        store = self.store()
+        session = self.create(store)
+
+        later = time.time() + sessions_module.MCP_SESSION_TTL
+        with patch.object(sessions_module.time, "time", return_value=later):
+            self.assertIsNone(store.get(session.id))
+        self.assertIsNone(store.get(session.id))
+
+    def test_least_recently_used_sessions_are_dropped(self):
+        store = self.store()
+        with patch.object(sessions_module, "MCP_MAX_SESSIONS", 2):
+            oldest, *newest = [self.create(store) for _ in range(3)]
+
+        self.assertIsNone(store.get(oldest.id))
+        for session in newest:
+            self.assertIsNotNone(store.get(session.id))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+from backend.db import sqlite
+from backend.db.prefix import SortedPrefixIndex
+from backend.db.sqlite import (
+    MIGRATIONS,
+    ConnectionPool,
+    SQLiteBlogPostIdIndex,
+    SQLiteBlogPostRepository,
+    SQLiteSearchIndex,
+    migrate,
+    statements,
+)
+
+FIXTURES = {
+    "users": [
+        {
+            "id": 1,
+            "username": "johndoe",
+            "full_name": "John Doe",
+            "email": "johndoe@example.com",
+            "hashed_password": "x",
+        },
+        {
+            "id": 2,
+            "username": "alice",
+            "full_name": "Alice",
+            "email": "alice@example.com",
+            "hashed_password": "x",
+        },
+    ],
+    "blog_posts": [{"id": 1, "user_id": 1, "content": "Yesterday was a good day"}],
+}
+
+
+class SQLiteIndexTest(unittest.TestCase):
+    def setUp(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.path = os.path.join(directory, "test.sqlite3")
+
+    def pool(self) -> ConnectionPool:
+        pool = ConnectionPool(self.path)
+        self.addCleanup(pool.close)
+        migrate(pool, fixtures=FIXTURES)
+        return pool
+
+    def test_search_sees_writes_of_other_workers(self):
+        # One pool per worker process, sharing the database file
+        writer = SQLiteBlogPostRepository(self.pool())
+        search = SQLiteSearchIndex(self.pool())
+
+        self.assertEqual([id for id, _ in search.search(1, "good day")], [1])
+        post = writer.create(1, "a good walk")
+        writer.create(2, "a good book")
+        self.assertEqual([id for id, _ in search.search(1, "good day")], [1, post.id])
+
+        writer.update(1, post.id, "a long walk")
+        self.assertEqual([id for id, _ in search.search(1, "good")], [1])
+        self.assertEqual([id for id, _ in search.search(1, "walk")], [post.id])
+        self.assertEqual(search.search(1, '"; -'), [])
+
+    def test_complete_ids_sees_writes_of_other_workers(self):
+        writer = SQLiteBlogPostRepository(self.pool())
+        ids = SQLiteBlogPostIdIndex(self.pool())
+
+        for i in range(12):
+            writer.create(1, f"post {i}")
+        writer.create(2, "not johndoe's")
+
+        self.assertEqual(ids.complete(1, "1", 3), (["1", "10", "11"], 5))
+        self.assertEqual(ids.complete(1, "", 100)[1], 13)
+        self.assertEqual(ids.complete(1, "14", 10), ([], 0))
+
+    def test_complete_ids_matches_string_order(self):
+        pool = self.pool()
+        rng = random.Random(0)
+        posts = {1} | {rng.randrange(1, 2**63) for _ in range(200)}
+        posts |= {rng.randrange(1, 10 ** rng.randrange(1, 6)) for _ in range(200)}
+        posts.add(2**63 - 1)
+        with pool.connection() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO blog_posts (id, user_id, content) VALUES (?, 1, '')",
+                [(id,) for id in posts],
+            )
+            conn.commit()
+        ids = SQLiteBlogPostIdIndex(pool)
+        expected = SortedPrefixIndex(str(id) for id in posts)
+
+        for prefix in ["", "1", "12", "9", "922337203685477580", "0", "01", "x"]:
+            for limit in [1, 10, 1000]:
+                self.assertEqual(
+                    ids.complete(1, prefix, limit), expected.complete(prefix, limit)
+                )
+
+    def test_complete_ids_caps_the_total(self):
+        writer = SQLiteBlogPostRepository(self.pool())
+        ids = SQLiteBlogPostIdIndex(self.pool())
+        for i in range(12):
+            writer.create(1, f"post {i}")
+
+        with patch.object(sqlite, "COMPLETE_IDS_MAX_TOTAL", 4):
+            self.assertEqual(ids.complete(1, "", 2), (["1", "10"], 4))
+            self.assertEqual(ids.complete(1, "1", 10)[1], 4)
+            self.assertEqual(ids.complete(1, "2", 10), (["2"], 1))
+
+    def test_migration_indexes_existing_posts(self):
+        pool = ConnectionPool(self.path)
+        self.addCleanup(pool.close)
+        with pool.connection() as conn:
+            for migration in MIGRATIONS[:2]:
+                for statement in statements(migration):
+                    conn.execute(statement)
+            conn.execute("PRAGMA user_version = 2")
+            conn.execute(
+                "INSERT INTO users (id, username, hashed_password) VALUES (1, 'johndoe', 'x')"
+            )
+            conn.execute(
+                "INSERT INTO blog_posts (user_id, content) VALUES (1, 'written before')"
+            )
+            conn.commit()
+
+        migrate(pool)
+        self.assertEqual(
+            [id for id, _ in SQLiteSearchIndex(pool).search(1, "before")], [1]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
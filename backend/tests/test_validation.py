@@ -0,0 +1,145 @@
+import unittest
+from jsonschema import Draft202012Validator
+from backend.mcp.tools.blog_posts import BLOG_POST_ID_SCHEMA
+from backend.mcp.tools.registry import registry
+from backend.mcp.tools.validation import compile_schema
+
+POST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "blog_post_id": BLOG_POST_ID_SCHEMA,
+        "tags": {
+            "type": "array",
+            "items": {"type": "string", "minLength": 1, "maxLength": 3},
+        },
+        "order": {"type": "string", "enum": ["asc", "desc"]},
+        "level": {"enum": [1, True, [0], {"a": False}, None]},
+        "weight": {"type": ["number", "null"], "minimum": 0.5, "maximum": 2},
+        "extra": {
+            "type": "object",
+            "additionalProperties": {"type": "integer"},
+        },
+    },
+    "required": ["blog_post_id"],
+    "additionalProperties": False,
+}
+
+BLOG_POST_IDS = [
+    1,
+    2**63 - 1,
+    2**63,
+    0,
+    -1,
+    1.0,
+    1.5,
+    1e3,
+    True,
+    False,
+    None,
+    "1",
+    "0",
+    "007",
+    "1" * 18,
+    "1" * 19,
+    "",
+    " 1",
+    "1\n",
+    "-1",
+    "1.0",
+    "１",
+    [1],
+    {"id": 1},
+]
+
+LEVELS = [1, 1.0, True, False, 0, [0], [False], [0.0], {"a": False}, {"a": 0}, None]
+
+ARGUMENTS = [{"blog_post_id": id} for id in BLOG_POST_IDS] + [
+    {},
+    {"blog_post_id": 1, "other": 1},
+    {"blog_post_id": 1, "tags": []},
+    {"blog_post_id": 1, "tags": ["a", "abc"]},
+    {"blog_post_id": 1, "tags": ["", "abcd", 1]},
+    {"blog_post_id": 1, "tags": "a"},
+    {"blog_post_id": 1, "order": "asc"},
+    {"blog_post_id": 1, "order": "ASC"},
+    {"blog_post_id": 1, "order": None},
+    *({"blog_post_id": 1, "level": level} for level in LEVELS),
+    {"blog_post_id": 1, "weight": 0.5},
+    {"blog_post_id": 1, "weight": 2},
+    {"blog_post_id": 1, "weight": 0.4},
+    {"blog_post_id": 1, "weight": None},
+    {"blog_post_id": 1, "weight": True},
+    {"blog_post_id": 1, "extra": {"a": 1, "b": 2.0}},
+    {"blog_post_id": 1, "extra": {"a": "1"}},
+    {"blog_post_id": 1, "extra": []},
+]
+
+
+def assert_agrees(test: unittest.TestCase, schema: dict, arguments: list):
+    validate = compile_schema(schema)
+    reference = Draft202012Validator(schema)
+    for value in arguments:
+        with test.subTest(arguments=value):
+            errors = validate(value)
+            test.assertEqual(not errors, reference.is_valid(value), errors)
+
+
+class CompileSchemaTest(unittest.TestCase):
+    def test_agrees_with_jsonschema(self):
+        assert_agrees(self, POST_SCHEMA, ARGUMENTS)
+
+    def test_tool_schemas_agree_with_jsonschema(self):
+        for tool in registry.list_tools():
+            Draft202012Validator.check_schema(tool.inputSchema)
+            assert_agrees(self, tool.inputSchema, ARGUMENTS)
+
+    def test_messages(self):
+        validate = compile_schema(POST_SCHEMA)
+        for arguments, errors in [
+            ({}, ["arguments.blog_post_id: required"]),
+            (
+                {"blog_post_id": True},
+                ["arguments.blog_post_id: expected integer or string, got boolean"],
+            ),
+            (
+                {"blog_post_id": 2**63},
+                [
+                    f"arguments.blog_post_id: must be between 1 and {2**63 - 1}, got {2**63}"
+                ],
+            ),
+            (
+                {"blog_post_id": "1" * 19},
+                ["arguments.blog_post_id: must match ^[0-9]{1,18}$"],
+            ),
+            (
+                {"blog_post_id": 1, "other": 1},
+                ["arguments.other: unexpected"],
+            ),
+            (
+                {"blog_post_id": 1, "tags": ["", 1]},
+                [
+                    "arguments.tags[0]: length must be between 1 and 3, got 0",
+                    "arguments.tags[1]: expected string, got integer",
+                ],
+            ),
+            (
+                {"blog_post_id": 1, "order": "up"},
+                ["arguments.order: must be one of asc, desc, got up"],
+            ),
+            (
+                {"blog_post_id": 1, "extra": {"a": "1"}},
+                ["arguments.extra.a: expected integer, got string"],
+            ),
+        ]:
+            with self.subTest(arguments=arguments):
+                self.assertEqual(validate(arguments), errors)
+
+    def test_unsupported_schemas(self):
+        with self.assertRaisesRegex(ValueError, "keywords: oneOf"):
+            compile_schema({"oneOf": []})
+        with self.assertRaisesRegex(ValueError, "type: int"):
+            compile_schema({"type": "int"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import os
+import tempfile
+import unittest
+from functools import partial
+from backend.db.blobs import MmapArena
+from backend.db.columns import BlogPostTable
+from backend.db.memory import InMemoryBlogPostRepository
+from backend.db.wal import RECORD_HEADER, Journal
+
+
+class JournalRecoveryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = self.enterContext(tempfile.TemporaryDirectory())
+
+    def journal(self) -> Journal:
+        return Journal(self.directory, "test", fsync_interval=0)
+
+    def write(self, records):
+        journal = self.journal()
+        _, replayed = journal.recover()
+        list(replayed)
+        journal.open()
+        for record in records:
+            journal.append(record)
+        journal.close()
+
+    def segment(self) -> str:
+        (path,) = [p for p in os.listdir(self.directory) if p.endswith(".wal")]
+        return os.path.join(self.directory, path)
+
+    def recover(self):
+        journal = self.journal()
+        state, records = journal.recover()
+        return journal, state, list(records)
+
+    def assert_torn_tail_dropped(self, tail: bytes):
+        self.write(["a", "b", "c"])
+        size = os.path.getsize(self.segment())
+        with open(self.segment(), "ab") as f:
+            f.write(tail)
+
+        journal, state, records = self.recover()
+        self.assertIsNone(state)
+        self.assertEqual(records, ["a", "b", "c"])
+        self.assertEqual(os.path.getsize(self.segment()), size)
+
+        # Appends after recovery follow the last complete record
+        journal.open()
+        journal.append("d")
+        journal.close()
+        self.assertEqual(self.recover()[2], ["a", "b", "c", "d"])
+
+    def test_partial_header(self):
+        self.assert_torn_tail_dropped(b"\x10\x00")
+
+    def test_partial_payload(self):
+        self.assert_torn_tail_dropped(RECORD_HEADER.pack(100, 0) + b"short")
+
+    def test_checksum_mismatch(self):
+        self.assert_torn_tail_dropped(RECORD_HEADER.pack(5, 0) + b"12345")
+
+    def test_snapshot_drops_covered_segments(self):
+        journal = self.journal()
+        list(journal.recover()[1])
+        journal.open()
+        journal.append("a")
+        journal.write_snapshot(journal.rotate(), {"a": 1})
+        journal.append("b")
+        journal.close()
+
+        _, state, records = self.recover()
+        self.assertEqual(state, {"a": 1})
+        self.assertEqual(records, ["b"])
+
+
+class RepositoryRecoveryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = self.enterContext(tempfile.TemporaryDirectory())
+
+    def repository(self) -> InMemoryBlogPostRepository:
+        return InMemoryBlogPostRepository(
+            [{"id": 1, "user_id": 1, "content": "seed"}],
+            stripes=4,
+            journal=Journal(self.directory, "blog_posts", fsync_interval=0),
+            arena_factory=partial(MmapArena, os.path.join(self.directory, "content")),
+        )
+
+    def contents(self, repository: InMemoryBlogPostRepository) -> dict:
+        return {
+            user_id: [
+                (post.id, post.content, post.created_at, post.updated_at)
+                for post in repository.list_page(user_id, "updated_at")
+            ]
+            for user_id in range(1, 5)
+        }
+
+    def test_recovers_snapshot_and_log(self):
+        repository = self.repository()
+        for i in range(20):
+            post = repository.create(i % 4 + 1, f"post {i}")
+            if i % 3 == 0:
+                repository.update(post.user_id, post.id, f"updated {i}")
+            if i == 10:
+                repository.checkpoint()
+        repository._journal.close()
+        expected = self.contents(repository)
+
+        recovered = self.repository()
+        self.assertEqual(self.contents(recovered), expected)
+        # Ids continue after the recovered ones
+        self.assertEqual(recovered.create(1, "next").id, 22)
+        recovered._journal.close()
+
+    def test_recovers_after_torn_write(self):
+        repository = self.repository()
+        repository.create(2, "kept")
+        repository._journal.close()
+        expected = self.contents(repository)
+
+        (segment,) = [
+            os.path.join(self.directory, p)
+            for p in os.listdir(self.directory)
+            if p.endswith(".wal")
+        ]
+        with open(segment, "ab") as f:
+            f.write(RECORD_HEADER.pack(1000, 0) + b"torn")
+
+        recovered = self.repository()
+        self.assertEqual(self.contents(recovered), expected)
+        recovered._journal.close()
+
+
+class SnapshotTest(unittest.TestCase):
+    def test_compaction_during_snapshot(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        table = BlogPostTable(1, partial(MmapArena, directory))
+        table.insert(1, 1, "old", 0, 0)
+        table.set_content(1, "new", 1)
+
+        state = table.begin_snapshot()
+        old = table.arenas[0]
+        table.compact(0)
+        state = table.finish_snapshot(state)
+
+        self.assertEqual(state["arenas"], [(b"oldnew", 3)])
+        # The replaced arena is closed once the snapshot no longer reads it
+        with self.assertRaises(ValueError):
+            old.read_bytes(0, 1)
+        restored = BlogPostTable.restore(state, 1)
+        self.assertEqual(restored.content_of(1), "new")
+
+
+if __name__ == "__main__":
+    unittest.main()